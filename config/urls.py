@@ -48,6 +48,7 @@ urlpatterns = [
     path('api/simulation/status/', sams_views.get_simulation_status, name='api_simulation_status'),
     path('api/simulation/events/', sams_views.get_recent_events, name='api_recent_events'),
     path('api/simulation/events/detail/', sams_views.get_event_detail, name='api_event_detail'),
+    path('api/simulation/events/by-ticker/', sams_views.get_events_for_ticker, name='api_events_for_ticker'),
     path('api/simulation/news/', sams_views.get_news_feed, name='api_news_feed'),
     path('api/simulation/market-summary/', sams_views.get_market_summary, name='api_market_summary'),
 
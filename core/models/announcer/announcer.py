@@ -1,16 +1,143 @@
+import contextvars
 import json
+import os
 import re
 import random
-from typing import List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from core.models.announcer.event import Event
 from core.models.announcer.news import News, Media
-from core.models.announcer.prompt_builder import build_event_prompt
+from core.models.announcer.prompt_builder import (
+    build_event_prompt,
+    build_event_schema,
+    build_multi_outlet_news_prompt,
+)
+from core.models.announcer.synthetic_news import build_synthetic_article
+from utils.env import env_number
 from utils.id_generator import generate_id
+from utils.json_stream import JsonStreamScanner, decode_json_items
+from utils.llm_scheduler import llm_request_context
+from utils.llm_telemetry import get_llm_telemetry
 from utils.logger import get_event_log, get_recent_events_for_context, save_news_article
-from llama_client import query_llm  # Ollama/로컬 LLM HTTP 클라이언트 (이미 사용 중)
+from llama_client import join_prompt, query_llm, query_llm_stream  # Ollama/로컬 LLM HTTP 클라이언트 (이미 사용 중)
+
+# 언론사별 뉴스 동시 생성 수 기본값 (Ollama 기본 OLLAMA_NUM_PARALLEL=4에 맞춤, SAMS_NEWS_CONCURRENCY로 조정)
+DEFAULT_NEWS_CONCURRENCY = 4
+# 한 번의 LLM 호출로 기사를 받을 언론사 수 (15곳이면 2회 호출, 1이면 언론사별 개별 호출)
+DEFAULT_NEWS_BATCH_SIZE = 8
+# 일괄 응답에서 기사 1건당 예상 토큰 수 (250~400자 한국어 기사 + JSON 구조)
+BATCH_TOKENS_PER_ARTICLE = 400
+# 일괄 응답의 기사를 유효한 것으로 인정할 최소 길이 (이보다 짧으면 합성 기사로 대체)
+MIN_ARTICLE_LENGTH = 40
+# 구조화 출력 모드에서 검증에 실패한(또는 빠진) 사건만 다시 요청하는 횟수
+DEFAULT_EVENT_RETRIES = 1
+EVENT_DURATIONS = ("short", "mid", "long")
+
+
+class LatencyBudgetExceeded(TimeoutError):
+    """LLM 기사 생성이 뉴스 지연 예산 안에 끝나지 않음 (호출 측은 합성 기사로 대체)"""
+
 
 class Announcer:
+    def __init__(
+        self,
+        use_llm: bool = True,
+        news_concurrency: Optional[int] = None,
+        news_batch_size: Optional[int] = None,
+        news_latency_budget: Optional[float] = None,
+        use_streaming: Optional[bool] = None,
+        reuse_prefix: Optional[bool] = None,
+        structured_output: Optional[bool] = None,
+        on_partial: Optional[Callable[[str, str], None]] = None,
+    ):
+        """
+        use_llm=False이면 LLM을 호출하지 않고 합성 사건만 생성 (오프라인 배치/앙상블 실행용)
+        news_concurrency: 언론사별 기사 생성을 동시에 몇 개까지 돌릴지 (1이면 순차 실행).
+                          LLM 백엔드가 동시에 처리할 수 있는 요청 수에 맞춘다.
+        news_batch_size: 한 프롬프트로 기사를 함께 생성할 언론사 수 (기본값 SAMS_NEWS_BATCH_SIZE, 1이면 끔)
+        news_latency_budget: 사건 하나의 기사 생성에 쓸 최대 시간(초). 넘기면 아직 못 받은 언론사는
+                             합성 기사로 채운다 (기본값 SAMS_NEWS_LATENCY_BUDGET, 0이면 제한 없음)
+        use_streaming: 토큰 스트림으로 받아 JSON이 완성되는 즉시 생성을 끊을지 (기본값 SAMS_LLM_STREAM, 켜짐)
+        reuse_prefix: 한 사건의 언론사 프롬프트들이 공유하는 사건 맥락을 한 번만 평가하고
+                      그 context를 재사용할지 (기본값 SAMS_LLM_PREFIX_REUSE, 켜짐)
+        structured_output: 사건 생성에 JSON 스키마(Ollama format)를 넘기고 응답을 원소 단위로 검증해
+                           잘못된 사건만 다시 요청할지 (기본값 SAMS_LLM_STRUCTURED, 켜짐)
+        on_partial: 스트리밍 중 부분 텍스트를 받을 콜백 (kind, 지금까지의 텍스트).
+                    kind는 "event" 또는 언론사 이름
+        """
+        self.use_llm = use_llm
+        if news_concurrency is None:
+            news_concurrency = env_number("SAMS_NEWS_CONCURRENCY", DEFAULT_NEWS_CONCURRENCY)
+        self.news_concurrency = max(1, news_concurrency)
+        if news_batch_size is None:
+            news_batch_size = env_number("SAMS_NEWS_BATCH_SIZE", DEFAULT_NEWS_BATCH_SIZE)
+        self.news_batch_size = max(1, news_batch_size)
+        if news_latency_budget is None:
+            news_latency_budget = env_number("SAMS_NEWS_LATENCY_BUDGET", 0.0, float)
+        self.news_latency_budget = news_latency_budget if news_latency_budget > 0 else None
+        self.budget_fallbacks = 0
+        self._budget_lock = threading.Lock()  # 언론사별 fan-out 스레드에서 함께 갱신
+        if use_streaming is None:
+            use_streaming = os.environ.get("SAMS_LLM_STREAM", "1") != "0"
+        self.use_streaming = use_streaming
+        if reuse_prefix is None:
+            reuse_prefix = os.environ.get("SAMS_LLM_PREFIX_REUSE", "1") != "0"
+        self.reuse_prefix = reuse_prefix
+        if structured_output is None:
+            structured_output = os.environ.get("SAMS_LLM_STRUCTURED", "1") != "0"
+        self.structured_output = structured_output
+        self.event_retries = DEFAULT_EVENT_RETRIES
+        self.on_partial = on_partial
+
+    def _query_llm(
+        self,
+        prompt: str,
+        kind: str,
+        json_expected: bool,
+        max_tokens: int = 512,
+        prefix: Optional[str] = None,
+        format: Optional[dict] = None,
+        use_cache: bool = True,
+        accept: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """
+        LLM 호출. 스트리밍 모드에서는 최상위 JSON 값이 닫히는 즉시 연결을 끊는다.
+        json_expected=False(기사 본문)이면 응답이 JSON으로 시작한 경우에만 조기 종료하고,
+        평문 기사는 끝까지 받되 부분 텍스트만 on_partial로 흘려보낸다.
+        prefix: 여러 호출이 공유하는 프롬프트 앞부분 (실제 프롬프트는 prefix + 빈 줄 + prompt).
+                reuse_prefix가 꺼져 있으면 이어 붙인 전체 프롬프트를 보낸다.
+        format: 구조화 출력 JSON 스키마 (없으면 자유 형식)
+        use_cache, accept: 응답 캐시 우회 / 캐시에 저장할 응답 판단 (LlamaClient.generate 참고)
+        """
+        if prefix is not None and not self.reuse_prefix:
+            prompt, prefix = join_prompt(prefix, prompt), None
+        if not self.use_streaming:
+            return query_llm(
+                prompt, max_tokens=max_tokens, prefix=prefix, format=format, use_cache=use_cache, accept=accept
+            )
+
+        scanner = JsonStreamScanner(leading_only=not json_expected)
+
+        def handle(text: str, chunk: str) -> bool:
+            if self.on_partial is not None:
+                self.on_partial(kind, text)
+            return scanner.feed(chunk)
+
+        text = query_llm_stream(
+            prompt, max_tokens=max_tokens, on_partial=handle, prefix=prefix, format=format,
+            use_cache=use_cache, accept=accept,
+        )
+        # 조기 종료했다면 완성된 블록만 넘겨 뒤따르는 추출이 남은 꼬리를 보지 않게 한다
+        return scanner.block if scanner.done else text
+
+    @staticmethod
+    def _record_fallback(reason: str, prompt_type: str, sim_id: Optional[str] = None, count: int = 1):
+        """LLM 결과 대신 합성 결과를 쓴 횟수를 텔레메트리에 기록 (sim_id가 없으면 요청 컨텍스트 값)"""
+        get_llm_telemetry().record_fallback(reason, count=count, prompt_type=prompt_type, sim_id=sim_id)
+
     # -----------------------------
     # 사건 생성: LLM → JSON → Event[]
     # -----------------------------
@@ -19,7 +146,8 @@ class Announcer:
         past_events: Optional[List[Event]] = None,
         count: int = 1,
         allowed_categories: Optional[List[str]] = None,
-        market_context: Optional[dict] = None
+        market_context: Optional[dict] = None,
+        sim_id: Optional[str] = None
     ) -> List[Event]:
         """
         LLM을 사용해 사건 N개를 생성하여 Event 인스턴스 리스트로 반환합니다.
@@ -27,7 +155,11 @@ class Announcer:
         - count: 생성할 사건 개수
         - allowed_categories: 허용 카테고리 목록
         - market_context: 현재 시장 상태 정보
+        - sim_id: LLM 스케줄러의 시뮬레이션별 공정 분배에 쓰이는 ID
         """
+        if not self.use_llm:
+            return self._generate_synthetic_events(count=count, allowed_categories=allowed_categories)
+
         # 시장 컨텍스트 정보를 프롬프트에 포함
         context_info = ""
         if market_context:
@@ -52,18 +184,27 @@ class Announcer:
 지금까지 생성된 이벤트 수: {market_context.get('total_events_generated', 0)}개
 """
         
-        prompt = build_event_prompt(
-            past_events=past_events,
-            count=count,
-            allowed_categories=allowed_categories,
-            language="ko",
-            market_context=context_info  # 시장 컨텍스트 정보 전달
-        )
+        def build_prompt(n: int) -> str:
+            return build_event_prompt(
+                past_events=past_events,
+                count=n,
+                allowed_categories=allowed_categories,
+                language="ko",
+                market_context=context_info  # 시장 컨텍스트 정보 전달
+            )
+
+        if self.structured_output:
+            return self._generate_structured_events(build_prompt, count, allowed_categories, sim_id)
+
+        prompt = build_prompt(count)
         
         # LLM 호출 시도 → 실패 시 합성 이벤트 생성으로 폴백
         data = None
+        fallback_reason = "invalid_json"
         try:
-            raw = query_llm(prompt).strip()
+            # 사건 생성은 스케줄러에서 최우선 (대기열 초과로 거절되면 아래에서 합성 이벤트로 폴백)
+            with llm_request_context(priority="event", sim_id=sim_id, prompt_type="event"):
+                raw = self._query_llm(prompt, kind="event", json_expected=True).strip()
             json_str = self._extract_json_block(raw)
             try:
                 data = json.loads(json_str)
@@ -74,28 +215,105 @@ class Announcer:
                     data = None
         except Exception:
             data = None
+            fallback_reason = "error"
         
         if data is None:
+            self._record_fallback(fallback_reason, prompt_type="event", sim_id=sim_id)
             return self._generate_synthetic_events(count=count, allowed_categories=allowed_categories)
         
         if not isinstance(data, list):
             data = [data]
         
-        events: List[Event] = []
-        for obj in data[:count]:
-            item = self._coerce_event_dict(obj)
-            ev = Event(
-                id=generate_id("event"),
-                event_type=item["event_type"],
-                category=item["category"],
-                sentiment=item["sentiment"],
-                impact_level=item["impact_level"],
-                duration=item["duration"],
-                news_article=[],  # 최초엔 비어 있음
-            )
-            events.append(ev)
+        return [self._event_from_item(self._coerce_event_dict(obj)) for obj in data[:count]]
+
+    def _generate_structured_events(
+        self,
+        build_prompt: Callable[[int], str],
+        count: int,
+        allowed_categories: Optional[List[str]],
+        sim_id: Optional[str]
+    ) -> List[Event]:
+        """
+        구조화 출력 모드: 사건 배열 스키마를 format으로 넘기고, 응답을 원소 단위로 디코딩·검증한다.
+        유효한 사건은 그대로 쓰고 모자란 개수만 다시 요청하며(최대 event_retries회),
+        그래도 모자라면 나머지만 합성 사건으로 채운다.
+        검증에 실패한 응답은 캐시에 남기지 않고, 재시도는 캐시를 거치지 않는다
+        (count=1이면 재시도 프롬프트가 첫 요청과 같아 캐시된 잘못된 응답을 다시 받게 되므로).
+        """
+        items: List[dict] = []
+        fallback_reason = "invalid_items"
+
+        def valid_items(raw: str) -> List[dict]:
+            decoded, _ = decode_json_items(raw, list_key="events")
+            return [item for item in (self._validate_event_item(obj, allowed_categories) for obj in decoded) if item]
+
+        for attempt in range(self.event_retries + 1):
+            missing = count - len(items)
+            try:
+                with llm_request_context(priority="event", sim_id=sim_id, prompt_type="event"):
+                    raw = self._query_llm(
+                        build_prompt(missing),
+                        kind="event",
+                        json_expected=True,
+                        format=build_event_schema(missing, allowed_categories),
+                        use_cache=attempt == 0,
+                        accept=lambda text, n=missing: len(valid_items(text)) >= n,
+                    )
+            except Exception:
+                fallback_reason = "error"
+                break
+            valid = valid_items(raw)
+            items.extend(valid[:missing])
+            if len(items) >= count:
+                break
+
+        events = [self._event_from_item(item) for item in items]
+        if len(events) < count:
+            self._record_fallback(fallback_reason, prompt_type="event", sim_id=sim_id, count=count - len(events))
+            events += self._generate_synthetic_events(count=count - len(events), allowed_categories=allowed_categories)
         return events
 
+    @staticmethod
+    def _validate_event_item(obj, allowed_categories: Optional[List[str]]) -> Optional[dict]:
+        """스키마 검증: 필드 누락/타입 오류/범위 밖 값/허용되지 않은 카테고리면 None (보정하지 않고 재요청 대상)"""
+        if not isinstance(obj, dict):
+            return None
+        event_type = obj.get("event_type")
+        category = obj.get("category")
+        sentiment = obj.get("sentiment")
+        impact_level = obj.get("impact_level")
+        if not isinstance(event_type, str) or not event_type.strip():
+            return None
+        if not isinstance(category, str) or (allowed_categories and category not in allowed_categories):
+            return None
+        if isinstance(sentiment, bool) or not isinstance(sentiment, (int, float)) or not -1.0 <= sentiment <= 1.0:
+            return None
+        if isinstance(impact_level, float) and impact_level.is_integer():
+            impact_level = int(impact_level)
+        if isinstance(impact_level, bool) or not isinstance(impact_level, int) or not 1 <= impact_level <= 5:
+            return None
+        if obj.get("duration") not in EVENT_DURATIONS:
+            return None
+        return {
+            "event_type": event_type.strip(),
+            "category": category,
+            "sentiment": float(sentiment),
+            "impact_level": impact_level,
+            "duration": obj["duration"],
+        }
+
+    @staticmethod
+    def _event_from_item(item: dict) -> Event:
+        return Event(
+            id=generate_id("event"),
+            event_type=item["event_type"],
+            category=item["category"],
+            sentiment=item["sentiment"],
+            impact_level=item["impact_level"],
+            duration=item["duration"],
+            news_article=[],  # 최초엔 비어 있음
+        )
+
     # -----------------------------
     # 파이어스토어 기반 뉴스 생성
     # -----------------------------
@@ -127,47 +345,252 @@ class Announcer:
         # 2. 컨텍스트용 최근 이벤트들 조회
         recent_events = get_recent_events_for_context(sim_id, context_events_limit)
         
-        # 3. 각 언론사별로 뉴스 기사 생성
-        news_list: List[News] = []
-        for outlet in outlets:
+        with llm_request_context(priority="news", sim_id=sim_id):
+            return self._generate_and_save_news(sim_id, event_id, event_log, outlets, recent_events)
+
+    def _generate_and_save_news(
+        self,
+        sim_id: str,
+        event_id: str,
+        event_log: dict,
+        outlets: List[Media],
+        recent_events: List[dict]
+    ) -> List[News]:
+        """
+        언론사별 기사 생성(일괄 또는 개별) + 저장, 결과는 언론사 순서 유지.
+        지연 예산이 있으면 예산이 끝나는 시각까지 받지 못한 기사는 합성 기사로 대체한다.
+        """
+        deadline = time.monotonic() + self.news_latency_budget if self.news_latency_budget else None
+
+        # 3-a. 일괄 모드: 언론사 묶음마다 LLM 1회 호출로 기사를 받고, 빠진 언론사만 합성 기사로 채움
+        #      (지연 예산은 묶음마다 적용 — 예산 안에 끝난 묶음의 기사는 그대로 쓴다)
+        if self.news_batch_size > 1 and len(outlets) > 1:
+            articles, late = self._generate_batched_articles(event_log, outlets, recent_events, deadline)
+            missing = sum(1 for outlet in outlets if outlet.name not in articles and outlet.name not in late)
+            if late:
+                self._record_fallback("latency_budget", prompt_type="news_batch", sim_id=sim_id, count=len(late))
+            if missing:
+                self._record_fallback("batch_missing", prompt_type="news_batch", sim_id=sim_id, count=missing)
+
+            def save(outlet: Media) -> News:
+                article_text = articles.get(outlet.name)
+                method = "firestore_batch_with_fallback"
+                if outlet.name in late:
+                    method = "synthetic_latency_budget"
+                if article_text is None:
+                    article_text = self._build_synthetic_article(
+                        current_event=event_log.get("event", {}),
+                        outlet=outlet,
+                        recent_events=recent_events
+                    )
+                return self._save_outlet_news(sim_id, event_id, outlet, article_text, method)
+
+            return self._fan_out(save, outlets)
+
+        # 3-b. 각 언론사별로 뉴스 기사 생성 + 저장 (동시 실행, 결과는 언론사 순서 유지)
+        def build(outlet: Media) -> News:
+            return self._generate_and_save_outlet_news(sim_id, event_id, event_log, outlet, recent_events, deadline)
+        
+        return self._fan_out(build, outlets)
+
+    def _call_within_deadline(self, fn, deadline: Optional[float]):
+        """
+        fn()을 deadline(time.monotonic 기준)까지 기다려 결과를 반환, 넘기면 LatencyBudgetExceeded.
+        fn 안의 LLM 요청에는 같은 마감 시각이 걸리므로, 늦은 호출은 스케줄러 대기·HTTP 요청 단계에서
+        스스로 끝나 슬롯과 백엔드를 붙잡지 않는다 (데몬 스레드는 그때까지 남고 결과는 버린다).
+        """
+        if deadline is None:
+            return fn()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            self._count_budget_fallback()
+            raise LatencyBudgetExceeded("뉴스 지연 예산 소진")
+
+        box = {}
+        done = threading.Event()
+        ctx = contextvars.copy_context()
+
+        def call():
+            with llm_request_context(deadline=deadline):
+                return fn()
+
+        def run():
             try:
-                article_text = self.generate_news_from_event_log(
-                    event_log=event_log,
-                    outlet=outlet,
-                    recent_events=recent_events
-                )
-            except Exception:
-                # LLM 실패 시 합성 기사 텍스트로 폴백
-                article_text = self._build_synthetic_article(
-                    current_event=event_log.get("event", {}),
-                    outlet=outlet,
-                    recent_events=recent_events
+                box["result"] = ctx.run(call)
+            except BaseException as e:
+                box["error"] = e
+            finally:
+                done.set()
+
+        threading.Thread(target=run, name="news-budget", daemon=True).start()
+        if not done.wait(remaining):
+            self._count_budget_fallback()
+            raise LatencyBudgetExceeded(f"뉴스 지연 예산 초과 ({self.news_latency_budget:.1f}s)")
+        if "error" in box:
+            raise box["error"]
+        return box["result"]
+
+    def _count_budget_fallback(self):
+        with self._budget_lock:
+            self.budget_fallbacks += 1
+
+    def _generate_batched_articles(
+        self,
+        event_log: dict,
+        outlets: List[Media],
+        recent_events: List[dict],
+        deadline: Optional[float] = None
+    ) -> Tuple[Dict[str, str], Set[str]]:
+        """
+        언론사를 news_batch_size개씩 묶어 묶음마다 한 번의 LLM 호출로 기사를 생성.
+        묶음들은 news_concurrency 한도 안에서 동시에 실행되고, deadline은 묶음마다 따로 적용된다.
+
+        Returns:
+            ({언론사 이름: 기사 본문}, deadline 안에 끝나지 않은 묶음의 언론사 이름들)
+            — 기사는 검증을 통과한 것만 포함 (실패한 묶음/누락 언론사는 빠짐)
+        """
+        context = self._build_event_log_context(event_log, recent_events)
+        batches = [outlets[i:i + self.news_batch_size] for i in range(0, len(outlets), self.news_batch_size)]
+
+        def query(batch: List[Media]) -> str:
+            with llm_request_context(prompt_type="news_batch"):
+                return self._query_llm(
+                    build_multi_outlet_news_prompt(batch),
+                    kind="news-batch",
+                    json_expected=True,
+                    max_tokens=BATCH_TOKENS_PER_ARTICLE * len(batch) + 64,
+                    prefix=context,
                 )
-            
-            news_id = generate_id("news")
-            news = News(id=news_id, media=outlet.name, article_text=article_text)
-            news_list.append(news)
-            
-            # 4. 생성된 뉴스 기사를 파이어스토어에 저장
+
+        def run(batch: List[Media]) -> Tuple[Dict[str, str], bool]:
             try:
-                save_news_article(
-                    sim_id=sim_id,
-                    event_id=event_id,
-                    news_id=news_id,
-                    media_name=outlet.name,
-                    article_text=article_text,
-                    meta={
-                        "outlet_bias": outlet.bias,
-                        "outlet_credibility": outlet.credibility,
-                        "generation_method": "firestore_based_with_fallback"
-                    }
-                )
+                raw = self._call_within_deadline(lambda: query(batch), deadline)
+                return self._parse_batch_articles(raw, batch), False
+            except LatencyBudgetExceeded:
+                return {}, True
             except Exception as e:
-                print(f"뉴스 저장 실패: {e}")
-            
-            print(f"뉴스 기사 생성 완료: {outlet.name} - {news_id}")
+                print(f"일괄 뉴스 생성 실패 ({len(batch)}곳): {e}")
+                return {}, False
+
+        articles: Dict[str, str] = {}
+        late: Set[str] = set()
+        for batch, (result, timed_out) in zip(batches, self._fan_out(run, batches)):
+            articles.update(result)
+            if timed_out:
+                late.update(outlet.name for outlet in batch)
+        return articles, late
+
+    def _parse_batch_articles(self, raw: str, outlets: List[Media]) -> Dict[str, str]:
+        """
+        일괄 응답 → {언론사 이름: 기사}. 다음 형식을 모두 받아들인다:
+        {"articles": [{"outlet", "news_article"}]}, [{"outlet", "news_article"}], {언론사 이름: 기사}
+        응답이 중간에 잘려도 그 앞까지 완성된 기사는 살린다 (decode_json_items).
+        요청하지 않은 언론사, 문자열이 아니거나 너무 짧은 기사는 버린다.
+        """
+        items, _ = decode_json_items(raw, list_key="articles")
+
+        pairs = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            if "outlet" in item or "media" in item:
+                pairs.append((item.get("outlet") or item.get("media"), item.get("news_article")))
+            else:
+                pairs.extend(item.items())  # {언론사 이름: 기사} 형식
+
+        wanted = {outlet.name for outlet in outlets}
+        articles: Dict[str, str] = {}
+        for name, text in pairs:
+            if name not in wanted or name in articles or not isinstance(text, str):
+                continue
+            text = self._cleanup_text(text)
+            if len(text) >= MIN_ARTICLE_LENGTH:
+                articles[name] = text
+        return articles
+
+    def _generate_and_save_outlet_news(
+        self,
+        sim_id: str,
+        event_id: str,
+        event_log: dict,
+        outlet: Media,
+        recent_events: List[dict],
+        deadline: Optional[float] = None
+    ) -> News:
+        """언론사 1곳의 기사 생성(LLM, 실패하거나 deadline을 넘기면 합성 기사) 후 파이어스토어 저장"""
+        method = "firestore_based_with_fallback"
+        try:
+            article_text = self._call_within_deadline(
+                lambda: self.generate_news_from_event_log(
+                    event_log=event_log,
+                    outlet=outlet,
+                    recent_events=recent_events
+                ),
+                deadline
+            )
+        except LatencyBudgetExceeded:
+            method = "synthetic_latency_budget"
+            self._record_fallback("latency_budget", prompt_type="news", sim_id=sim_id)
+            article_text = self._build_synthetic_article(
+                current_event=event_log.get("event", {}),
+                outlet=outlet,
+                recent_events=recent_events
+            )
+        except Exception:
+            # LLM 실패 시 합성 기사 텍스트로 폴백
+            self._record_fallback("error", prompt_type="news", sim_id=sim_id)
+            article_text = self._build_synthetic_article(
+                current_event=event_log.get("event", {}),
+                outlet=outlet,
+                recent_events=recent_events
+            )
         
-        return news_list
+        return self._save_outlet_news(sim_id, event_id, outlet, article_text, method)
+
+    def _save_outlet_news(
+        self,
+        sim_id: str,
+        event_id: str,
+        outlet: Media,
+        article_text: str,
+        generation_method: str
+    ) -> News:
+        """기사 텍스트로 News 생성 후 파이어스토어 저장 (저장 실패는 로그만 남김)"""
+        news_id = generate_id("news")
+        news = News(id=news_id, media=outlet.name, article_text=article_text)
+        
+        # 4. 생성된 뉴스 기사를 파이어스토어에 저장
+        try:
+            save_news_article(
+                sim_id=sim_id,
+                event_id=event_id,
+                news_id=news_id,
+                media_name=outlet.name,
+                article_text=article_text,
+                meta={
+                    "outlet_bias": outlet.bias,
+                    "outlet_credibility": outlet.credibility,
+                    "generation_method": generation_method
+                }
+            )
+        except Exception as e:
+            print(f"뉴스 저장 실패: {e}")
+        
+        print(f"뉴스 기사 생성 완료: {outlet.name} - {news_id}")
+        return news
+
+    def _fan_out(self, fn, items: list) -> list:
+        """
+        언론사(또는 언론사 묶음)별 작업을 최대 news_concurrency개까지 동시에 실행하고 입력 순서대로 결과 반환.
+        동시 실행 수가 1이거나 대상이 1개면 순차 실행.
+        """
+        workers = min(self.news_concurrency, len(items))
+        if workers <= 1:
+            return [fn(item) for item in items]
+        # 작업 스레드에서도 호출 측의 LLM 요청 컨텍스트(우선순위/시뮬레이션 ID)를 그대로 쓰도록 복사
+        contexts = [contextvars.copy_context() for _ in items]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="news-fanout") as pool:
+            return list(pool.map(lambda ctx, item: ctx.run(fn, item), contexts, items))
 
     def generate_news_from_event_log(
         self,
@@ -186,7 +609,35 @@ class Announcer:
         Returns:
             생성된 뉴스 기사 텍스트
         """
-        # 1) 프롬프트 구성
+        # 1) 프롬프트 구성 (공통 사건 맥락은 prefix로 분리해 언론사 간에 재사용, 언론사 정보만 꼬리로)
+        context = self._build_event_log_context(event_log, recent_events)
+        lines = [
+            "이 사건에 대해, 아래 언론사의 성향과 신뢰도를 반영한 뉴스 기사를 생성하세요:",
+            "",
+            "[언론사 정보]",
+            f"- 이름: {outlet.name}",
+            f"- 성향 (bias): {outlet.bias} (-1: 보수, 0: 중립, +1: 진보)",
+            f"- 신뢰도 (credibility): {outlet.credibility} (0~1)",
+            "",
+            "[출력 형식]",
+            "뉴스 기사 본문만 출력하세요. 머리말(예: '뉴스 기사:'), 코드블록, 따옴표, 이모지 등은 넣지 마세요.",
+            "기사 길이는 250~400자 내외, 한국어로 자연스럽게 작성하세요.",
+        ]
+        prompt = "\n".join(lines)
+
+        # 2) LLM 호출 (실패 시 상위에서 폴백 처리)
+        with llm_request_context(prompt_type="news"):
+            raw = self._query_llm(prompt, kind=outlet.name, json_expected=False, prefix=context).strip()
+
+        # 3) 후처리: 모델이 JSON/라벨/코드펜스를 섞어 줄 가능성 방지
+        text = self._extract_news_text(raw)
+        text = self._cleanup_text(text)
+
+        return text
+
+    @staticmethod
+    def _build_event_log_context(event_log: dict, recent_events: List[dict]) -> str:
+        """언론사와 무관한 공통 맥락 (최근 사건 요약 + 현재 사건 정보)"""
         lines = ["다음은 지금까지 발생한 사건들의 요약입니다:\n"]
         
         if recent_events:
@@ -210,28 +661,8 @@ class Announcer:
             f"- 카테고리: {current_event.get('category', 'N/A')}",
             f"- 감성 점수: {current_event.get('sentiment', 0)}",
             f"- 영향 수준: {current_event.get('impact_level', 3)}",
-            "",
-            "이 사건에 대해, 아래 언론사의 성향과 신뢰도를 반영한 뉴스 기사를 생성하세요:",
-            "",
-            "[언론사 정보]",
-            f"- 이름: {outlet.name}",
-            f"- 성향 (bias): {outlet.bias} (-1: 보수, 0: 중립, +1: 진보)",
-            f"- 신뢰도 (credibility): {outlet.credibility} (0~1)",
-            "",
-            "[출력 형식]",
-            "뉴스 기사 본문만 출력하세요. 머리말(예: '뉴스 기사:'), 코드블록, 따옴표, 이모지 등은 넣지 마세요.",
-            "기사 길이는 250~400자 내외, 한국어로 자연스럽게 작성하세요.",
         ]
-        prompt = "\n".join(lines)
-
-        # 2) LLM 호출 (실패 시 상위에서 폴백 처리)
-        raw = query_llm(prompt).strip()
-
-        # 3) 후처리: 모델이 JSON/라벨/코드펜스를 섞어 줄 가능성 방지
-        text = self._extract_news_text(raw)
-        text = self._cleanup_text(text)
-
-        return text
+        return "\n".join(lines)
 
     def generate_news_for_multiple_events(
         self,
@@ -254,19 +685,21 @@ class Announcer:
         """
         results = {}
         
-        for event_id in event_ids:
-            try:
-                news_list = self.generate_news_for_event_from_firestore(
-                    sim_id=sim_id,
-                    event_id=event_id,
-                    outlets=outlets,
-                    context_events_limit=context_events_limit
-                )
-                results[event_id] = news_list
-                print(f"이벤트 {event_id}에 대한 뉴스 기사 {len(news_list)}개 생성 완료")
-            except Exception as e:
-                print(f"이벤트 {event_id} 뉴스 생성 실패: {e}")
-                results[event_id] = []
+        # 과거 사건 일괄 생성은 실시간 사건/뉴스보다 낮은 우선순위로 LLM 대기열에 들어간다
+        with llm_request_context(priority="backfill", sim_id=sim_id):
+            for event_id in event_ids:
+                try:
+                    news_list = self.generate_news_for_event_from_firestore(
+                        sim_id=sim_id,
+                        event_id=event_id,
+                        outlets=outlets,
+                        context_events_limit=context_events_limit
+                    )
+                    results[event_id] = news_list
+                    print(f"이벤트 {event_id}에 대한 뉴스 기사 {len(news_list)}개 생성 완료")
+                except Exception as e:
+                    print(f"이벤트 {event_id} 뉴스 생성 실패: {e}")
+                    results[event_id] = []
         
         return results
 
@@ -340,13 +773,12 @@ class Announcer:
         outlets: List[Media],
         past_events: Optional[List[Event]] = None
     ) -> List[News]:
-        news_list: List[News] = []
-        for outlet in outlets:
+        def build(outlet: Media) -> News:
             article_text = self.generate_news(event, outlet, past_events)
-            news_id = generate_id("news")
-            news = News(id=news_id, media=outlet.name, article_text=article_text)
-            news_list.append(news)
-            event.news_article.append(news_id)
+            return News(id=generate_id("news"), media=outlet.name, article_text=article_text)
+        
+        news_list: List[News] = self._fan_out(build, outlets)
+        event.news_article.extend(news.id for news in news_list)
         return news_list
 
     def generate_news(
@@ -394,7 +826,8 @@ class Announcer:
         prompt = "\n".join(lines)
 
         # 2) LLM 호출
-        raw = query_llm(prompt).strip()
+        with llm_request_context(prompt_type="news"):
+            raw = self._query_llm(prompt, kind=outlet.name, json_expected=False).strip()
 
         # 3) 후처리: 모델이 JSON/라벨/코드펜스를 섞어 줄 가능성 방지
         text = self._extract_news_text(raw)
@@ -478,16 +911,5 @@ class Announcer:
         return events
 
     def _build_synthetic_article(self, current_event: dict, outlet: Media, recent_events: List[dict]) -> str:
-        """LLM이 가용하지 않을 때 사용할 간단한 합성 기사 텍스트 생성기"""
-        title = current_event.get("event_type", "시장 동향")
-        category = current_event.get("category", "일반")
-        tone = "중립"
-        if outlet.bias > 0.3:
-            tone = "긍정"
-        elif outlet.bias < -0.3:
-            tone = "신중"
-        return (
-            f"{title} 관련 소식입니다. {category} 분야에서 주목할 만한 변화가 관측되고 있습니다. "
-            f"업계 관계자들은 이번 이슈가 단기적으로 제한적인 영향을 미치겠지만, 중장기적으로는 새로운 기회를 만들 수 있다고 평가합니다. "
-            f"기사 작성에는 {outlet.name}의 시각을 반영했으며, 전반적으로 {tone}적 관점에서 내용을 정리했습니다."
-        )
+        """LLM이 가용하지 않거나 지연 예산을 넘겼을 때 쓰는 합성 기사 (문장 묶음 조합, 사건·언론사별로 다름)"""
+        return build_synthetic_article(current_event, outlet, recent_events)
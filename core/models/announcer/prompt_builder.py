@@ -1,6 +1,7 @@
 
 from typing import List, Optional
 from core.models.announcer.event import Event
+from core.models.announcer.news import Media
 
 def build_event_prompt(
     past_events: Optional[List[Event]] = None,
@@ -73,6 +74,31 @@ def build_event_prompt(
     return prompt
 
 
+def build_event_schema(count: int = 1, allowed_categories: Optional[List[str]] = None) -> dict:
+    """
+    build_event_prompt 응답(사건 배열)의 JSON 스키마 (Ollama format 인자로 전달해 출력 형식을 강제).
+    - count: 배열 길이 (정확히 count개)
+    - allowed_categories: 있으면 category를 그 값들로 제한
+    """
+    category = {"type": "string", "enum": list(allowed_categories)} if allowed_categories else {"type": "string"}
+    return {
+        "type": "array",
+        "minItems": count,
+        "maxItems": count,
+        "items": {
+            "type": "object",
+            "properties": {
+                "event_type": {"type": "string", "minLength": 1},
+                "category": category,
+                "sentiment": {"type": "number", "minimum": -1.0, "maximum": 1.0},
+                "impact_level": {"type": "integer", "minimum": 1, "maximum": 5},
+                "duration": {"type": "string", "enum": ["short", "mid", "long"]},
+            },
+            "required": ["event_type", "category", "sentiment", "impact_level", "duration"],
+        },
+    }
+
+
 def build_news_prompt(event_data: dict, outlet_info: dict) -> str: # 뉴스 프롬프트 빌더
     """
     뉴스 생성용 프롬프트 생성 (특정 언론 성향 반영)
@@ -114,3 +140,41 @@ def build_news_prompt(event_data: dict, outlet_info: dict) -> str: # 뉴스 프
 """.strip()
     return prompt
 
+
+def build_multi_outlet_news_prompt(outlets: List[Media]) -> str:
+    """
+    여러 언론사의 기사를 한 번에 생성하는 프롬프트의 언론사/출력 형식 부분.
+    공통 사건 맥락(최근 사건 요약 + 현재 사건 정보)은 호출 측에서 prefix로 앞에 붙인다.
+
+    Parameters:
+        outlets: 기사를 생성할 언론사 목록
+
+    Returns:
+        str: {"articles": [{"outlet", "news_article"}]} JSON 응답을 요구하는 프롬프트
+    """
+    outlet_lines = "\n".join(
+        f"- 이름: {o.name} / 성향 (bias): {o.bias} / 신뢰도 (credibility): {o.credibility}"
+        for o in outlets
+    )
+    prompt = f"""
+이 사건에 대해, 아래 각 언론사의 성향과 신뢰도를 반영한 뉴스 기사를 언론사마다 하나씩 생성하세요:
+
+[언론사 목록] (성향: -1 보수, 0 중립, +1 진보 / 신뢰도: 0~1)
+{outlet_lines}
+
+[출력 형식]
+응답은 반드시 아래 JSON 형식으로만 출력하세요. (설명/코드블록/주석 금지)
+
+{{
+  "articles": [
+    {{"outlet": "언론사 이름", "news_article": "뉴스 기사 본문"}}
+  ]
+}}
+
+요구사항:
+- 위 목록의 모든 언론사에 대해 목록 순서대로 정확히 하나씩 작성하세요.
+- "outlet" 값은 목록의 이름을 그대로 쓰세요.
+- 각 기사는 250~400자 내외, 한국어로 자연스럽게 작성하세요.
+- 기사 본문에 머리말, 따옴표, 이모지, 언론사 이름을 넣지 마세요.
+""".strip()
+    return prompt
@@ -0,0 +1,226 @@
+"""
+합성 뉴스 기사 생성기 (LLM 없이 수 마이크로초)
+카테고리·감성·영향도·지속 기간·언론사 성향·신뢰도별 문장 묶음에서 한 문장씩 골라 조합한다.
+같은 (사건, 언론사)에는 항상 같은 기사가, 다른 사건/언론사에는 서로 다른 기사가 나오도록
+사건 제목·카테고리·언론사 이름으로 난수 시드를 정한다.
+"""
+
+import random
+import zlib
+from typing import List, Optional
+
+from core.models.announcer.news import Media
+from core.models.event_dedup import sentiment_bucket
+
+LEADS = {
+    "positive": [
+        "{title} 소식이 전해지면서 {category} 분야 전반에 기대감이 번지고 있다.",
+        "{title} 소식에 {category} 업종에 모처럼 훈풍이 불고 있다.",
+        "{category} 분야에서 {title} 소식이 나오며 시장의 관심이 쏠리고 있다.",
+    ],
+    "negative": [
+        "{title} 소식이 전해지면서 {category} 분야에 긴장감이 감돌고 있다.",
+        "{title} 여파로 {category} 업종 전반에 경계감이 확산되고 있다.",
+        "{category} 분야에서 {title} 소식이 나오며 투자 심리가 위축되는 모습이다.",
+    ],
+    "neutral": [
+        "{title} 소식이 전해지며 {category} 분야의 향후 흐름에 관심이 모이고 있다.",
+        "{category} 업계가 {title} 소식의 파장을 주시하고 있다.",
+        "{title} 소식과 관련해 {category} 분야 관계자들이 득실 계산에 나섰다.",
+    ],
+}
+
+CATEGORY_DETAILS = {
+    "경제": [
+        "소비와 투자 지표에 미칠 영향을 두고 해석이 분분하다.",
+        "내수 경기 흐름과 맞물려 파급 효과가 클 것이라는 관측도 나온다.",
+        "물가와 고용 지표가 향후 방향을 가를 변수로 꼽힌다.",
+    ],
+    "정책": [
+        "관계 부처는 세부 시행 방안을 조율하고 있는 것으로 알려졌다.",
+        "정책 방향이 구체화되는 시점에 따라 업종별 희비가 갈릴 전망이다.",
+        "국회 논의 과정에서 내용이 일부 수정될 가능성도 거론된다.",
+    ],
+    "기업": [
+        "해당 기업들의 실적 전망치 조정 여부에 관심이 쏠린다.",
+        "경쟁사들도 대응 전략 마련에 착수한 것으로 전해졌다.",
+        "주주 환원과 투자 계획에 변화가 생길지도 관심사다.",
+    ],
+    "기술": [
+        "상용화 일정과 수익성 확보가 관건으로 꼽힌다.",
+        "관련 부품·소재 업체로 수혜가 확산될지 주목된다.",
+        "글로벌 경쟁사와의 기술 격차가 핵심 변수로 거론된다.",
+    ],
+    "국제": [
+        "주요국의 대응과 환율 흐름이 변수로 꼽힌다.",
+        "수출 비중이 높은 기업을 중심으로 영향이 클 것으로 보인다.",
+        "공급망 재편 움직임과 맞물려 파장이 이어질 수 있다는 분석이다.",
+    ],
+    "금융": [
+        "금리와 유동성 환경 변화에 따른 금융주 움직임이 관심사다.",
+        "은행권과 증권가는 건전성 지표 점검에 나섰다.",
+        "대출 수요와 예대마진에 미칠 영향을 두고 전망이 엇갈린다.",
+    ],
+    "에너지": [
+        "국제 유가와 원자재 가격 흐름이 핵심 변수로 지목된다.",
+        "전력 수급과 요금 체계에 미칠 영향도 함께 거론된다.",
+    ],
+    "자동차": [
+        "완성차와 부품사로 이어지는 공급망 영향이 주목된다.",
+        "전기차 수요 둔화 여부와 맞물려 해석이 엇갈린다.",
+    ],
+    "화학": [
+        "원료 가격과 배터리 소재 수요 전망이 함께 거론된다.",
+        "증설 계획과 가동률 조정 여부에 관심이 모인다.",
+    ],
+    "통신": [
+        "요금 정책과 설비 투자 계획에 미칠 영향이 관심사다.",
+        "신규 서비스 경쟁 구도에도 변화가 생길지 주목된다.",
+    ],
+}
+DEFAULT_DETAILS = [
+    "관련 업종 전반으로 영향이 번질지 주목된다.",
+    "시장 참가자들은 후속 발표를 기다리며 관망하는 분위기다.",
+    "업계는 세부 내용이 확인되는 대로 대응 방안을 마련할 계획이다.",
+]
+
+SOURCES = {
+    "high": [
+        "관계 당국과 업계 설명을 종합하면 구체적인 수치는 조만간 공식 발표될 예정이다.",
+        "증권가 애널리스트들은 실적 추정치에 미칠 영향을 점검하고 있다고 밝혔다.",
+        "공식 자료에 따르면 관련 논의는 이미 실무 단계에 들어선 것으로 확인됐다.",
+    ],
+    "mid": [
+        "업계에서는 관련 논의가 진행 중인 것으로 전해졌다.",
+        "시장 일각에서는 추가 발표가 뒤따를 것이라는 관측이 나온다.",
+        "복수의 업계 관계자는 내부 검토가 이어지고 있다고 전했다.",
+    ],
+    "low": [
+        "온라인 커뮤니티를 중심으로 다양한 추측이 확산되고 있으나 아직 공식 확인된 내용은 아니다.",
+        "SNS에서는 관련 소문이 빠르게 퍼지고 있어 투자자들의 주의가 요구된다.",
+        "확인되지 않은 전망이 잇따르면서 시장의 혼선도 커지고 있다.",
+    ],
+}
+
+VIEWS = {
+    "conservative": [
+        "시장 안정과 기업 활동을 위한 제도적 뒷받침이 필요하다는 목소리가 높다.",
+        "일각에서는 과도한 규제가 회복을 늦출 수 있다고 우려한다.",
+        "재정 건전성을 해치지 않는 선에서 대응해야 한다는 지적이다.",
+    ],
+    "progressive": [
+        "그 혜택이 일부 대기업에 쏠리지 않도록 해야 한다는 지적이 나온다.",
+        "노동자와 소비자에게 미칠 영향도 함께 살펴야 한다는 목소리가 나온다.",
+        "중소기업과 취약 계층을 위한 보완책이 필요하다는 주장도 제기된다.",
+    ],
+    "neutral": [
+        "전문가들은 단기 변동성보다 중장기 흐름을 봐야 한다고 조언한다.",
+        "업계에서는 긍정적 효과와 부담 요인이 공존한다는 평가가 나온다.",
+        "시장에서는 추가 지표를 확인한 뒤 방향성이 정해질 것이라는 분석이 우세하다.",
+    ],
+}
+
+OUTLOOKS = {
+    "high": [
+        "영향이 큰 사안인 만큼 당분간 관련 종목의 변동성이 커질 수 있다.",
+        "시장 전반으로 파급될 가능성도 배제할 수 없다는 분석이다.",
+    ],
+    "mid": [
+        "관련 종목의 주가 흐름을 당분간 지켜볼 필요가 있다는 의견이다.",
+        "업종별로 영향의 크기는 다르게 나타날 것으로 보인다.",
+    ],
+    "low": [
+        "다만 시장 전체에 미치는 영향은 제한적일 것이라는 평가가 많다.",
+        "투자자들은 차분하게 추이를 지켜보는 모습이다.",
+    ],
+}
+
+DURATIONS = {
+    "short": "이번 이슈가 단기 재료에 그칠 것이라는 전망이 우세하다.",
+    "mid": "영향은 수개월에 걸쳐 점진적으로 나타날 것으로 보인다.",
+    "long": "장기적인 산업 구조 변화로 이어질 수 있다는 분석도 나온다.",
+}
+
+RECENT_LINK = "앞서 불거진 '{previous}' 이슈와 맞물려 시장의 관심이 더욱 커지고 있다."
+
+
+def _bias_key(bias: float) -> str:
+    if bias < -0.3:
+        return "conservative"
+    if bias > 0.3:
+        return "progressive"
+    return "neutral"
+
+
+def _credibility_key(credibility: float) -> str:
+    if credibility >= 0.75:
+        return "high"
+    if credibility < 0.5:
+        return "low"
+    return "mid"
+
+
+def _impact_key(impact_level: int) -> str:
+    if impact_level >= 4:
+        return "high"
+    if impact_level <= 2:
+        return "low"
+    return "mid"
+
+
+def build_synthetic_article(
+    event: dict,
+    outlet: Media,
+    recent_events: Optional[List[dict]] = None,
+    rng: Optional[random.Random] = None
+) -> str:
+    """
+    사건 정보(event_type, category, sentiment, impact_level, duration)와 언론사 성향/신뢰도로
+    5~7문장짜리 기사를 조합한다.
+
+    Args:
+        event: 사건 dict (이벤트 로그의 "event" 항목과 같은 형식)
+        outlet: 언론사
+        recent_events: 이벤트 로그 목록, 최신순 (get_recent_events_for_context와 같은 순서).
+                       현재 사건과 제목이 다른 첫 항목을 직전 사건으로 한 문장 언급
+        rng: 난수 생성기 (없으면 사건·언론사로 시드를 정해 결정적으로 생성)
+    """
+    title = str(event.get("event_type") or "시장 동향")
+    category = str(event.get("category") or "일반")
+    try:
+        sentiment = float(event.get("sentiment", 0) or 0)
+    except (TypeError, ValueError):
+        sentiment = 0.0
+    try:
+        impact_level = int(float(event.get("impact_level", 3) or 3))
+    except (TypeError, ValueError):
+        impact_level = 3
+    duration = str(event.get("duration") or "mid")
+
+    if rng is None:
+        rng = random.Random(zlib.crc32(f"{title}|{category}|{sentiment}|{outlet.name}".encode("utf-8")))
+
+    details = CATEGORY_DETAILS.get(category, DEFAULT_DETAILS)
+    sentences = [
+        rng.choice(LEADS[sentiment_bucket(sentiment)]).format(title=title, category=category),
+        rng.choice(details),
+        rng.choice(SOURCES[_credibility_key(outlet.credibility)]),
+    ]
+
+    # 이벤트 로그는 현재 사건을 먼저 저장한 뒤 조회하므로 첫 항목이 현재 사건일 수 있다
+    previous = next(
+        (
+            event_type
+            for event_type in (((log or {}).get("event") or {}).get("event_type") for log in recent_events or [])
+            if event_type and event_type != title
+        ),
+        None,
+    )
+    if previous:
+        sentences.append(RECENT_LINK.format(previous=previous))
+
+    sentences.append(rng.choice(VIEWS[_bias_key(outlet.bias)]))
+    sentences.append(rng.choice(OUTLOOKS[_impact_key(impact_level)]))
+    if duration in DURATIONS:
+        sentences.append(DURATIONS[duration])
+    return " ".join(sentences)
@@ -43,6 +43,44 @@ def get_internal_params(seed=None, scenario="default"):
     return result
 
 
+def entities_to_market_params(entity_params: dict) -> dict:
+    """
+    build_entities_from_params()의 엔티티 묶음을 SimulationEngine이 받는
+    market_params dict 형태로 변환.
+    """
+    public = entity_params["public"]
+    company = entity_params["company"]
+    government = entity_params["government"]
+    news = entity_params["news"]
+    return {
+        "public": {
+            "consumer_index": public.consumer_index,
+            "risk_appetite": public.risk_appetite,
+            "news_sensitivity": public.news_sensitivity,
+        },
+        "company": {
+            "industry": company.industry,
+            "orientation": company.orientation,
+            "size": company.size,
+            "rnd_focus": company.rnd_focus,
+            "volatility": company.volatility,
+        },
+        "government": {
+            "policy_direction": government.policy_direction,
+            "interest_rate": government.interest_rate,
+            "tax_policy": government.tax_policy,
+            "industry_support": government.industry_support,
+        },
+        "news": {
+            "bias": news.bias,
+            "credibility": news.credibility,
+            "impact_level": news.impact_level,
+            "category": news.category,
+            "sentiment": news.sentiment,
+        }
+    }
+
+
 def build_entities_from_params(params: dict) -> dict:
     """
     dict 형태의 내부 파라미터를 엔티티 인스턴스로 변환해 반환.
@@ -0,0 +1,179 @@
+"""
+몬테카를로 앙상블 실행기
+하나의 시나리오(SCENARIO_TEMPLATES 키 + get_internal_params 시드 범위)로
+독립적인 SimulationEngine 경로 K개를 프로세스 풀에서 병렬 실행하고
+가격 분포, 백분위 밴드, 종목별 최종 통계를 반환한다.
+
+각 경로는 가상 시계 + 합성 이벤트(LLM 미사용) + 영속화/뉴스 비활성 상태로 돌기 때문에
+오프라인에서 실행되며, 경로 간 공유 상태가 없어 코어 수에 거의 선형으로 확장된다.
+"""
+
+import contextlib
+import copy
+import io
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core.models.announcer.announcer import Announcer
+from core.models.config.generator import (
+    build_entities_from_params,
+    entities_to_market_params,
+    get_internal_params,
+)
+from core.models.simulation_engine import ClockMode, SimulationEngine, SimulationSpeed
+from data.parameter_templates import get_initial_data
+from utils.sim_log import drop_log_buffer
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _build_initial_data(scenario: str, seed: int, initial_stocks: Optional[Dict]) -> Dict:
+    """시드별 시장 파라미터 + 초기 종목 데이터 구성"""
+    raw_params = get_internal_params(seed=seed, scenario=scenario)
+    market_params = entities_to_market_params(build_entities_from_params(raw_params))
+    stocks = initial_stocks if initial_stocks is not None else get_initial_data()["stocks"]
+    return {"stocks": copy.deepcopy(stocks), "market_params": market_params}
+
+
+def _run_path(
+    scenario: str,
+    seed: int,
+    n_steps: int,
+    initial_stocks: Optional[Dict],
+    speed_value: int,
+    event_interval: int,
+    start_time: datetime,
+) -> Dict:
+    """
+    경로 1개 실행 (프로세스 풀 워커에서 호출되므로 모듈 최상위 함수로 둔다).
+
+    Returns:
+        {"seed": int, "tickers": [...], "prices": ndarray (n_steps+1, T), "events": int}
+    """
+    random.seed(seed)
+    np.random.seed(seed % (2 ** 32))
+
+    # 엔진 내부 디버그 출력은 경로 수만큼 반복되므로 버린다
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = SimulationEngine(_build_initial_data(scenario, seed, initial_stocks))
+        engine.sim_id = f"ensemble-{scenario}-{seed}"
+        engine.announcer = Announcer(use_llm=False)
+        engine.enable_news_generation(False)
+        engine.enable_persistence(False)
+        engine.set_speed(SimulationSpeed(speed_value))
+        engine.set_event_generation_interval(event_interval)
+        engine.set_clock_mode(ClockMode.VIRTUAL)
+        engine.start(start_time=start_time)
+
+        tickers = list(engine.stocks.tickers)
+        prices = np.empty((n_steps + 1, len(tickers)), dtype=float)
+        prices[0] = engine.stocks.price
+        for step in range(1, n_steps + 1):
+            engine.advance(1)
+            prices[step] = engine.stocks.price
+        engine.stop()
+        # 경로마다 sim_id가 달라 로그 버퍼가 쌓이므로 실행이 끝나면 버린다
+        drop_log_buffer(engine.sim_id)
+
+    return {
+        "seed": seed,
+        "tickers": tickers,
+        "prices": prices,
+        "events": len(engine.events_history),
+    }
+
+
+def summarize_paths(tickers: List[str], paths: np.ndarray) -> Dict:
+    """
+    paths (K, n_steps+1, T) → 백분위 밴드와 종목별 최종 통계
+
+    Returns:
+        {
+            "bands": {ticker: {"p5": [...], ..., "p95": [...]}},
+            "terminal": {ticker: {"mean", "std", "min", "max", "p5".."p95",
+                                  "mean_return", "prob_up"}},
+        }
+    """
+    bands_arr = np.percentile(paths, PERCENTILES, axis=0)  # (P, n_steps+1, T)
+    initial = paths[:, 0, :]
+    final = paths[:, -1, :]
+    returns = final / initial - 1.0
+    final_pct = np.percentile(final, PERCENTILES, axis=0)  # (P, T)
+
+    bands = {}
+    terminal = {}
+    for j, ticker in enumerate(tickers):
+        bands[ticker] = {f"p{p}": bands_arr[i, :, j].tolist() for i, p in enumerate(PERCENTILES)}
+        stats = {
+            "mean": float(final[:, j].mean()),
+            "std": float(final[:, j].std()),
+            "min": float(final[:, j].min()),
+            "max": float(final[:, j].max()),
+            "mean_return": float(returns[:, j].mean()),
+            "prob_up": float((returns[:, j] > 0).mean()),
+        }
+        stats.update({f"p{p}": float(final_pct[i, j]) for i, p in enumerate(PERCENTILES)})
+        terminal[ticker] = stats
+    return {"bands": bands, "terminal": terminal}
+
+
+def run_ensemble(
+    scenario: str = "default",
+    seeds: Optional[Iterable[int]] = None,
+    n_paths: int = 16,
+    n_steps: int = 48,
+    max_workers: Optional[int] = None,
+    initial_stocks: Optional[Dict] = None,
+    speed: SimulationSpeed = SimulationSpeed.NORMAL,
+    event_interval: int = 5,
+    start_time: Optional[datetime] = None,
+) -> Dict:
+    """
+    시나리오 하나에 대해 K개 경로를 병렬 실행
+
+    Args:
+        scenario: SCENARIO_TEMPLATES 키
+        seeds: 경로별 시드 (없으면 range(n_paths))
+        n_steps: 경로당 가상 시계 스텝 수 (스텝 1 = speed 시간)
+        max_workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+        initial_stocks: 초기 종목 데이터 (없으면 get_initial_data()의 종목)
+        event_interval: 이벤트 생성 간격 (초 단위, 가상 시계에서는 × speed 시간)
+
+    Returns:
+        {"scenario", "seeds", "tickers", "times", "paths" (K, n_steps+1, T),
+         "events_per_path", "bands", "terminal"}
+    """
+    seeds = list(seeds) if seeds is not None else list(range(n_paths))
+    if not seeds:
+        raise ValueError("실행할 경로(시드)가 없습니다.")
+    start_time = start_time or datetime(2024, 1, 1, 9, 0)
+    args = (n_steps, initial_stocks, speed.value, event_interval, start_time)
+
+    if max_workers == 1:
+        results = [_run_path(scenario, seed, *args) for seed in seeds]
+    else:
+        workers = min(max_workers or os.cpu_count() or 1, len(seeds))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_path, scenario, seed, *args) for seed in seeds]
+            results = [f.result() for f in futures]
+
+    tickers = results[0]["tickers"]
+    paths = np.stack([r["prices"] for r in results])
+    step = timedelta(hours=speed.value)
+    summary = summarize_paths(tickers, paths)
+
+    return {
+        "scenario": scenario,
+        "seeds": seeds,
+        "tickers": tickers,
+        "times": [start_time + step * i for i in range(n_steps + 1)],
+        "paths": paths,
+        "events_per_path": [r["events"] for r in results],
+        "bands": summary["bands"],
+        "terminal": summary["terminal"],
+    }
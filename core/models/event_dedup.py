@@ -0,0 +1,124 @@
+"""
+최근 사건 유사도 필터 (MinHash)
+작은 로컬 모델이나 합성 생성기는 같은 사건 제목을 자주 반복하는데, 사건마다 언론사 15곳의 기사를 새로 만들면
+LLM 호출이 통째로 낭비된다. 최근 N개 사건의 제목 MinHash 시그니처를 보관하고,
+카테고리·감성 구간이 같으면서 제목이 거의 같은(추정 Jaccard ≥ threshold) 사건을 찾아 준다.
+"""
+
+import random
+import threading
+import zlib
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# 근접 중복 사건 처리 방식: reuse(기사 재사용) / regenerate(사건 재요청) / off(끔)
+NEAR_DUPLICATE_MODES = ("reuse", "regenerate", "off")
+
+
+def sentiment_bucket(sentiment: Any) -> str:
+    """감성 점수 → negative / neutral / positive (±0.2 기준)"""
+    try:
+        value = float(sentiment)
+    except (TypeError, ValueError):
+        return "neutral"
+    if value > 0.2:
+        return "positive"
+    if value < -0.2:
+        return "negative"
+    return "neutral"
+
+
+def title_shingles(title: str, k: int = 2) -> set:
+    """공백/문장부호를 뺀 제목의 글자 k-그램 집합 (한국어 제목은 단어보다 글자 단위가 안정적)"""
+    text = "".join(ch for ch in str(title).lower() if ch.isalnum())
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+class MinHasher:
+    """(a·h + b) mod p 형태의 해시 num_perm개로 MinHash 시그니처 생성 (seed가 같으면 같은 시그니처)"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)]
+
+    def signature(self, shingles: Iterable[str]) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles] or [0]
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        )
+
+
+def estimate_similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """두 MinHash 시그니처의 추정 Jaccard 유사도"""
+    if not a or len(a) != len(b):
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+class NearDuplicateFilter:
+    """
+    최근 window개 사건 중 근접 중복 찾기 (스레드 안전).
+
+    Args:
+        window: 비교 대상으로 유지할 최근 사건 수
+        threshold: 이 이상의 추정 유사도면 근접 중복
+        num_perm: MinHash 해시 수 (클수록 추정이 정확하지만 느림)
+    """
+
+    def __init__(self, window: int = 50, threshold: float = 0.7, num_perm: int = 64):
+        self.threshold = threshold
+        self._hasher = MinHasher(num_perm)
+        # (event_id, (category, sentiment_bucket), signature)
+        self._recent: Deque[Tuple[str, Tuple[str, str], Tuple[int, ...]]] = deque(maxlen=max(1, window))
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.duplicates = 0
+
+    def _key_and_signature(self, event: Any):
+        key = (str(getattr(event, "category", "")), sentiment_bucket(getattr(event, "sentiment", 0)))
+        return key, self._hasher.signature(title_shingles(getattr(event, "event_type", "")))
+
+    def add(self, event: Any):
+        """적용된 사건을 창에 추가 (가장 오래된 사건은 밀려남)"""
+        key, signature = self._key_and_signature(event)
+        with self._lock:
+            self._recent.append((event.id, key, signature))
+
+    def find(self, event: Any, count: bool = True) -> Optional[Tuple[str, float]]:
+        """
+        가장 비슷한 이전 사건의 (event_id, 유사도), 임계값 미만이면 None (같은 ID는 제외).
+        count=False면 checked/duplicates 통계에 넣지 않음 (적용 전 미리 보기용 — 적용 시 다시 검사됨)
+        """
+        key, signature = self._key_and_signature(event)
+        best: Optional[Tuple[str, float]] = None
+        with self._lock:
+            if count:
+                self.checked += 1
+            for event_id, other_key, other_signature in reversed(self._recent):
+                if other_key != key or event_id == event.id:
+                    continue
+                similarity = estimate_similarity(signature, other_signature)
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (event_id, similarity)
+            if best is not None and count:
+                self.duplicates += 1
+        return best
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "window": self._recent.maxlen,
+                "tracked": len(self._recent),
+                "threshold": self.threshold,
+                "checked": self.checked,
+                "duplicates": self.duplicates,
+            }
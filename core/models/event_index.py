@@ -0,0 +1,77 @@
+"""
+종목 → 활성 이벤트 역색인
+틱마다 전체 이벤트 히스토리를 훑지 않도록, 이벤트 삽입 시 영향 종목별로 색인하고
+시뮬레이션 시간 기준으로 유효 기간이 지난 이벤트를 만료시킨다.
+"""
+
+import threading
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional
+
+
+class ActiveEventIndex:
+    """
+    ticker → 활성 SimulationEvent 목록.
+
+    - 이벤트는 시뮬레이션 시간 순으로 추가된다고 가정 (deque 앞쪽이 가장 오래된 이벤트)
+    - expire(now)는 만료된 이벤트 수에 비례하는 비용만 든다
+    """
+
+    def __init__(self, window: timedelta = timedelta(hours=1)):
+        self.window = window
+        self._by_ticker: Dict[str, Deque[Any]] = defaultdict(deque)
+        self._timeline: Deque[Any] = deque()
+        self._lock = threading.Lock()
+
+    def add(self, sim_event: Any):
+        """SimulationEvent를 영향 종목별로 색인"""
+        with self._lock:
+            self._timeline.append(sim_event)
+            for ticker in set(sim_event.affected_stocks):
+                self._by_ticker[ticker].append(sim_event)
+
+    def expire(self, now: datetime) -> int:
+        """now 기준 window 이상 지난 이벤트 제거, 제거한 이벤트 수 반환"""
+        removed = 0
+        with self._lock:
+            while self._timeline and now - self._timeline[0].timestamp >= self.window:
+                sim_event = self._timeline.popleft()
+                for ticker in set(sim_event.affected_stocks):
+                    bucket = self._by_ticker.get(ticker)
+                    if bucket and bucket[0] is sim_event:
+                        bucket.popleft()
+                    elif bucket:
+                        try:
+                            bucket.remove(sim_event)
+                        except ValueError:
+                            pass
+                    if bucket is not None and not bucket:
+                        del self._by_ticker[ticker]
+                removed += 1
+        return removed
+
+    def active(self, ticker: str, now: Optional[datetime] = None) -> List[Any]:
+        """해당 종목에 영향을 주는 활성 이벤트 목록 (now가 주어지면 먼저 만료 처리)"""
+        if now is not None:
+            self.expire(now)
+        with self._lock:
+            bucket = self._by_ticker.get(ticker)
+            return list(bucket) if bucket else []
+
+    def events(self) -> List[Any]:
+        """활성 이벤트 전체 (오래된 것부터)"""
+        with self._lock:
+            return list(self._timeline)
+
+    def active_tickers(self) -> List[str]:
+        with self._lock:
+            return list(self._by_ticker.keys())
+
+    def clear(self):
+        with self._lock:
+            self._by_ticker.clear()
+            self._timeline.clear()
+
+    def __len__(self) -> int:
+        return len(self._timeline)
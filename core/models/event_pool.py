@@ -0,0 +1,250 @@
+"""
+카테고리별 사전 생성 사건 풀
+허용 카테고리마다 준비된 사건을 N개씩 쌓아 두고, 틱 루프는 필요할 때 꺼내 쓰기만 한다.
+풀 보충은 백그라운드 스레드가 카테고리 단위로 여러 개씩(최대 batch_size) 생성해 LLM 호출 수를 줄인다.
+사건을 만들 당시의 시장 상황에서 임계값 이상 벗어난 사건도 같은 스레드가 새 사건으로 하나씩 교체하며,
+교체본이 준비될 때까지는 그대로 두어 틱이 빈 풀을 만나지 않게 하고,
+교체 수는 틱이 꺼내 간 사건 수를 넘지 않게 해 시장이 빠르게 움직여도 교체 LLM 호출이 소비 속도에 묶인다.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.models.announcer.event import Event
+
+# 시장 상황 시그니처: 수치 항목 → 값 (예: 평균 변화율, 변동성)
+Signature = Dict[str, float]
+
+
+def signature_drift(a: Signature, b: Signature) -> float:
+    """두 시그니처의 최대 절대 차이 (공통 항목 기준)"""
+    return max((abs(a[k] - b[k]) for k in a.keys() & b.keys()), default=0.0)
+
+
+class EventPool:
+    """
+    카테고리별 준비 사건 큐 + 보충 스레드.
+
+    Args:
+        generate: (category, count) → 해당 카테고리 사건 목록 (LLM 호출, 느릴 수 있음)
+        signature: 현재 시장 상황 시그니처를 반환 (보충 시점과 꺼낼 시점 비교용)
+        categories: 풀을 유지할 카테고리 목록
+        per_category: 카테고리마다 유지할 사건 수
+        batch_size: 한 번의 생성 요청으로 만들 최대 사건 수
+        drift_threshold: 시그니처가 이만큼 벗어나면 그 사건은 보충 스레드가 교체 (꺼낼 때는 덜 우선)
+        idle: LLM 백엔드가 한가한지 (주어지면 준비된 사건이 하나라도 있는 동안은 한가할 때만 보충)
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[str, int], List[Event]],
+        signature: Callable[[], Signature],
+        categories: List[str],
+        per_category: int = 3,
+        batch_size: int = 3,
+        drift_threshold: float = 0.02,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        retry_delay: float = 1.0,
+        name: str = "event-pool",
+        idle: Optional[Callable[[], bool]] = None,
+    ):
+        self._generate = generate
+        self._signature = signature
+        self.per_category = max(1, per_category)
+        self.batch_size = max(1, batch_size)
+        self.drift_threshold = drift_threshold
+        self._on_error = on_error
+        self._idle = idle
+        self.retry_delay = retry_delay
+        self._name = name
+        self._pools: Dict[str, deque] = {}
+        self._categories: List[str] = []
+        self._next_category = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.generated = 0
+        self.served = 0
+        self.discarded = 0
+        self.misses = 0
+        self.failures = 0
+        self.deferred = 0
+        self.refreshed = 0
+        self.stale_served = 0
+        self._refresh_budget = 0  # 꺼내 간 만큼 쌓이는 교체 가능 수
+        self.set_categories(categories)
+
+    # -----------------------------
+    # 카테고리 / 스레드 제어
+    # -----------------------------
+    def set_categories(self, categories: List[str]):
+        """유지할 카테고리 변경 (빠진 카테고리의 준비 사건은 버림)"""
+        with self._lock:
+            self._categories = list(dict.fromkeys(categories))
+            for category in list(self._pools):
+                if category not in self._categories:
+                    self.discarded += len(self._pools.pop(category))
+            for category in self._categories:
+                self._pools.setdefault(category, deque())
+        self._wake.set()
+
+    def start(self):
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """보충 중단 (진행 중인 생성 요청은 기다리지 않음)"""
+        self._stop_event.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            if not self.refill_once():
+                # 모두 찼으면 꺼내 가거나 시장 상황이 바뀔 때까지 대기
+                self._wake.wait(self.retry_delay)
+                self._wake.clear()
+
+    # -----------------------------
+    # 보충 / 꺼내기
+    # -----------------------------
+    def _is_stale(self, signature: Signature, current: Optional[Signature]) -> bool:
+        return current is not None and signature_drift(signature, current) > self.drift_threshold
+
+    def _next_job(self, current: Signature) -> Optional[Tuple[str, int, int]]:
+        """
+        다음 보충 작업 (category, 생성할 수, 교체할 오래된 사건 수).
+        부족한 카테고리를 먼저 채우고, 모두 차 있으면 오래된 사건이 가장 많은 카테고리를 교체한다.
+        """
+        with self._lock:
+            if not self._categories:
+                return None
+            counts = [(len(self._pools[c]), c) for c in self._categories]
+            count, category = min(counts, key=lambda item: item[0])
+            if count < self.per_category:
+                return category, min(self.batch_size, self.per_category - count), 0
+            if self._refresh_budget <= 0:
+                return None
+            stale = [
+                (sum(1 for _, signature in self._pools[c] if self._is_stale(signature, current)), c)
+                for c in self._categories
+            ]
+            budget = self._refresh_budget
+        n_stale, category = max(stale, key=lambda item: item[0])
+        if n_stale == 0:
+            return None
+        n = min(self.batch_size, n_stale, budget)
+        return category, n, n
+
+    def refill_once(self) -> bool:
+        """
+        보충 작업 하나 수행: 가장 부족한 카테고리를 (per_category - 현재 수)개까지, 최대 batch_size개 보충하거나
+        시장 상황이 바뀐 사건을 교체 (할 일이 없거나 백엔드가 바쁘면 False)
+        """
+        signature = self._signature()
+        job = self._next_job(signature)
+        if job is None:
+            return False
+        category, count, replace = job
+        # 풀이 완전히 비면 틱이 기다리므로 바로 보충, 아니면 실시간 요청이 없을 때만
+        if self._idle is not None and self.size() > 0 and not self._idle():
+            self.deferred += 1
+            return False
+        try:
+            events = self._generate(category, count)
+        except Exception as e:
+            self.failures += 1
+            if self._on_error:
+                self._on_error(e)
+            self._stop_event.wait(self.retry_delay)
+            return False
+        with self._lock:
+            pool = self._pools.get(category)
+            if pool is None:  # 생성 중에 카테고리가 빠짐
+                self.discarded += len(events)
+                return True
+            if replace:
+                # 생성하는 동안 꺼내 간 사건은 건너뛰고, 남은 오래된 사건만 새 사건 수만큼 교체
+                kept = deque()
+                removed = 0
+                for entry in pool:
+                    if removed < min(replace, len(events)) and self._is_stale(entry[1], signature):
+                        removed += 1
+                        continue
+                    kept.append(entry)
+                pool.clear()
+                pool.extend(kept)
+                self.discarded += removed
+                self.refreshed += removed
+                self._refresh_budget -= removed
+            accepted = events[:max(0, self.per_category - len(pool))]
+            for event in accepted:
+                pool.append((event, signature))
+            self.generated += len(events)
+            self.discarded += len(events) - len(accepted)  # 자리가 없으면 버림 (요청보다 많이 돌려준 경우 등)
+        return True
+
+    def pop(self, current: Optional[Signature] = None) -> Optional[Event]:
+        """
+        준비된 사건 하나를 카테고리 순환 순서로 꺼냄 (없으면 None, 절대 블로킹하지 않음).
+        current가 주어지면 그와 drift_threshold 이하인 시장 상황에서 만든 사건을 우선하고,
+        그런 사건이 없으면 오래된 사건이라도 내준다 (교체는 보충 스레드 몫 — 틱이 빈손으로 기다리지 않게).
+        """
+        chosen = None
+        with self._lock:
+            n = len(self._categories)
+            order = [(self._next_category + i) % n for i in range(n)]
+            for index in order:
+                pool = self._pools[self._categories[index]]
+                fresh = next((k for k, entry in enumerate(pool) if not self._is_stale(entry[1], current)), None)
+                if fresh is not None:
+                    chosen = (index, fresh)
+                    break
+            if chosen is None:
+                stale = next((index for index in order if self._pools[self._categories[index]]), None)
+                if stale is not None:
+                    chosen = (stale, 0)
+                    self.stale_served += 1
+            if chosen is None:
+                self.misses += 1
+                event = None
+            else:
+                index, position = chosen
+                pool = self._pools[self._categories[index]]
+                event = pool[position][0]
+                del pool[position]
+                self._next_category = (index + 1) % n
+                self.served += 1
+                self._refresh_budget = min(self._refresh_budget + 1, self.per_category * n)
+        self._wake.set()
+        return event
+
+    def size(self) -> int:
+        with self._lock:
+            return sum(len(pool) for pool in self._pools.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ready": {c: len(self._pools[c]) for c in self._categories},
+                "per_category": self.per_category,
+                "generated": self.generated,
+                "served": self.served,
+                "discarded": self.discarded,
+                "misses": self.misses,
+                "failures": self.failures,
+                "deferred": self.deferred,
+                "refreshed": self.refreshed,
+                "stale_served": self.stale_served,
+            }
@@ -0,0 +1,88 @@
+"""
+백그라운드 이벤트 생산자
+느린 LLM 호출(사건 생성)을 틱 루프 밖의 스레드에서 수행해 크기가 제한된 큐를 채워 두고,
+틱 루프는 준비된 항목을 기다리지 않고 꺼내 쓰기만 한다.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+
+class EventProducer:
+    """
+    produce()를 반복 호출해 결과를 bounded queue에 채우는 데몬 스레드.
+
+    - 큐가 가득 차면 생산을 멈추고 소비될 때까지 대기 (선생성 분량 = maxsize)
+    - produce()가 예외를 던지면 on_error로 알리고 retry_delay 후 다시 시도
+    - poll()은 절대 블로킹하지 않는다
+    """
+
+    def __init__(
+        self,
+        produce: Callable[[], Any],
+        maxsize: int = 2,
+        name: str = "event-producer",
+        on_error: Optional[Callable[[Exception], None]] = None,
+        retry_delay: float = 1.0,
+    ):
+        self._produce = produce
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+        self._name = name
+        self._on_error = on_error
+        self.retry_delay = retry_delay
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.produced = 0
+        self.failures = 0
+
+    def start(self):
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """생산 중단 (진행 중인 produce()는 끝날 때까지 기다리지 않고 데몬 스레드로 남겨 둔다)"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                item = self._produce()
+            except Exception as e:
+                self.failures += 1
+                if self._on_error:
+                    self._on_error(e)
+                self._stop_event.wait(self.retry_delay)
+                continue
+
+            while not self._stop_event.is_set():
+                try:
+                    self._queue.put(item, timeout=0.2)
+                    self.produced += 1
+                    break
+                except queue.Full:
+                    continue
+
+    def poll(self) -> Optional[Any]:
+        """준비된 항목 하나를 꺼냄 (없으면 None)"""
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def clear(self):
+        while self.poll() is not None:
+            pass
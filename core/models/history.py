@@ -0,0 +1,140 @@
+"""
+메모리 상한이 있는 히스토리
+최근 N개만 메모리에 유지하고, 밀려난 항목은 append-only JSONL 파일로 내보낸 뒤
+필요할 때 페이지 단위로 다시 읽는다.
+밀려난 항목은 spill_chunk개씩 모아 한 번에 쓰므로 틱마다 파일을 열지 않는다 (flush()로 즉시 기록).
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+
+class SpillingHistory:
+    """
+    list 처럼 쓰는 고정 크기 히스토리.
+
+    - append / 인덱싱 / 슬라이싱 / 반복은 메모리 윈도우(최근 항목)에 대해 동작
+    - len()은 지금까지 추가된 전체 항목 수 (디스크로 내보낸 항목 포함)
+    - spill_path가 없으면 밀려난 항목은 버려진다
+    - 스필 실패는 on_error(메시지)로 알린다 (기본값은 stdout)
+    """
+
+    def __init__(
+        self,
+        max_in_memory: int,
+        spill_path: Optional[Union[str, Callable[[], str]]] = None,
+        serializer: Optional[Callable[[Any], Dict]] = None,
+        spill_chunk: int = 50,
+        on_error: Optional[Callable[[str], None]] = None,
+    ):
+        if max_in_memory < 1:
+            raise ValueError("max_in_memory는 1 이상이어야 합니다.")
+        self.max_in_memory = max_in_memory
+        self.spill_chunk = max(1, spill_chunk)
+        self._spill_path = spill_path
+        self._serializer = serializer or (lambda item: item.to_dict())
+        self._on_error = on_error or (lambda message: print(f"[history] {message}"))
+        self._window: deque = deque()
+        self._spilled_count = 0
+        self._spill_buffer: List[Tuple[str, str]] = []  # (스필 경로, JSON 줄) — 아직 파일에 쓰지 않은 항목
+        self._lock = threading.RLock()
+
+    # -----------------------------
+    # list 호환 인터페이스
+    # -----------------------------
+    def append(self, item: Any):
+        with self._lock:
+            self._window.append(item)
+            if len(self._window) > self.max_in_memory:
+                self._spill(self._window.popleft())
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return self._spilled_count + len(self._window)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._window))
+
+    def __getitem__(self, key):
+        with self._lock:
+            if isinstance(key, slice):
+                return list(self._window)[key]
+            return self._window[key]
+
+    def recent(self, n: int) -> List[Any]:
+        """가장 최근 n개 (오래된 것부터)"""
+        with self._lock:
+            start = max(0, len(self._window) - n)
+            return list(islice(self._window, start, None))
+
+    @property
+    def in_memory_count(self) -> int:
+        return len(self._window)
+
+    @property
+    def spilled_count(self) -> int:
+        return self._spilled_count
+
+    # -----------------------------
+    # 디스크 스필 / 페이지 조회
+    # -----------------------------
+    def spill_path(self) -> Optional[str]:
+        if callable(self._spill_path):
+            return self._spill_path()
+        return self._spill_path
+
+    def _spill(self, item: Any):
+        """self._lock 안에서 호출: 직렬화만 하고 spill_chunk개가 모이면 한 번에 기록"""
+        self._spilled_count += 1
+        path = self.spill_path()
+        if not path:
+            return
+        try:
+            line = json.dumps(self._serializer(item), ensure_ascii=False, default=str)
+        except Exception as e:
+            self._on_error(f"디스크 스필 직렬화 실패: {e}")
+            return
+        self._spill_buffer.append((path, line))
+        if len(self._spill_buffer) >= self.spill_chunk:
+            self.flush()
+
+    def flush(self):
+        """모아 둔 스필 항목을 파일에 기록 (경로별로 파일을 한 번씩만 엶)"""
+        with self._lock:
+            buffered, self._spill_buffer = self._spill_buffer, []
+            by_path: Dict[str, List[str]] = {}
+            for path, line in buffered:
+                by_path.setdefault(path, []).append(line)
+            for path, lines in by_path.items():
+                try:
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                    with open(path, "a", encoding="utf-8") as f:
+                        f.write("\n".join(lines) + "\n")
+                except Exception as e:
+                    self._on_error(f"디스크 스필 실패 ({len(lines)}건): {e}")
+
+    def page(self, offset: int = 0, limit: int = 100) -> List[Dict]:
+        """
+        디스크로 내보낸 항목을 오래된 순으로 페이지 조회 (dict 형태로 반환).
+        offset은 가장 오래된 항목 기준 0부터 시작.
+        """
+        path = self.spill_path()
+        if not path or limit <= 0:
+            return []
+        with self._lock:
+            self.flush()
+            if not os.path.exists(path):
+                return []
+            with open(path, "r", encoding="utf-8") as f:
+                return [json.loads(line) for line in islice(f, offset, offset + limit)]
@@ -0,0 +1,128 @@
+"""
+영향 종목 결정을 위한 다중 키워드 매처 (Aho–Corasick)
+섹터/키워드 → 종목 매핑 파일을 한 번 읽어 오토마톤으로 컴파일하고,
+이벤트 텍스트를 한 번 훑는 것(O(텍스트 길이))만으로 매칭된 종목 집합을 비트셋으로 얻는다.
+"""
+
+import json
+import os
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_KEYWORD_MAP_PATH = os.path.join(PROJECT_ROOT, "data", "affected_stock_keywords.json")
+
+
+class KeywordAutomaton:
+    """
+    용어 → 종목 목록 매핑을 컴파일한 Aho–Corasick 오토마톤.
+
+    - 종목 집합은 종목 ID 비트를 켠 int 비트셋으로 표현 (합집합 = OR 한 번)
+    - 각 상태의 출력 비트셋에는 실패 링크로 이어진 접미사 용어들의 비트셋까지 미리 합쳐 둔다
+    """
+
+    def __init__(self, mapping: Dict[str, Iterable[str]]):
+        self.tickers: List[str] = []
+        self.ticker_index: Dict[str, int] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[int] = [0]
+
+        for term, tickers in mapping.items():
+            if term:
+                self._insert(term, self._to_bits(tickers))
+        self._build_failure_links()
+
+    def _to_bits(self, tickers: Iterable[str]) -> int:
+        bits = 0
+        for ticker in tickers:
+            idx = self.ticker_index.get(ticker)
+            if idx is None:
+                idx = self.ticker_index[ticker] = len(self.tickers)
+                self.tickers.append(ticker)
+            bits |= 1 << idx
+        return bits
+
+    def _insert(self, term: str, bits: int):
+        state = 0
+        for ch in term:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(0)
+            state = nxt
+        self._out[state] |= bits
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+                queue.append(nxt)
+
+    def match_bits(self, *texts: str) -> int:
+        """텍스트들에서 매칭된 모든 용어의 종목 비트셋 (텍스트끼리는 이어 붙이지 않음)"""
+        bits = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for text in texts:
+            state = 0
+            for ch in text or "":
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+                bits |= out[state]
+        return bits
+
+    def tickers_for_bits(self, bits: int) -> List[str]:
+        """비트셋 → 종목 코드 목록 (매핑 파일 등장 순)"""
+        result = []
+        while bits:
+            low = bits & -bits
+            result.append(self.tickers[low.bit_length() - 1])
+            bits ^= low
+        return result
+
+    def match(self, *texts: str) -> List[str]:
+        """텍스트들에 등장한 용어들이 가리키는 종목 목록 (중복 없음)"""
+        return self.tickers_for_bits(self.match_bits(*texts))
+
+
+def load_keyword_mapping(path: str) -> Dict[str, List[str]]:
+    """
+    매핑 파일 로드. {"sectors": {용어: [종목]}, "keywords": {용어: [종목]}} 형식이며
+    두 그룹 모두 이벤트 카테고리/유형에 대해 매칭하므로 같은 용어는 종목을 합친다.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    mapping: Dict[str, List[str]] = {}
+    for group in ("sectors", "keywords"):
+        for term, tickers in data.get(group, {}).items():
+            merged = mapping.setdefault(term, [])
+            merged.extend(t for t in tickers if t not in merged)
+    return mapping
+
+
+_AUTOMATON_CACHE: Dict[str, Tuple[int, KeywordAutomaton]] = {}
+
+
+def get_keyword_automaton(path: str = None) -> KeywordAutomaton:
+    """
+    매핑 파일을 컴파일한 오토마톤 반환 (경로별 캐시, 파일이 수정되면 다시 컴파일).
+    path 기본값은 환경 변수 SAMS_AFFECTED_KEYWORDS 또는 data/affected_stock_keywords.json
+    """
+    path = os.path.abspath(path or os.environ.get("SAMS_AFFECTED_KEYWORDS", DEFAULT_KEYWORD_MAP_PATH))
+    mtime = os.stat(path).st_mtime_ns
+    cached = _AUTOMATON_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    automaton = KeywordAutomaton(load_keyword_mapping(path))
+    _AUTOMATON_CACHE[path] = (mtime, automaton)
+    return automaton
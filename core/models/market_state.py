@@ -0,0 +1,192 @@
+"""
+열 지향(columnar) 시장 상태
+종목별 가격/기준가/변동률/거래량을 NumPy 배열로 보관하고,
+기존 dict-of-dicts 사용처를 위해 dict 호환 뷰를 제공한다.
+"""
+
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+
+# 배열로 관리하는 컬럼. price 외 컬럼은 NaN이면 '키 없음'으로 취급한다.
+COLUMNS = ("price", "base_price", "change_rate", "volume")
+
+
+class StockRow(MutableMapping):
+    """MarketState의 한 종목을 dict처럼 읽고 쓰는 뷰 (쓰기는 배열에 바로 반영)"""
+
+    __slots__ = ("_state", "_idx")
+
+    def __init__(self, state: "MarketState", idx: int):
+        self._state = state
+        self._idx = idx
+
+    def __getitem__(self, key):
+        if key in COLUMNS:
+            value = getattr(self._state, key)[self._idx]
+            if np.isnan(value):
+                raise KeyError(key)
+            return float(value)
+        return self._state._extras[self._idx][key]
+
+    def __setitem__(self, key, value):
+        if key in COLUMNS:
+            getattr(self._state, key)[self._idx] = float(value)
+        else:
+            self._state._extras[self._idx][key] = value
+
+    def __delitem__(self, key):
+        if key == "price":
+            raise KeyError("price는 삭제할 수 없습니다.")
+        if key in COLUMNS:
+            column = getattr(self._state, key)
+            if np.isnan(column[self._idx]):
+                raise KeyError(key)
+            column[self._idx] = np.nan
+        else:
+            del self._state._extras[self._idx][key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in COLUMNS:
+            if not np.isnan(getattr(self._state, key)[self._idx]):
+                yield key
+        yield from self._state._extras[self._idx]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class MarketState(Mapping):
+    """
+    종목 ID(삽입 순서 인덱스)로 정렬된 시장 상태 배열 묶음.
+
+    - price / base_price / change_rate / volume: float64 배열
+    - state["005930"]["price"] 처럼 기존 dict 접근을 그대로 지원
+    - 틱 단위 갱신은 apply_updates()로 한 번에 반영
+    """
+
+    def __init__(self, stocks: Optional[Dict[str, Dict]] = None):
+        self.tickers: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.price = np.zeros(0, dtype=float)
+        self.base_price = np.zeros(0, dtype=float)
+        self.change_rate = np.zeros(0, dtype=float)
+        self.volume = np.zeros(0, dtype=float)
+        self._extras: List[Dict] = []
+        if stocks:
+            self.extend(stocks)
+
+    # -----------------------------
+    # 구성
+    # -----------------------------
+    def extend(self, stocks: Dict[str, Dict]):
+        """종목들을 추가 (이미 있는 종목은 값만 교체)"""
+        new_rows = {t: d for t, d in stocks.items() if t not in self.index}
+        for ticker, data in stocks.items():
+            if ticker in self.index:
+                self[ticker] = data
+
+        if not new_rows:
+            return
+
+        columns = {key: [] for key in COLUMNS}
+        for ticker, data in new_rows.items():
+            self.index[ticker] = len(self.tickers)
+            self.tickers.append(ticker)
+            for key in COLUMNS:
+                columns[key].append(float(data[key]) if data.get(key) is not None else np.nan)
+            self._extras.append({k: v for k, v in data.items() if k not in COLUMNS})
+
+        for key in COLUMNS:
+            setattr(self, key, np.concatenate([getattr(self, key), np.array(columns[key], dtype=float)]))
+
+    def __setitem__(self, ticker: str, data: Dict):
+        if ticker not in self.index:
+            self.extend({ticker: data})
+            return
+        idx = self.index[ticker]
+        for key in COLUMNS:
+            getattr(self, key)[idx] = float(data[key]) if data.get(key) is not None else np.nan
+        self._extras[idx] = {k: v for k, v in data.items() if k not in COLUMNS}
+
+    # -----------------------------
+    # Mapping 인터페이스
+    # -----------------------------
+    def __getitem__(self, ticker: str) -> StockRow:
+        return StockRow(self, self.index[ticker])
+
+    def __contains__(self, ticker) -> bool:
+        return ticker in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tickers)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __repr__(self) -> str:
+        return f"MarketState({len(self)} tickers)"
+
+    # -----------------------------
+    # 벡터 연산
+    # -----------------------------
+    def indices(self, tickers: Iterable[str]) -> np.ndarray:
+        """티커 목록 → 종목 ID 배열 (없는 티커는 제외)"""
+        return np.array([self.index[t] for t in tickers if t in self.index], dtype=np.intp)
+
+    def effective_base_price(self) -> np.ndarray:
+        """base_price가 없는 종목은 현재가를 기준가로 사용"""
+        return np.where(np.isnan(self.base_price), self.price, self.base_price)
+
+    def change_from_base(self) -> np.ndarray:
+        """기준가 대비 변화율 배열"""
+        base = self.effective_base_price()
+        return (self.price - base) / base
+
+    def change_rate_or_zero(self) -> np.ndarray:
+        return np.nan_to_num(self.change_rate, nan=0.0)
+
+    def volume_or(self, default: float = 0.0) -> np.ndarray:
+        return np.where(np.isnan(self.volume), default, self.volume)
+
+    def apply_updates(
+        self,
+        idx: np.ndarray,
+        price: np.ndarray,
+        change_rate: np.ndarray,
+        volume: Optional[np.ndarray] = None,
+    ):
+        """지정 종목들의 가격/변동률/거래량을 한 번에 갱신"""
+        if len(idx) == 0:
+            return
+        self.price[idx] = price
+        self.change_rate[idx] = change_rate
+        if volume is not None:
+            self.volume[idx] = volume
+
+    # -----------------------------
+    # 직렬화
+    # -----------------------------
+    def to_dict(self) -> Dict[str, Dict]:
+        """Firestore/JSON 응답용 순수 dict 사본"""
+        result = {}
+        price = self.price.tolist()
+        base = self.base_price.tolist()
+        change = self.change_rate.tolist()
+        volume = self.volume.tolist()
+        for i, ticker in enumerate(self.tickers):
+            row = {"price": price[i]}
+            if base[i] == base[i]:  # NaN 제외
+                row["base_price"] = base[i]
+            if change[i] == change[i]:
+                row["change_rate"] = change[i]
+            if volume[i] == volume[i]:
+                row["volume"] = int(round(volume[i]))
+            row.update(self._extras[i])
+            result[ticker] = row
+        return result
@@ -6,11 +6,27 @@
 import random
 import json
 import os
+import threading
+import time
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
 
+# 이벤트 카테고리 → 직접 관련 섹터
+CATEGORY_SECTOR_MAP = {
+    '기술': ['IT/전자', '바이오', '화학'],
+    '정부': ['금융', '에너지', '건설'],
+    '경제': ['금융', 'IT/전자', '자동차'],
+    '사회': ['소비재', '통신', '물류/운송'],
+    '국제': ['IT/전자', '자동차', '화학'],
+    '금융': ['금융', 'IT/전자'],
+    '산업': ['화학', '철강/소재', '에너지'],
+    '정치': ['금융', '건설', '에너지']
+}
+DEFAULT_CATEGORY_CORRELATION = 0.3  # 매핑에 없는 카테고리: 약한 관련성
+
 class RealisticStockMovement:
     """현실적인 주가 변동을 계산하는 모델"""
     
@@ -21,6 +37,11 @@ class RealisticStockMovement:
         self.price_history = self._load_price_history()
         self.volatility_patterns = self._analyze_volatility_patterns()
         self.historical_volatility = self._load_historical_volatility()
+        self._build_correlation_matrices()
+        # 배치 계산용 종목별 상수 배열 캐시 (종목 코드 튜플 → 배열 묶음)
+        # 레지스트리로 공유된 인스턴스에 여러 엔진 스레드가 동시에 채우므로 락으로 보호
+        self._ticker_array_cache: Dict[tuple, Dict] = {}
+        self._ticker_array_lock = threading.Lock()
         
     def _load_price_history(self) -> Dict[str, List[float]]:
         """실제 주가 데이터 로드"""
@@ -483,7 +504,8 @@ class RealisticStockMovement:
         event: Dict, 
         stock_code: str,
         current_price: float,
-        market_sentiment: float = 0.0
+        market_sentiment: float = 0.0,
+        spillover_weight: float = 0.0
     ) -> Dict[str, float]:
         """
         현실적인 주가 변동을 계산 (실제 데이터 기반)
@@ -493,6 +515,7 @@ class RealisticStockMovement:
             stock_code: 주식 코드
             current_price: 현재 주가
             market_sentiment: 전체 시장 분위기 (-1.0 ~ 1.0)
+            spillover_weight: 섹터 간 파급 효과 가중치 (0이면 직접/간접 연관성만 사용)
         
         Returns:
             Dict: {'delta': 변동률, 'price': 새 가격, 'volume': 거래량 변화}
@@ -507,7 +530,12 @@ class RealisticStockMovement:
         event_impact = event.get('impact_level', 1) / 5.0  # 1-5 → 0.0-1.0
         
         # 1. 섹터 연관성 체크
-        sector_correlation = self._get_sector_correlation(event_category, stock_spec['sector'])
+        if spillover_weight:
+            sector_correlation = float(
+                self.sector_correlations([event_category], spillover_weight)[0, self.sector_index[stock_spec['sector']]]
+            )
+        else:
+            sector_correlation = self._get_sector_correlation(event_category, stock_spec['sector'])
         if sector_correlation <= 0.0:
             return {'delta': 0.0, 'price': current_price, 'volume': 1.0}
         
@@ -583,28 +611,197 @@ class RealisticStockMovement:
             'volume': volume_change
         }
     
-    def _get_sector_correlation(self, event_category: str, stock_sector: str) -> float:
-        """이벤트 카테고리와 주식 섹터 간의 연관성 반환"""
-        # 이벤트 카테고리와 섹터 매핑
-        category_sector_map = {
-            '기술': ['IT/전자', '바이오', '화학'],
-            '정부': ['금융', '에너지', '건설'],
-            '경제': ['금융', 'IT/전자', '자동차'],
-            '사회': ['소비재', '통신', '물류/운송'],
-            '국제': ['IT/전자', '자동차', '화학'],
-            '금융': ['금융', 'IT/전자'],
-            '산업': ['화학', '철강/소재', '에너지'],
-            '정치': ['금융', '건설', '에너지']
+    def calculate_realistic_change_batch(
+        self,
+        events: List[Dict],
+        stock_codes: List[str],
+        current_prices,
+        rng=None,
+        spillover_weight: float = 0.0
+    ) -> Dict[str, np.ndarray]:
+        """
+        calculate_realistic_change의 배치 버전 (이벤트 × 경로 × 종목을 한 번에 계산)
+        각 (이벤트, 경로, 종목) 조합은 스칼라 함수를 같은 current_price로 호출한 것과 동일한 분포를 따른다.
+        
+        Args:
+            events: 이벤트 정보 리스트 (E개)
+            stock_codes: 주식 코드 리스트 (T개)
+            current_prices: 현재 주가, shape (P, T) 또는 (T,) (P=1로 취급)
+            rng: 난수 생성기 (np.random.Generator / RandomState, 기본값은 np.random 전역 상태)
+            spillover_weight: 섹터 간 파급 효과 가중치 (sector_correlations 참고)
+        
+        Returns:
+            Dict: {'delta', 'price', 'volume'} 각각 shape (E, P, T)
+                  (섹터 연관성이 없거나 모르는 종목은 delta 0, price 그대로, volume 1.0)
+        """
+        rng = rng if rng is not None else np.random
+        prices = np.asarray(current_prices, dtype=float)
+        if prices.ndim == 1:
+            prices = prices[None, :]
+        n_events, n_paths, n_tickers = len(events), prices.shape[0], len(stock_codes)
+        shape = (n_events, n_paths, n_tickers)
+        if n_events == 0 or n_tickers == 0:
+            empty = np.zeros(shape)
+            return {'delta': empty, 'price': empty.copy(), 'volume': empty.copy()}
+        
+        arrays = self._ticker_arrays(stock_codes)
+        impact = np.array([e.get('impact_level', 1) / 5.0 for e in events], dtype=float)
+        sentiment = np.array([e.get('sentiment', 0.0) for e in events], dtype=float)
+        sector_rows = self.sector_correlations([e.get('category', '') for e in events], spillover_weight)
+        correlation = sector_rows[:, arrays['sector_index']] * arrays['known']  # (E, T)
+        active = arrays['known'][None, :] & (correlation > 0.0)  # (E, T)
+        
+        # 1~8. 결정적 영향도 (스칼라 함수와 같은 순서로 곱함)
+        base_impact = impact[:, None] * correlation * arrays['news_sensitivity']
+        weighted_impact = base_impact * arrays['sector_factor']
+        sentiment_impact = weighted_impact * (1.0 + sentiment * 0.5)[:, None]
+        market_cap_impact = sentiment_impact * arrays['volatility'] * arrays['market_cap_multiplier']
+        market_cap_impact = market_cap_impact * arrays['pattern_factor']
+        base_delta = np.clip(market_cap_impact, -arrays['max_daily_change'], arrays['max_daily_change'])
+        
+        # 9. 노이즈 (실제 데이터가 있는 종목은 정규분포, 없으면 균등분포)
+        normal_noise = rng.normal(0.0, arrays['noise_std'], size=shape)
+        uniform_noise = rng.uniform(-0.005, 0.005, size=shape)
+        final_delta = base_delta[:, None, :] + np.where(arrays['has_pattern'], normal_noise, uniform_noise)
+        
+        # 10. 거래량 변화
+        volume_multiplier = (1.0 + np.abs(final_delta) * 3.0) * arrays['volume_pattern_factor']
+        event_volume_multiplier = (1.0 + impact * 2.0)[:, None, None]
+        random_factor = rng.uniform(0.8, 1.2, size=shape)
+        volume_change = volume_multiplier * event_volume_multiplier * arrays['sensitivity_multiplier'] * random_factor
+        
+        # 11. 새 가격 (비활성 조합은 원래 값 유지)
+        mask = active[:, None, :]
+        new_prices = np.broadcast_to(prices, shape)
+        return {
+            'delta': np.where(mask, np.round(final_delta, 4), 0.0),
+            'price': np.where(mask, np.round(new_prices * (1.0 + final_delta), 2), new_prices),
+            'volume': np.where(mask, np.round(volume_change, 2), 1.0),
         }
+    
+    def _ticker_arrays(self, stock_codes: List[str]) -> Dict:
+        """종목별 상수(민감도/변동성/최대 변동폭 등)를 배열로 미리 계산 (종목 목록별 캐시, 스레드 안전)"""
+        key = tuple(stock_codes)
+        cached = self._ticker_array_cache.get(key)
+        if cached is not None:
+            return cached
+        with self._ticker_array_lock:
+            cached = self._ticker_array_cache.get(key)
+            if cached is None:
+                cached = self._ticker_array_cache[key] = self._build_ticker_arrays(stock_codes)
+            return cached
+    
+    def _build_ticker_arrays(self, stock_codes: List[str]) -> Dict:
+        """_ticker_arrays의 실제 계산 (결과 배열은 스레드 간 공유되므로 읽기 전용으로 고정)"""
+        n = len(stock_codes)
+        arrays = {
+            'known': np.zeros(n, dtype=bool),
+            'has_pattern': np.zeros(n, dtype=bool),
+            'sector_index': np.zeros(n, dtype=np.intp),
+            'news_sensitivity': np.zeros(n),
+            'sector_factor': np.zeros(n),
+            'volatility': np.zeros(n),
+            'market_cap_multiplier': np.ones(n),
+            'pattern_factor': np.ones(n),
+            'max_daily_change': np.zeros(n),
+            'noise_std': np.zeros(n),
+            'volume_pattern_factor': np.ones(n),
+            'sensitivity_multiplier': np.ones(n),
+        }
+        for j, code in enumerate(stock_codes):
+            spec = self.stock_characteristics.get(code)
+            if spec is None:
+                continue
+            arrays['known'][j] = True
+            arrays['sector_index'][j] = self.sector_index[spec['sector']]
+            arrays['news_sensitivity'][j] = spec['news_sensitivity']
+            arrays['sector_factor'][j] = 0.5 + 0.5 * spec['sector_weight']
+            arrays['volatility'][j] = spec['volatility']
+            arrays['market_cap_multiplier'][j] = self._get_market_cap_multiplier(spec['market_cap'])
+            arrays['sensitivity_multiplier'][j] = 1.0 + spec['news_sensitivity'] * 0.5
+            
+            pattern = self.volatility_patterns.get(code)
+            if pattern is not None:
+                arrays['has_pattern'][j] = True
+                arrays['max_daily_change'][j] = min(0.15, max(pattern['max_change'] * 1.5, pattern['std_change'] * 4))
+                if pattern['correlation'] > 0.1:
+                    arrays['pattern_factor'][j] = 1.0 + pattern['correlation'] * 0.3
+                elif pattern['correlation'] < -0.1:
+                    arrays['pattern_factor'][j] = 1.0 + pattern['correlation'] * 0.2
+                arrays['noise_std'][j] = pattern['std_change'] * 0.3
+                volume_factor = 1.0
+                if pattern['extreme_ratio'] > 0.1:
+                    volume_factor *= 1.2
+                if pattern['max_consecutive_up'] > 3 or pattern['max_consecutive_down'] > 3:
+                    volume_factor *= 1.1
+                arrays['volume_pattern_factor'][j] = volume_factor
+            else:
+                arrays['max_daily_change'][j] = min(0.15, self.historical_volatility.get(code, 0.02) * 5)
         
-        if event_category in category_sector_map:
-            if stock_sector in category_sector_map[event_category]:
+        for value in arrays.values():
+            value.flags.writeable = False
+        return arrays
+    
+    def _build_correlation_matrices(self):
+        """
+        카테고리×섹터 연관성 행렬과 섹터×섹터 관계 행렬을 미리 계산.
+        - category_sector_matrix: (카테고리 수 + 1, 섹터 수), 마지막 행은 매핑에 없는 카테고리용 기본값
+        - sector_relationship_matrix: (섹터 수, 섹터 수), 관계 정의가 없는 섹터는 자기 자신과만 1.0
+        """
+        sectors = list(self.sector_relationships)
+        for related in CATEGORY_SECTOR_MAP.values():
+            sectors.extend(related)
+        sectors.extend(spec['sector'] for spec in self.stock_characteristics.values())
+        self.sectors: List[str] = list(dict.fromkeys(sectors))
+        self.sector_index: Dict[str, int] = {sector: i for i, sector in enumerate(self.sectors)}
+        
+        self.categories: List[str] = list(CATEGORY_SECTOR_MAP)
+        self.category_index: Dict[str, int] = {category: i for i, category in enumerate(self.categories)}
+        
+        matrix = np.full((len(self.categories) + 1, len(self.sectors)), DEFAULT_CATEGORY_CORRELATION)
+        for i, category in enumerate(self.categories):
+            for j, sector in enumerate(self.sectors):
+                matrix[i, j] = self._rule_sector_correlation(category, sector)
+        self.category_sector_matrix = matrix
+        
+        relationships = np.eye(len(self.sectors))
+        for source, targets in self.sector_relationships.items():
+            for target, value in targets.items():
+                relationships[self.sector_index[source], self.sector_index[target]] = value
+        self.sector_relationship_matrix = relationships
+        # 파급(spillover)에는 자기 자신과의 관계를 제외한 부분만 사용
+        self._spillover_matrix = relationships - np.diag(np.diag(relationships))
+    
+    def sector_correlations(self, categories: List[str], spillover_weight: float = 0.0) -> np.ndarray:
+        """
+        이벤트 카테고리별 섹터 연관성 행렬 (E, 섹터 수).
+        spillover_weight > 0이면 직접 연관성이 섹터 관계 행렬을 따라 다른 섹터로 번지는 효과를
+        행렬곱 한 번으로 더한다 (결과는 0~1로 제한).
+        """
+        default_row = len(self.categories)
+        rows = self.category_sector_matrix[[self.category_index.get(c, default_row) for c in categories]]
+        if spillover_weight:
+            rows = np.clip(rows + spillover_weight * (rows @ self._spillover_matrix), 0.0, 1.0)
+        return rows
+    
+    def _get_sector_correlation(self, event_category: str, stock_sector: str) -> float:
+        """이벤트 카테고리와 주식 섹터 간의 연관성 반환 (미리 계산된 행렬 조회)"""
+        j = self.sector_index.get(stock_sector)
+        if j is None:
+            return self._rule_sector_correlation(event_category, stock_sector)
+        i = self.category_index.get(event_category, len(self.categories))
+        return float(self.category_sector_matrix[i, j])
+    
+    def _rule_sector_correlation(self, event_category: str, stock_sector: str) -> float:
+        """규칙 기반 카테고리-섹터 연관성 (행렬 생성용)"""
+        if event_category in CATEGORY_SECTOR_MAP:
+            if stock_sector in CATEGORY_SECTOR_MAP[event_category]:
                 return 1.0  # 직접 관련
             else:
                 # 간접 관련성 계산
                 return self._calculate_indirect_correlation(event_category, stock_sector)
         
-        return 0.3  # 기본값: 약한 관련성
+        return DEFAULT_CATEGORY_CORRELATION
     
     def _calculate_indirect_correlation(self, event_category: str, stock_sector: str) -> float:
         """간접적인 섹터 연관성 계산"""
@@ -731,4 +928,81 @@ class RealisticStockMovement:
             'sector_volatility': sector_avg,
             'overall_avg_volatility': np.mean([p['std_change'] for p in self.volatility_patterns.values()]),
             'data_quality': '실제 데이터 기반' if self.volatility_patterns else '기본값 사용'
-        } 
\ No newline at end of file
+        } 
+
+
+# -----------------------------
+# 프로세스 단위 모델 레지스트리
+# -----------------------------
+# 모델 생성은 data_dir의 jsonl 전체를 파싱하므로 비용이 크다.
+# data_dir별로 한 번만 생성해 모든 엔진이 같은 인스턴스를 공유하고,
+# 파일 목록/mtime/size 지문이 바뀌었을 때만 다시 생성한다.
+_MODEL_REGISTRY: Dict[str, Tuple[tuple, "RealisticStockMovement"]] = {}
+_FINGERPRINT_CHECKED_AT: Dict[str, float] = {}
+_REGISTRY_LOCK = threading.Lock()
+FINGERPRINT_CHECK_INTERVAL = 5.0  # 지문 재확인 최소 간격 (초)
+
+
+def _data_fingerprint(data_dir: str) -> tuple:
+    """data_dir 내 jsonl 파일들의 (이름, mtime, size) 지문"""
+    entries = []
+    try:
+        for filename in sorted(os.listdir(data_dir)):
+            if not filename.endswith('.jsonl'):
+                continue
+            st = os.stat(os.path.join(data_dir, filename))
+            entries.append((filename, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return tuple(entries)
+
+
+def _freeze(model: "RealisticStockMovement") -> "RealisticStockMovement":
+    """공유 인스턴스의 최상위 테이블을 읽기 전용 뷰로 교체"""
+    for attr in (
+        'stock_characteristics', 'sector_relationships', 'price_history',
+        'volatility_patterns', 'historical_volatility',
+    ):
+        value = getattr(model, attr, None)
+        if isinstance(value, dict):
+            setattr(model, attr, MappingProxyType(value))
+    for attr in ('category_sector_matrix', 'sector_relationship_matrix', '_spillover_matrix'):
+        value = getattr(model, attr, None)
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+    return model
+
+
+def get_realistic_model(data_dir: str = "data/kr", force_reload: bool = False) -> RealisticStockMovement:
+    """
+    공유 RealisticStockMovement 인스턴스를 반환 (최초 호출 시 지연 생성).
+    데이터 파일 지문이 바뀌었을 때만 새로 생성하며, 반환된 인스턴스는 읽기 전용으로 취급한다.
+    """
+    key = os.path.abspath(data_dir)
+    now = time.monotonic()
+
+    cached = _MODEL_REGISTRY.get(key)
+    if (
+        cached is not None
+        and not force_reload
+        and now - _FINGERPRINT_CHECKED_AT.get(key, 0.0) < FINGERPRINT_CHECK_INTERVAL
+    ):
+        return cached[1]
+
+    with _REGISTRY_LOCK:
+        fingerprint = _data_fingerprint(data_dir)
+        _FINGERPRINT_CHECKED_AT[key] = now
+        cached = _MODEL_REGISTRY.get(key)
+        if cached is not None and not force_reload and cached[0] == fingerprint:
+            return cached[1]
+
+        model = _freeze(RealisticStockMovement(data_dir=data_dir))
+        _MODEL_REGISTRY[key] = (fingerprint, model)
+        return model
+
+
+def clear_model_registry():
+    """레지스트리 초기화 (테스트/데이터 재생성 용도)"""
+    with _REGISTRY_LOCK:
+        _MODEL_REGISTRY.clear()
+        _FINGERPRINT_CHECKED_AT.clear()
@@ -1,5 +1,8 @@
+import os
 import time
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -10,7 +13,19 @@ from core.models.coach.coach import Coach
 from core.models.main_model import main_model
 from core.models.announcer.event import Event
 from core.models.announcer.news import News, Media
-from utils.logger import save_market_snapshot, save_event_log
+from core.models.market_state import MarketState
+from core.models.event_index import ActiveEventIndex
+from core.models.event_pool import EventPool
+from core.models.event_dedup import NEAR_DUPLICATE_MODES, NearDuplicateFilter
+from core.models.event_producer import EventProducer
+from core.models.keyword_matcher import KeywordAutomaton, get_keyword_automaton
+from core.models.history import SpillingHistory
+from utils.id_generator import generate_id
+from utils.sim_log import get_log_buffer
+from utils.llm_scheduler import get_llm_scheduler, llm_request_context
+from llama_client import get_client as get_llm_client
+import numpy as np
+from utils.logger import save_market_snapshot, save_event_log, save_news_article
 
 class SimulationSpeed(Enum):
     """시뮬레이션 속도 설정"""
@@ -27,6 +42,12 @@ class SimulationState(Enum):
     PAUSED = "paused"
 
 
+class ClockMode(Enum):
+    """시뮬레이션 시계 모드"""
+    REALTIME = "realtime"  # update()가 벽시계(time.time) 기준으로 진행
+    VIRTUAL = "virtual"    # advance(n_steps)로 호출자가 고정 스텝만큼 진행
+
+
 @dataclass
 class StockPrice:
     """주가 정보"""
@@ -57,6 +78,20 @@ class SimulationEvent:
 class SimulationEngine:
     """SAMS 시뮬레이션 엔진"""
     
+    # 이벤트가 주가에 영향을 주는 기간 (시뮬레이션 시간, 초)
+    EVENT_ACTIVE_SECONDS = 3600
+    # 메모리에 유지할 최근 이벤트/뉴스 수 (초과분은 history_dir 아래 JSONL로 스필)
+    EVENTS_IN_MEMORY = 200
+    NEWS_IN_MEMORY = 300
+    # 백그라운드 생산자가 미리 만들어 둘 이벤트 묶음 수
+    EVENT_QUEUE_SIZE = 2
+    # 이벤트 풀: 풀 사건을 만든 시점 대비 시장 평균 로그 수익률/종목 간 편차가 이만큼 바뀌면 교체
+    EVENT_POOL_DRIFT = 0.02
+    # 근접 중복 사건: 최근 사건 몇 개와 비교할지, 추정 제목 유사도 임계값
+    NEAR_DUPLICATE_WINDOW = 50
+    NEAR_DUPLICATE_THRESHOLD = 0.7
+    NEAR_DUPLICATE_MODES = NEAR_DUPLICATE_MODES
+    
     def __init__(self, initial_data: Dict):
         """
         시뮬레이션 엔진 초기화
@@ -77,15 +112,15 @@ class SimulationEngine:
         """
         self.state = SimulationState.STOPPED
         self.speed = SimulationSpeed.NORMAL
+        self.clock_mode = ClockMode.REALTIME
         
-        # 초기 데이터 설정
-        self.stocks = initial_data.get("stocks", {})
+        # 초기 데이터 설정 (종목 상태는 배열 기반 MarketState, dict처럼 접근 가능)
+        self.stocks = MarketState(initial_data.get("stocks", {}))
         self.market_params = initial_data.get("market_params", {})
         
         # 디버깅을 위한 로그 출력
-        print(f"=== SimulationEngine 초기화 ===")
-        print(f"주식 종목 수: {len(self.stocks)}")
-        print(f"시장 파라미터: {json.dumps(self.market_params, indent=2, ensure_ascii=False)}")
+        self._log("INFO", f"SimulationEngine 초기화: 주식 종목 수 {len(self.stocks)}")
+        self._log("DEBUG", f"시장 파라미터: {json.dumps(self.market_params, ensure_ascii=False)}")
         
         # 시뮬레이션 시간 관리
         self.simulation_time = datetime.now()
@@ -96,21 +131,63 @@ class SimulationEngine:
         self.announcer = Announcer()
         self.coach = Coach(self.market_params)
         
-        # 이벤트 및 뉴스 히스토리
-        self.events_history: List[SimulationEvent] = []
-        self.news_history: List[News] = []
+        # 이벤트 및 뉴스 히스토리 (최근 항목만 메모리에 유지, 나머지는 디스크로 스필)
+        self.history_dir = os.environ.get("SAMS_HISTORY_DIR", os.path.join("data", "history"))
+        self._run_id = generate_id("run")
+        self.events_history: SpillingHistory = SpillingHistory(
+            self.EVENTS_IN_MEMORY, spill_path=lambda: self._history_path("events"),
+            on_error=lambda message: self._log("ERROR", f"이벤트 히스토리 {message}"),
+        )
+        self.news_history: SpillingHistory = SpillingHistory(
+            self.NEWS_IN_MEMORY, spill_path=lambda: self._history_path("news"),
+            on_error=lambda message: self._log("ERROR", f"뉴스 히스토리 {message}"),
+        )
+        # 섹터/키워드 → 영향 종목 매칭 오토마톤 (매핑 파일에서 한 번 컴파일, 프로세스 공유)
+        try:
+            self.keyword_automaton = get_keyword_automaton()
+        except (OSError, ValueError) as e:
+            self._log("WARNING", f"영향 종목 매핑 로드 실패, 전체 시장 영향으로 처리: {e}")
+            self.keyword_automaton = KeywordAutomaton({})
+        # 종목 → 활성 이벤트 역색인 (시뮬레이션 시간 1시간 내 이벤트만 유지)
+        self.event_index = ActiveEventIndex(window=timedelta(seconds=self.EVENT_ACTIVE_SECONDS))
         
         # 시뮬레이션 설정
         self.event_generation_interval = 10  # 10초마다 이벤트 생성 (테스트용)
         self.last_event_generation = 0
+        # 가상 시계 모드: 스텝 크기(None이면 1초 분량 = speed 시간)와 다음 이벤트 예정 시각(시뮬레이션 시간)
+        self.virtual_step: Optional[timedelta] = None
+        self._next_event_sim_time: Optional[datetime] = None
         
         # 언론사 설정
         self.media_outlets = self._setup_media_outlets()
         
         # 뉴스 생성 설정
         self._news_generation_enabled = True  # 뉴스 기사 생성 활성화 여부
+        # 파이어스토어 저장(이벤트 로그/스냅샷) 활성화 여부
+        self._persistence_enabled = True
+        # 실시간 모드 비동기 이벤트 생성: 생산자 스레드가 준비한 이벤트만 틱에서 적용
+        self._async_events_enabled = True
+        self._event_producer: Optional[EventProducer] = None
+        # 카테고리별 사전 생성 풀 (enable_event_pool로 켜면 생산자 대신 사용, 0이면 끔)
+        self.event_pool_size = 0
+        self.event_pool_batch = 3
+        self._event_pool: Optional[EventPool] = None
+        self._signature_reference: Optional[np.ndarray] = None  # 풀 시작 시점 가격 (시그니처 기준)
+        self._background_executor: Optional[ThreadPoolExecutor] = None
+        self._event_due_pending = False
+        # 근접 중복 사건 처리: reuse(이전 사건 기사 재사용) / regenerate(사건 재생성 후 남은 중복은 재사용) / off
+        self.near_duplicate_mode = "reuse"
+        self.near_duplicates = NearDuplicateFilter(
+            window=self.NEAR_DUPLICATE_WINDOW, threshold=self.NEAR_DUPLICATE_THRESHOLD
+        )
+        # 재사용 대상 기사 (event_id → 기사 목록, 비교 창 크기만큼만 유지)
+        self._event_news: "OrderedDict[str, List[News]]" = OrderedDict()
+        self.events_regenerated = 0
+        self.news_reused = 0
         # 관리자 제어용: 주가 변동폭 스케일 (다음 틱부터 반영)
         self.price_volatility_scale: float = 1.0
+        # 관리자 제어용: 섹터 간 파급 효과 가중치 (0이면 파급 없음)
+        self.sector_spillover_weight: float = 0.0
         
         # 콜백 함수들
         self.on_price_change = None
@@ -137,36 +214,56 @@ class SimulationEngine:
             Media(name="YTN", bias=0.0, credibility=0.7),            # 중립 (방송)
         ]
     
-    def start(self):
-        """시뮬레이션 시작"""
+    def start(self, start_time: Optional[datetime] = None):
+        """시뮬레이션 시작 (start_time: 시뮬레이션 시작 시각, 기본값은 현재 시각)"""
         if self.state == SimulationState.STOPPED:
             self.state = SimulationState.RUNNING
-            self.simulation_start_time = datetime.now()
+            self.simulation_start_time = start_time or datetime.now()
             self.simulation_time = self.simulation_start_time
-            print(f"시뮬레이션 시작: {self.simulation_time}")
+            self._next_event_sim_time = None
+            self._log("INFO", f"시뮬레이션 시작: {self.simulation_time}")
+            # 실시간 모드에서는 첫 사건 생성 전에 LLM 모델을 미리 로드 (백그라운드)
+            if self.clock_mode == ClockMode.REALTIME and getattr(self.announcer, "use_llm", True):
+                get_llm_client().warmup_async()
         elif self.state == SimulationState.PAUSED:
             self.state = SimulationState.RUNNING
-            print("시뮬레이션 재개")
+            self._log("INFO", "시뮬레이션 재개")
     
     def pause(self):
         """시뮬레이션 일시정지"""
         if self.state == SimulationState.RUNNING:
             self.state = SimulationState.PAUSED
-            print("시뮬레이션 일시정지")
+            self._log("INFO", "시뮬레이션 일시정지")
     
     def stop(self):
         """시뮬레이션 정지"""
         self.state = SimulationState.STOPPED
-        print("시뮬레이션 정지")
+        self._stop_background_workers()
+        self.events_history.flush()
+        self.news_history.flush()
+        self._log("INFO", "시뮬레이션 정지")
     
     def set_speed(self, speed: SimulationSpeed):
         """시뮬레이션 속도 설정"""
         self.speed = speed
-        print(f"시뮬레이션 속도 변경: {speed.name}")
+        self._log("INFO", f"시뮬레이션 속도 변경: {speed.name}")
+    
+    def set_clock_mode(self, mode: ClockMode, step: Optional[timedelta] = None):
+        """
+        시계 모드 설정
+        - REALTIME: update()가 벽시계 기준으로 1초마다 진행 (기본값)
+        - VIRTUAL: advance(n_steps)로만 진행, 이벤트 생성도 시뮬레이션 시간 기준으로 예약
+        """
+        self.clock_mode = mode
+        self.virtual_step = step
+        if mode != ClockMode.REALTIME:
+            self._stop_background_workers()
+        self._next_event_sim_time = None
+        self._log("INFO", f"시계 모드 변경: {mode.value}")
     
     def update(self):
         """시뮬레이션 업데이트 (메인 루프에서 호출)"""
-        if self.state != SimulationState.RUNNING:
+        if self.state != SimulationState.RUNNING or self.clock_mode != ClockMode.REALTIME:
             return
         
         current_time = time.time()
@@ -175,45 +272,175 @@ class SimulationEngine:
         if time_diff < 1.0:  # 1초마다 업데이트
             return
         
+        self._ensure_background_workers()
+        
         # 시뮬레이션 시간 진행
         hours_to_advance = time_diff * self.speed.value
         self.simulation_time += timedelta(hours=hours_to_advance)
         
         # 이벤트 생성 체크
-        if current_time - self.last_event_generation >= self.event_generation_interval:
-            self._generate_events()
+        event_due = current_time - self.last_event_generation >= self.event_generation_interval
+        self._tick(event_due)
+        if event_due:
             self.last_event_generation = current_time
         
+        self.last_update = current_time
+    
+    def advance(self, n_steps: int = 1, step: Optional[timedelta] = None) -> int:
+        """
+        가상 시계 모드에서 시뮬레이션을 n_steps 만큼 즉시 진행 (벽시계 대기 없음).
+        스텝 크기 기본값은 실시간 모드의 1초 분량(speed 시간)이며,
+        이벤트는 event_generation_interval 초에 해당하는 시뮬레이션 시간마다 생성된다.
+        
+        Returns:
+            실제로 진행한 스텝 수 (중간에 정지되면 그 시점까지)
+        """
+        if self.clock_mode != ClockMode.VIRTUAL:
+            raise RuntimeError("advance()는 VIRTUAL 시계 모드에서만 사용할 수 있습니다.")
+        
+        step = step or self.virtual_step or timedelta(hours=self.speed.value)
+        event_interval = timedelta(hours=self.event_generation_interval * self.speed.value)
+        
+        done = 0
+        for _ in range(n_steps):
+            if self.state != SimulationState.RUNNING:
+                break
+            self.simulation_time += step
+            
+            event_due = self._next_event_sim_time is None or self.simulation_time >= self._next_event_sim_time
+            if event_due:
+                self._next_event_sim_time = self.simulation_time + event_interval
+            self._tick(event_due)
+            done += 1
+        return done
+    
+    def _tick(self, event_due: bool):
+        """
+        한 틱 처리: (예정 시) 이벤트 생성/적용 → 주가 업데이트
+        백그라운드 생산자가 켜져 있으면 LLM 호출을 기다리지 않고, 준비된 이벤트가 있을 때만 적용한다.
+        """
+        if self._event_pool is not None or self._event_producer is not None:
+            if event_due:
+                self._event_due_pending = True
+            if self._event_due_pending:
+                ready = self._poll_ready_events()
+                if ready is not None:
+                    self._event_due_pending = False
+                    self._apply_events(*ready)
+                else:
+                    self._log("DEBUG", "예정된 이벤트가 아직 준비되지 않음 (다음 틱에 재확인)")
+        elif event_due:
+            self._generate_events()
+        
         # 주가 업데이트
         self._update_stock_prices()
-        
-        self.last_update = current_time
     
     def _generate_events(self):
-        """AI를 사용하여 새로운 이벤트 생성"""
+        """AI를 사용하여 새로운 이벤트 생성 (동기 경로: 요청 → 적용)"""
         try:
-            past_events = [event.event for event in self.events_history[-5:]] if self.events_history else []
+            new_events, event_context = self._request_events()
+            self._apply_events(new_events, event_context)
+        except Exception as e:
+            import traceback
+            self._log("ERROR", f"이벤트 생성 중 오류: {e}", traceback=traceback.format_exc())
+    
+    def _poll_ready_events(self) -> Optional[Tuple[List[Event], Dict]]:
+        """준비된 사건을 꺼냄 (풀이 있으면 풀에서 1개, 없으면 생산자 큐에서 1묶음, 없으면 None)"""
+        if self._event_pool is None:
+            return self._event_producer.poll()
+        event = self._event_pool.pop(self._market_signature())
+        if event is None:
+            return None
+        return [event], self._build_event_context()[1]
 
-            # 현재 시장 상태 정보 수집
-            current_market_state = self._get_current_market_state()
-            
-            # 이벤트 생성에 사용할 추가 컨텍스트 정보
-            event_context = {
-                "simulation_time": self.simulation_time.isoformat(),
-                "market_state": current_market_state,
-                "market_params": self.market_params,
-                "total_events_generated": len(self.events_history),
-                "recent_price_changes": self._get_recent_price_changes(),
-                "market_volatility": self._calculate_market_volatility(),
-            }
+    def _request_events(self) -> Tuple[List[Event], Dict]:
+        """현재 시장 컨텍스트로 Announcer에 사건 생성을 요청 (LLM 호출, 느릴 수 있음)"""
+        past_events, event_context = self._build_event_context()
+        new_events = self._generate_unique_events(
+            past_events=past_events,
+            count=1,
+            allowed_categories=self._get_allowed_categories(),
+            market_context=event_context,  # 새로운 컨텍스트 정보 전달
+            sim_id=self._get_sim_id()
+        )
+        return new_events, event_context
 
-            new_events = self.announcer.generate_events(
+    def _generate_pool_events(self, category: str, count: int) -> List[Event]:
+        """
+        이벤트 풀 보충: 한 카테고리의 사건 count개를 한 번의 요청으로 생성.
+        선생성이므로 backfill 우선순위로 보내 실시간 사건/기사 요청에 양보하되,
+        풀이 완전히 비어 틱이 기다리는 중이면 사건 생성과 같은 우선순위로 보낸다.
+        """
+        past_events, event_context = self._build_event_context()
+        pool = self._event_pool
+        priority = "event" if pool is None or pool.size() == 0 else "backfill"
+        with llm_request_context(priority=priority, sim_id=self._get_sim_id()):
+            return self._generate_unique_events(
                 past_events=past_events,
-                count=1,
-                allowed_categories=getattr(self, '_allowed_categories', ["경제", "정책", "기업", "기술", "국제"]),
-                market_context=event_context  # 새로운 컨텍스트 정보 전달
+                count=count,
+                allowed_categories=[category],
+                market_context=event_context,
+                sim_id=self._get_sim_id()
             )
 
+    def _generate_unique_events(self, **request) -> List[Event]:
+        """
+        Announcer에 사건 생성을 요청하고, regenerate 모드면 최근 사건과 근접 중복인 사건만 한 번 더 요청해 교체.
+        교체본도 중복이면 원래 사건을 유지한다 (발행 단계에서 기사 재사용).
+        """
+        events = self.announcer.generate_events(**request)
+        if self.near_duplicate_mode != "regenerate":
+            return events
+        duplicates = [i for i, event in enumerate(events) if self.near_duplicates.find(event, count=False) is not None]
+        if not duplicates:
+            return events
+        replacements = self.announcer.generate_events(**{**request, "count": len(duplicates)})
+        for i, replacement in zip(duplicates, replacements):
+            if self.near_duplicates.find(replacement, count=False) is None:
+                events[i] = replacement
+                self.events_regenerated += 1
+        return events
+
+    def _market_signature(self) -> Dict[str, float]:
+        """
+        이벤트 풀 신선도 판단용 시장 상황 요약: 풀 시작 시점 가격 대비 누적 로그 수익률의 평균과 종목 간 편차.
+        틱 단위 변동률의 표준편차(market_volatility)는 첫 틱부터 0에서 크게 튀므로 쓰지 않는다.
+        """
+        prices = self.stocks.price
+        reference = self._signature_reference
+        if not len(prices) or reference is None or len(reference) != len(prices):
+            return {"average_change": 0.0, "change_dispersion": 0.0}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = np.nan_to_num(np.log(prices / reference), nan=0.0, posinf=0.0, neginf=0.0)
+        return {
+            "average_change": float(change.mean()),
+            "change_dispersion": float(change.std()),
+        }
+
+    def _get_allowed_categories(self) -> List[str]:
+        return getattr(self, '_allowed_categories', ["경제", "정책", "기업", "기술", "국제"])
+
+    def _build_event_context(self) -> Tuple[List[Event], Dict]:
+        """사건 생성 프롬프트에 쓰일 (최근 사건 5개, 시장 컨텍스트)"""
+        past_events = [event.event for event in self.events_history.recent(5)]
+
+        # 현재 시장 상태 정보 수집
+        current_market_state = self._get_current_market_state()
+        
+        # 이벤트 생성에 사용할 추가 컨텍스트 정보
+        event_context = {
+            "simulation_time": self.simulation_time.isoformat(),
+            "market_state": current_market_state,
+            "market_params": self.market_params,
+            "total_events_generated": len(self.events_history),
+            "recent_price_changes": self._get_recent_price_changes(),
+            "market_volatility": self._calculate_market_volatility(),
+        }
+        return past_events, event_context
+    
+    def _apply_events(self, new_events: List[Event], event_context: Dict):
+        """생성된 사건을 현재 시뮬레이션 시각에 반영 (색인/히스토리 등록 → 저장·뉴스 → 콜백 → 주가 갱신)"""
+        try:
             for event in new_events:
                 market_impact = self._calculate_market_impact(event)
                 affected_stocks = self._determine_affected_stocks(event)
@@ -226,74 +453,190 @@ class SimulationEngine:
                     market_impact=market_impact
                 )
                 self.events_history.append(sim_event)
+                self.event_index.add(sim_event)
+                # 근접 중복 판정은 적용 순서대로 (발행이 백그라운드에서 밀려도 이후 사건과 비교하지 않도록)
+                duplicate_of = None
+                if self.near_duplicate_mode != "off":
+                    duplicate_of = self.near_duplicates.find(event)
+                    self.near_duplicates.add(event)
 
-                # 1) 이벤트 별도 저장 (프롬프트 컨텍스트용)
-                try:
-                    event_payload = {
-                        "id": event.id,
-                        "event_type": event.event_type,
-                        "category": event.category,
-                        "sentiment": float(event.sentiment),
-                        "impact_level": int(event.impact_level),
-                        "duration": getattr(event, "duration", None),
-                        "extra": getattr(event, "extra", None),
-                        "market_context": event_context,  # 시장 컨텍스트 정보 추가
-                    }
-                    save_event_log(
-                        sim_id=self._get_sim_id(),
-                        event_id=event.id,
-                        event_payload=event_payload,
-                        affected_stocks=affected_stocks,
-                        market_impact=market_impact,
-                        simulation_time=self.simulation_time,
-                        meta={
-                            "reason": "event_occurred",
-                            "market_state": current_market_state,
-                            "total_events": len(self.events_history)
-                        }
-                    )
-                except Exception as e:
-                    print(f"[persist] event log save failed: {e}")
-
-                # 2) '이벤트 발생 시점'의 시장 상태 스냅샷 저장 (이벤트 내용 미포함)
-                try:
-                    save_market_snapshot(
-                        sim_id=self._get_sim_id(),
-                        stocks=self.stocks,                        # 현재 종목 상태
-                        market_params=self.market_params,          # 현재 파라미터 묶음
-                        simulation_time=self.simulation_time,
-                        meta={
-                            "tick_like_time": self.simulation_time.isoformat(),
-                            "note": "snapshot at event occurrence",
-                            "market_state": current_market_state,
-                            "event_triggered": True
-                        }
+                # 저장/뉴스 생성은 백그라운드 모드에서 틱 루프 밖에서 수행 (스냅샷은 지금 시점으로 고정)
+                if self._persistence_enabled or self._news_generation_enabled:
+                    self._dispatch(
+                        self._persist_and_publish,
+                        sim_event,
+                        event_context,
+                        self.stocks.to_dict() if self._persistence_enabled else None,
+                        len(self.events_history),
+                        duplicate_of,
                     )
-                except Exception as e:
-                    print(f"[persist] snapshot save failed: {e}")
-
-                # 3) 이벤트에 대한 뉴스 기사 생성
-                if self._news_generation_enabled:
-                    try:
-                        self._generate_news_for_event(event.id)
-                    except Exception as e:
-                        print(f"[news] 뉴스 기사 생성 실패: {e}")
 
                 # 콜백
                 if self.on_event_occur:
                     self.on_event_occur(sim_event)
 
-                print(f"[{self.simulation_time.strftime('%Y-%m-%d %H:%M')}] "
-                      f"새로운 이벤트: {event.event_type} (영향도: {market_impact:.3f})")
+                self._log(
+                    "INFO",
+                    f"새로운 이벤트: {event.event_type} (영향도: {market_impact:.3f})",
+                    event_id=event.id,
+                    simulation_time=self.simulation_time.isoformat(),
+                )
                 
                 # 이벤트 발생 직후 해당 종목들의 주가 즉시 업데이트
-                print(f"[DEBUG] 이벤트 발생 직후 주가 즉시 업데이트 실행")
+                self._log("DEBUG", "이벤트 발생 직후 주가 즉시 업데이트 실행", event_id=event.id)
                 self._update_stock_prices()
 
         except Exception as e:
-            print(f"이벤트 생성 중 오류: {e}")
             import traceback
-            traceback.print_exc()
+            self._log("ERROR", f"이벤트 적용 중 오류: {e}", traceback=traceback.format_exc())
+    
+    def _persist_and_publish(
+        self,
+        sim_event: SimulationEvent,
+        event_context: Dict,
+        stocks_snapshot: Optional[Dict],
+        total_events: int,
+        duplicate_of: Optional[Tuple[str, float]] = None
+    ):
+        """
+        이벤트 로그/스냅샷 저장 후 뉴스 생성 (뉴스 생성이 저장된 이벤트 로그를 읽으므로 이 순서를 유지).
+        duplicate_of(근접 중복 원본 사건 ID, 유사도)의 기사가 남아 있으면 LLM 호출 없이 그 기사를 재사용한다.
+        """
+        event = sim_event.event
+        current_market_state = event_context.get("market_state", {})
+        
+        # 1) 이벤트 별도 저장 (프롬프트 컨텍스트용)
+        if self._persistence_enabled:
+            try:
+                event_payload = {
+                    "id": event.id,
+                    "event_type": event.event_type,
+                    "category": event.category,
+                    "sentiment": float(event.sentiment),
+                    "impact_level": int(event.impact_level),
+                    "duration": getattr(event, "duration", None),
+                    "extra": getattr(event, "extra", None),
+                    "market_context": event_context,  # 시장 컨텍스트 정보 추가
+                }
+                save_event_log(
+                    sim_id=self._get_sim_id(),
+                    event_id=event.id,
+                    event_payload=event_payload,
+                    affected_stocks=sim_event.affected_stocks,
+                    market_impact=sim_event.market_impact,
+                    simulation_time=sim_event.timestamp,
+                    meta={
+                        "reason": "event_occurred",
+                        "market_state": current_market_state,
+                        "total_events": total_events
+                    }
+                )
+            except Exception as e:
+                self._log("WARNING", f"[persist] event log save failed: {e}", event_id=event.id)
+
+            # 2) '이벤트 발생 시점'의 시장 상태 스냅샷 저장 (이벤트 내용 미포함)
+            try:
+                save_market_snapshot(
+                    sim_id=self._get_sim_id(),
+                    stocks=stocks_snapshot,                    # 이벤트 적용 시점 종목 상태
+                    market_params=self.market_params,          # 현재 파라미터 묶음
+                    simulation_time=sim_event.timestamp,
+                    meta={
+                        "tick_like_time": sim_event.timestamp.isoformat(),
+                        "note": "snapshot at event occurrence",
+                        "market_state": current_market_state,
+                        "event_triggered": True
+                    }
+                )
+            except Exception as e:
+                self._log("WARNING", f"[persist] snapshot save failed: {e}", event_id=event.id)
+
+        # 3) 이벤트에 대한 뉴스 기사 생성
+        if self._news_generation_enabled:
+            try:
+                if duplicate_of is None or not self._reuse_news_for_event(event.id, *duplicate_of):
+                    self._generate_news_for_event(event.id)
+            except Exception as e:
+                self._log("ERROR", f"[news] 뉴스 기사 생성 실패: {e}", event_id=event.id)
+    
+    # -----------------------------
+    # 백그라운드 이벤트 생산 / 후처리
+    # -----------------------------
+    def enable_async_events(self, enable: bool = True):
+        """
+        실시간 모드에서 사건 생성(LLM)과 저장·뉴스 생성을 백그라운드 스레드로 분리할지 설정.
+        가상 시계 모드는 재현성을 위해 항상 동기 경로를 사용한다.
+        """
+        self._async_events_enabled = enable
+        if not enable:
+            self._stop_background_workers()
+        self._log("INFO", f"비동기 이벤트 생성 {'활성화' if enable else '비활성화'}")
+    
+    def enable_event_pool(self, per_category: int = 3, batch_size: int = 3):
+        """
+        실시간 비동기 모드에서 단건 생산자 대신 카테고리별 사전 생성 풀을 사용.
+        허용 카테고리마다 per_category개를 유지하며 한 번에 batch_size개씩 보충한다 (0이면 끔).
+        """
+        self._stop_background_workers()
+        self.event_pool_size = max(0, per_category)
+        self.event_pool_batch = max(1, batch_size)
+        self._log("INFO", f"이벤트 풀 {'카테고리당 ' + str(per_category) + '개' if per_category else '비활성화'}")
+    
+    def _ensure_background_workers(self):
+        """실시간 모드 첫 틱에서 이벤트 생산자/후처리 실행기를 지연 시작"""
+        if not self._async_events_enabled or self.clock_mode != ClockMode.REALTIME:
+            return
+        if self._background_executor is None:
+            self._background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sim-publish")
+        if self.event_pool_size > 0:
+            if self._event_pool is None:
+                self._signature_reference = self.stocks.price.copy()
+                self._event_pool = EventPool(
+                    self._generate_pool_events,
+                    self._market_signature,
+                    self._get_allowed_categories(),
+                    per_category=self.event_pool_size,
+                    batch_size=self.event_pool_batch,
+                    drift_threshold=self.EVENT_POOL_DRIFT,
+                    on_error=lambda e: self._log("ERROR", f"이벤트 풀 보충 실패: {e}"),
+                    name=f"event-pool-{self._get_sim_id()}",
+                    idle=get_llm_scheduler().is_idle,
+                )
+            self._event_pool.start()
+            return
+        if self._event_producer is None:
+            self._event_producer = EventProducer(
+                self._request_events,
+                maxsize=self.EVENT_QUEUE_SIZE,
+                name=f"event-producer-{self._get_sim_id()}",
+                on_error=lambda e: self._log("ERROR", f"백그라운드 이벤트 생성 실패: {e}"),
+            )
+        self._event_producer.start()
+    
+    def _stop_background_workers(self):
+        if self._event_producer is not None:
+            self._event_producer.stop()
+            self._event_producer = None
+        if self._event_pool is not None:
+            self._event_pool.stop()
+            self._event_pool = None
+        self._event_due_pending = False
+        if self._background_executor is not None:
+            self._background_executor.shutdown(wait=False)
+            self._background_executor = None
+    
+    def _dispatch(self, fn, *args):
+        """백그라운드 실행기가 있으면 제출, 없으면 즉시 실행"""
+        executor = self._background_executor
+        if executor is None:
+            fn(*args)
+            return
+        executor.submit(fn, *args).add_done_callback(self._log_background_failure)
+    
+    def _log_background_failure(self, future):
+        error = future.exception()
+        if error is not None:
+            self._log("ERROR", f"백그라운드 후처리 실패: {error}")
     
     def _generate_news_for_event(self, event_id: str):
         """이벤트에 대한 뉴스 기사 생성"""
@@ -306,18 +649,71 @@ class SimulationEngine:
                 context_events_limit=5
             )
             
-            # 생성된 뉴스들을 히스토리에 추가
-            for news in news_list:
-                self.news_history.append(news)
-                
-                # 콜백 호출
-                if self.on_news_update:
-                    self.on_news_update(news)
-            
-            print(f"이벤트 {event_id}에 대한 뉴스 기사 {len(news_list)}개 생성 완료")
+            self._publish_news(event_id, news_list)
+            self._log("INFO", f"뉴스 기사 {len(news_list)}개 생성 완료", event_id=event_id)
             
         except Exception as e:
-            print(f"뉴스 기사 생성 중 오류: {e}")
+            self._log("ERROR", f"뉴스 기사 생성 중 오류: {e}", event_id=event_id)
+    
+    def _reuse_news_for_event(self, event_id: str, source_event_id: str, similarity: float) -> bool:
+        """근접 중복 사건에 원본 사건 기사를 새 ID로 복사해 발행 (원본 기사가 없으면 False → 새로 생성)"""
+        source_news = self._event_news.get(source_event_id)
+        if not source_news:
+            return False
+        news_list = [News(id=generate_id("news"), media=n.media, article_text=n.article_text) for n in source_news]
+        for news in news_list:
+            try:
+                save_news_article(
+                    self._get_sim_id(),
+                    event_id=event_id,
+                    news_id=news.id,
+                    media_name=news.media,
+                    article_text=news.article_text,
+                    meta={
+                        "generation_method": "near_duplicate_reuse",
+                        "source_event_id": source_event_id,
+                        "similarity": round(similarity, 3),
+                    },
+                )
+            except Exception as e:
+                self._log("WARNING", f"[news] 재사용 기사 저장 실패: {e}", event_id=event_id)
+        self._publish_news(event_id, news_list)
+        self.news_reused += len(news_list)
+        self._log(
+            "INFO",
+            f"근접 중복 사건(유사도 {similarity:.2f}): 기사 {len(news_list)}개 재사용",
+            event_id=event_id,
+            source_event_id=source_event_id,
+        )
+        return True
+    
+    def _publish_news(self, event_id: str, news_list: List[News]):
+        """기사를 히스토리에 추가하고 콜백 호출 (근접 중복 재사용 대비 사건별 기사도 최근 창만큼 보관)"""
+        if news_list and self.near_duplicate_mode != "off":
+            self._event_news[event_id] = news_list
+            while len(self._event_news) > self.NEAR_DUPLICATE_WINDOW:
+                self._event_news.popitem(last=False)
+        for news in news_list:
+            self.news_history.append(news)
+            
+            # 콜백 호출
+            if self.on_news_update:
+                self.on_news_update(news)
+    
+    def _history_path(self, kind: str) -> str:
+        """스필 파일 경로: {history_dir}/{sim_id}/{run_id}/{kind}.jsonl (영속화 비활성 시 스필하지 않음)"""
+        if not self._persistence_enabled:
+            return ""
+        return os.path.join(self.history_dir, self._get_sim_id(), self._run_id, f"{kind}.jsonl")
+    
+    def get_history_page(self, kind: str = "events", offset: int = 0, limit: int = 100) -> List[Dict]:
+        """디스크로 내보낸 과거 이벤트/뉴스를 오래된 순으로 페이지 조회"""
+        history = self.events_history if kind == "events" else self.news_history
+        return history.page(offset=offset, limit=limit)
+    
+    def _log(self, level: str, message: str, **fields):
+        """시뮬레이션별 로그 링 버퍼에 기록 (stdout 대신, 관리자 로그 API에서 조회)"""
+        get_log_buffer(self._get_sim_id()).log(level, message, **fields)
     
     # 시뮬레이션 ID를 정하는 규칙(예시) — 외부에서 주입받거나 생성 규칙에 맞게 구현
     def _get_sim_id(self) -> str:
@@ -340,74 +736,8 @@ class SimulationEngine:
         return base_impact * random_factor
     
     def _determine_affected_stocks(self, event: Event) -> List[str]:
-        """이벤트가 영향을 미치는 주식들 결정"""
-        # 섹터별 영향 종목 매핑
-        sector_mapping = {
-            # 반도체/전자
-            "반도체": ["005930", "000660", "011070"],  # 삼성전자, SK하이닉스, LG이노텍
-            "전자": ["005930", "000660", "011070"],
-            
-            # 자동차/조선
-            "자동차": ["005380", "005490"],  # 현대차, 기아
-            "조선": ["009540", "010140"],  # 현대중공업, 삼성중공업
-            "방산": ["012450"],  # 한화에어로스페이스
-            
-            # 화학/에너지
-            "화학": ["051910", "006400", "373220"],  # LG화학, 삼성SDI, LG에너지솔루션
-            "에너지": ["096770", "015760"],  # SK이노베이션, 한국전력
-            
-            # 금융
-            "금융": ["055550", "086790", "105560", "138930", "323410"],  # 신한, 하나, KB, BNK, 카카오뱅크
-            "은행": ["055550", "086790", "105560", "138930", "323410"],
-            
-            # 건설
-            "건설": ["028260"],  # 삼성물산
-            
-            # 통신/미디어
-            "통신": ["017670", "030200"],  # SK텔레콤, KT
-            "인터넷": ["035420", "035720"],  # NAVER, 카카오
-            "미디어": ["035420", "035720"],
-            
-            # 바이오/제약
-            "바이오": ["068270", "207940"],  # 셀트리온, 삼성바이오로직스
-            "제약": ["068270", "207940"],
-            
-            # 소비재
-            "식품": ["097950"],  # CJ제일제당
-            "소비재": ["097950"],
-            
-            # 기술
-            "기술": ["005930", "000660", "035420", "035720"],  # 대표 기술주들
-            "AI": ["005930", "000660", "035420", "035720"],  # AI 관련주
-            "디지털": ["035420", "035720", "323410"],  # 디지털 전환 관련주
-        }
-        
-        # 카테고리별 영향 종목 결정
-        affected = []
-        
-        # 섹터 매핑 확인
-        for sector, stocks in sector_mapping.items():
-            if sector in event.category or sector in event.event_type:
-                affected.extend(stocks)
-        
-        # 키워드별 영향 종목 결정
-        keywords = {
-            "금리": ["055550", "086790", "105560", "138930"],  # 금융주
-            "환율": ["005380", "005490", "009540", "010140"],  # 수출주
-            "원자재": ["051910", "006400", "373220", "096770"],  # 원자재 수혜주
-            "정책": ["015760", "096770", "051910"],  # 정책 수혜주
-            "경기": ["005380", "005490", "028260", "009540"],  # 경기 민감주
-            "방산": ["012450", "009540", "010140"],  # 방산주
-            "친환경": ["006400", "373220", "005380", "005490"],  # 친환경 관련주
-            "디지털": ["035420", "035720", "323410"],  # 디지털 전환주
-        }
-        
-        for keyword, stocks in keywords.items():
-            if keyword in event.event_type or keyword in event.category:
-                affected.extend(stocks)
-        
-        # 중복 제거
-        affected = list(set(affected))
+        """이벤트가 영향을 미치는 주식들 결정 (섹터/키워드 오토마톤으로 카테고리·유형을 한 번에 매칭)"""
+        affected = self.keyword_automaton.match(event.category, event.event_type)
         
         # 이벤트가 너무 광범위한 경우 전체 시장에 영향
         if len(affected) == 0 or event.impact_level >= 4:
@@ -416,152 +746,213 @@ class SimulationEngine:
         return affected
     
     def _update_stock_prices(self):
-        """주가 업데이트 - 현실적인 모델 적용"""
-        print(f"[DEBUG] 주가 업데이트 시작 - {len(self.stocks)}개 종목")
+        """주가 업데이트 - 현실적인 모델 적용 (종목별 결과를 모아 배열에 한 번에 반영)"""
+        self._log("DEBUG", f"주가 업데이트 시작 - {len(self.stocks)}개 종목")
         
-        # 현실적인 주가 변동 모델 로드
+        # 현실적인 주가 변동 모델 로드 (프로세스 공유 인스턴스, 데이터 변경 시에만 재생성)
         try:
-            from core.models.realistic_stock_movement import RealisticStockMovement
-            realistic_model = RealisticStockMovement()
-            print("[DEBUG] 현실적인 주가 변동 모델 로드 완료")
+            from core.models.realistic_stock_movement import get_realistic_model
+            realistic_model = get_realistic_model()
         except ImportError:
-            print("[WARNING] 현실적인 모델 로드 실패, 기존 모델 사용")
+            self._log("WARNING", "현실적인 모델 로드 실패, 기존 모델 사용")
             realistic_model = None
         
-        for ticker, stock_data in self.stocks.items():
-            # 최근 이벤트들의 영향을 종합
-            recent_events = [e for e in self.events_history 
-                           if ticker in e.affected_stocks and 
-                           (self.simulation_time - e.timestamp).total_seconds() < 3600]  # 1시간 내 이벤트
-            
-            if recent_events and realistic_model:
-                print(f"[DEBUG] {ticker}: {len(recent_events)}개 이벤트 영향 발견")
+        state = self.stocks
+        prices = state.price.copy()
+        change_rates = state.change_rate.copy()
+        volumes = state.volume_or(1000000)
+        updated: List[int] = []
+        
+        # 시뮬레이션 시간 기준으로 만료된 이벤트를 색인에서 제거
+        self.event_index.expire(self.simulation_time)
+        
+        if realistic_model is not None:
+            updated = self._apply_realistic_changes(realistic_model, prices, change_rates, volumes)
+        else:
+            for idx, ticker in enumerate(state.tickers):
+                # 최근 이벤트들의 영향을 종합 (역색인 조회)
+                recent_events = self.event_index.active(ticker)
                 
-                # 현실적인 모델을 사용한 주가 변화 계산
-                for sim_event in recent_events:
-                    # SimulationEvent에서 Event 객체 추출
-                    event = sim_event.event
-                    event_dict = {
-                        "event_type": event.event_type,
-                        "category": event.category,
-                        "sentiment": event.sentiment,
-                        "impact_level": event.impact_level
+                if recent_events:
+                    # 기존 모델 사용 (fallback)
+                    self._log("DEBUG", f"{ticker}: {len(recent_events)}개 이벤트 영향 발견 (기존 모델)", ticker=ticker)
+                    total_impact = sum(e.market_impact for e in recent_events)
+                    self._log("DEBUG", f"{ticker}: 총 영향도 = {total_impact:.4f}", ticker=ticker)
+                    
+                    # 코치 모델을 통한 가중치 조정
+                    weights = self.coach.adjust_weights()
+                    
+                    # 메인 모델을 통한 주가 변화 계산
+                    # 관리자에서 조정된 언론 신뢰도 스케일을 market_params.news.credibility에 반영했으므로 사용
+                    try:
+                        news_cfg = self.market_params.get("news", {})
+                        media_cred = float(news_cfg.get("credibility", 0.8))
+                    except Exception:
+                        media_cred = 0.8
+                    event_data = {
+                        "news_impact": total_impact,
+                        "media_credibility": media_cred
                     }
                     
-                    result = realistic_model.calculate_realistic_change(
-                        event=event_dict,
-                        stock_code=ticker,
-                        current_price=stock_data["price"]
+                    old_price = float(prices[idx])
+                    result = main_model(
+                        weights=weights,
+                        params=self.market_params,
+                        events=event_data,
+                        base_price=old_price
                     )
                     
-                    # 주가 업데이트
-                    old_price = stock_data["price"]
-                    new_price = result["price"]
-                    change_rate = result["delta"]
-                    volume_change = result["volume"]
+                    # 주가 업데이트 (변동폭 스케일 적용)
+                    base_delta = result["delta"]
+                    change_rate = base_delta * max(0.0, float(getattr(self, "price_volatility_scale", 1.0)))
+                    new_price = round(old_price * (1.0 + change_rate), 2)
                     
-                    print(f"[DEBUG] {ticker}: {old_price:.0f} → {new_price:.0f} (변동률: {change_rate*100:+.2f}%)")
+                    self._log("DEBUG", f"{ticker}: {old_price:.0f} → {new_price:.0f} (변동률: {change_rate*100:+.2f}%)", ticker=ticker)
                     
-                    stock_data["price"] = new_price
-                    stock_data["change_rate"] = change_rate
-                    stock_data["volume"] = stock_data.get("volume", 1000000) * volume_change
+                    prices[idx] = new_price
+                    change_rates[idx] = change_rate
+                    state.apply_updates(np.array([idx]), prices[idx:idx + 1], change_rates[idx:idx + 1])
                     
-            elif recent_events:
-                # 기존 모델 사용 (fallback)
-                print(f"[DEBUG] {ticker}: {len(recent_events)}개 이벤트 영향 발견 (기존 모델)")
-                total_impact = sum(e.market_impact for e in recent_events)
-                print(f"[DEBUG] {ticker}: 총 영향도 = {total_impact:.4f}")
-                
-                # 코치 모델을 통한 가중치 조정
-                weights = self.coach.adjust_weights()
-                
-                # 메인 모델을 통한 주가 변화 계산
-                # 관리자에서 조정된 언론 신뢰도 스케일을 market_params.news.credibility에 반영했으므로 사용
-                try:
-                    news_cfg = self.market_params.get("news", {})
-                    media_cred = float(news_cfg.get("credibility", 0.8))
-                except Exception:
-                    media_cred = 0.8
-                event_data = {
-                    "news_impact": total_impact,
-                    "media_credibility": media_cred
-                }
-                
-                result = main_model(
-                    weights=weights,
-                    params=self.market_params,
-                    events=event_data,
-                    base_price=stock_data["price"]
-                )
-                
-                # 주가 업데이트 (변동폭 스케일 적용)
-                old_price = stock_data["price"]
-                base_delta = result["delta"]
-                change_rate = base_delta * max(0.0, float(getattr(self, "price_volatility_scale", 1.0)))
-                new_price = round(old_price * (1.0 + change_rate), 2)
-                
-                print(f"[DEBUG] {ticker}: {old_price:.0f} → {new_price:.0f} (변동률: {change_rate*100:+.2f}%)")
-                
-                stock_data["price"] = new_price
-                stock_data["change_rate"] = change_rate
-                
-                # Django 데이터베이스의 Stock 모델 업데이트
-                try:
-                    from django.db import connection
-                    if connection.connection is not None:
-                        from sams.models import Stock
-                        stock_obj = Stock.objects.filter(ticker=ticker).first()
-                        if stock_obj:
-                            stock_obj.current_price = new_price
-                            stock_obj.price_change = change_rate * 100  # 퍼센트로 변환
-                            stock_obj.save()
-                            print(f"[DB] {ticker} 주가 업데이트: {old_price:.0f} → {new_price:.0f} (변동률: {change_rate*100:+.2f}%)")
-                except Exception as e:
-                    print(f"[DB] 주가 업데이트 실패 ({ticker}): {e}")
-                
-                # 콜백 호출
-                if self.on_price_change:
-                    stock_price = StockPrice(
-                        ticker=ticker,
-                        base_price=old_price,
-                        current_price=new_price,
-                        change_rate=change_rate,
-                        volume=stock_data.get("volume", 0),
-                        timestamp=self.simulation_time
-                    )
-                    self.on_price_change(stock_price)
-            else:
-                print(f"[DEBUG] {ticker}: 영향받는 이벤트 없음")
+                    # Django 데이터베이스의 Stock 모델 업데이트
+                    try:
+                        from django.db import connection
+                        if connection.connection is not None:
+                            from sams.models import Stock
+                            stock_obj = Stock.objects.filter(ticker=ticker).first()
+                            if stock_obj:
+                                stock_obj.current_price = new_price
+                                stock_obj.price_change = change_rate * 100  # 퍼센트로 변환
+                                stock_obj.save()
+                                self._log("DEBUG", f"[DB] {ticker} 주가 업데이트: {old_price:.0f} → {new_price:.0f}", ticker=ticker)
+                    except Exception as e:
+                        self._log("WARNING", f"[DB] 주가 업데이트 실패 ({ticker}): {e}", ticker=ticker)
+                    
+                    # 콜백 호출
+                    if self.on_price_change:
+                        stock_price = StockPrice(
+                            ticker=ticker,
+                            base_price=old_price,
+                            current_price=new_price,
+                            change_rate=change_rate,
+                            volume=state[ticker].get("volume", 0),
+                            timestamp=self.simulation_time
+                        )
+                        self.on_price_change(stock_price)
+        
+        # 현실적 모델 경로의 결과를 한 번에 반영
+        if updated:
+            idx = np.array(updated, dtype=np.intp)
+            state.apply_updates(idx, prices[idx], change_rates[idx], volumes[idx])
+        
+        self._log("DEBUG", "주가 업데이트 완료")
+    
+    def _apply_realistic_changes(
+        self,
+        realistic_model,
+        prices: np.ndarray,
+        change_rates: np.ndarray,
+        volumes: np.ndarray
+    ) -> List[int]:
+        """
+        활성 이벤트를 시간 순으로 현실적 모델 배치 계산에 통과시켜 배열에 반영.
+        이벤트마다 전 종목을 한 번에 계산하고 영향 종목에만 적용하므로,
+        종목별로 이벤트를 순차 누적하던 기존 계산과 결과가 같다.
+        
+        Returns:
+            갱신된 종목 인덱스 목록
+        """
+        state = self.stocks
+        affected = np.zeros(len(state), dtype=bool)
+        for sim_event in self.event_index.events():
+            mask = np.zeros(len(state), dtype=bool)
+            mask[state.indices(sim_event.affected_stocks)] = True
+            if not mask.any():
+                continue
+            
+            event = sim_event.event
+            event_dict = {
+                "event_type": event.event_type,
+                "category": event.category,
+                "sentiment": event.sentiment,
+                "impact_level": event.impact_level
+            }
+            result = realistic_model.calculate_realistic_change_batch(
+                events=[event_dict],
+                stock_codes=state.tickers,
+                current_prices=prices,
+                spillover_weight=self.sector_spillover_weight
+            )
+            prices[mask] = result["price"][0, 0, mask]
+            change_rates[mask] = result["delta"][0, 0, mask]
+            volumes[mask] *= result["volume"][0, 0, mask]
+            affected |= mask
         
-        print(f"[DEBUG] 주가 업데이트 완료")
+        updated = np.flatnonzero(affected).tolist()
+        self._log("DEBUG", f"현실적 모델: 활성 이벤트 {len(self.event_index)}개, 영향 종목 {len(updated)}개")
+        return updated
     
     def enable_news_generation(self, enable: bool = True):
         """뉴스 기사 생성 활성화/비활성화"""
         self._news_generation_enabled = enable
         status = "활성화" if enable else "비활성화"
-        print(f"뉴스 기사 생성 {status}")
+        self._log("INFO", f"뉴스 기사 생성 {status}")
+    
+    def enable_persistence(self, enable: bool = True):
+        """파이어스토어 저장 및 히스토리 디스크 스필 활성화/비활성화 (오프라인 배치 실행용)"""
+        self._persistence_enabled = enable
+        status = "활성화" if enable else "비활성화"
+        self._log("INFO", f"영속화 {status}")
+    
+    def set_near_duplicate_mode(self, mode: str):
+        """근접 중복 사건 처리 방식 설정: reuse / regenerate / off"""
+        if mode not in self.NEAR_DUPLICATE_MODES:
+            raise ValueError(f"near_duplicate_mode는 {self.NEAR_DUPLICATE_MODES} 중 하나여야 합니다: {mode}")
+        self.near_duplicate_mode = mode
+        self._log("INFO", f"근접 중복 사건 처리: {mode}")
+    
+    def near_duplicate_stats(self) -> Dict:
+        """근접 중복 필터 통계 + 재생성된 사건 수, 재사용된 기사 수"""
+        return {
+            "mode": self.near_duplicate_mode,
+            **self.near_duplicates.stats(),
+            "events_regenerated": self.events_regenerated,
+            "news_reused": self.news_reused,
+        }
     
     def set_event_generation_interval(self, interval_seconds: int):
         """이벤트 생성 간격 설정 (초 단위)"""
         self.event_generation_interval = interval_seconds
-        print(f"이벤트 생성 간격: {interval_seconds}초")
+        self._log("INFO", f"이벤트 생성 간격: {interval_seconds}초")
     
     def set_allowed_categories(self, categories: List[str]):
         """허용된 이벤트 카테고리 설정"""
         self._allowed_categories = categories
-        print(f"허용된 카테고리: {categories}")
+        if self._event_pool is not None:
+            self._event_pool.set_categories(categories)
+        self._log("INFO", f"허용된 카테고리: {categories}")
     
     def get_current_state(self) -> Dict:
         """현재 시뮬레이션 상태 반환"""
         return {
             "state": self.state.value,
             "speed": self.speed.value,
+            "clock_mode": self.clock_mode.value,
+            "pending_events": self._pending_event_count(),
             "simulation_time": self.simulation_time.isoformat(),
-            "stocks": self.stocks,
-            "recent_events": [e.to_dict() for e in self.events_history[-5:]],
-            "recent_news": [n.to_dict() for n in self.news_history[-5:]]
+            "stocks": self.stocks.to_dict(),
+            "recent_events": [e.to_dict() for e in self.events_history.recent(5)],
+            "recent_news": [n.to_dict() for n in self.news_history.recent(5)]
         }
     
+    def _pending_event_count(self) -> int:
+        if self._event_pool is not None:
+            return self._event_pool.size()
+        return self._event_producer.qsize() if self._event_producer is not None else 0
+    
+    def get_active_events_for_ticker(self, ticker: str) -> List[SimulationEvent]:
+        """특정 종목에 현재 영향을 주고 있는 이벤트 목록 (역색인 조회)"""
+        return self.event_index.active(ticker, now=self.simulation_time)
+    
     def get_stock_price(self, ticker: str) -> Optional[StockPrice]:
         """특정 주식의 현재 가격 정보 반환"""
         if ticker not in self.stocks:
@@ -589,27 +980,25 @@ class SimulationEngine:
     def _get_current_market_state(self) -> dict:
         """현재 시장 상태 정보를 수집"""
         try:
-            # 주가 변화율 계산
-            price_changes = {}
-            total_change = 0
-            total_volume = 0
+            state = self.stocks
+            # 주가 변화율 계산 (기준가 대비, 배열 연산)
+            change_from_base = state.change_from_base()
+            volumes = state.volume_or(0)
             
-            for ticker, stock_data in self.stocks.items():
-                base_price = stock_data.get("base_price", stock_data["price"])
-                current_price = stock_data["price"]
-                change_rate = (current_price - base_price) / base_price
-                volume = stock_data.get("volume", 0)
-                
-                price_changes[ticker] = {
-                    "current_price": current_price,
+            price_changes = {
+                ticker: {
+                    "current_price": price,
                     "change_rate": change_rate,
                     "volume": volume
                 }
-                total_change += change_rate
-                total_volume += volume
+                for ticker, price, change_rate, volume in zip(
+                    state.tickers, state.price.tolist(), change_from_base.tolist(), volumes.tolist()
+                )
+            }
+            total_volume = float(volumes.sum())
             
             # 시장 평균 변화율
-            avg_change = total_change / len(self.stocks) if self.stocks else 0
+            avg_change = float(change_from_base.mean()) if len(state) else 0
             
             # 시장 분위기 판단
             market_sentiment = "neutral"
@@ -623,46 +1012,41 @@ class SimulationEngine:
                 "market_sentiment": market_sentiment,
                 "total_volume": total_volume,
                 "price_changes": price_changes,
-                "active_stocks_count": len(self.stocks),
+                "active_stocks_count": len(state),
                 "simulation_speed": self.speed.value,
                 "simulation_duration_hours": (self.simulation_time - self.simulation_start_time).total_seconds() / 3600 if self.simulation_start_time else 0
             }
         except Exception as e:
-            print(f"시장 상태 수집 중 오류: {e}")
+            self._log("ERROR", f"시장 상태 수집 중 오류: {e}")
             return {}
     
     def _get_recent_price_changes(self) -> dict:
         """최근 주가 변화 정보 수집"""
         try:
-            recent_changes = {}
-            for ticker, stock_data in self.stocks.items():
-                change_rate = stock_data.get("change_rate", 0)
-                recent_changes[ticker] = {
+            state = self.stocks
+            return {
+                ticker: {
                     "change_rate": change_rate,
-                    "price": stock_data["price"],
-                    "volume": stock_data.get("volume", 0)
+                    "price": price,
+                    "volume": volume
                 }
-            return recent_changes
+                for ticker, change_rate, price, volume in zip(
+                    state.tickers,
+                    state.change_rate_or_zero().tolist(),
+                    state.price.tolist(),
+                    state.volume_or(0).tolist(),
+                )
+            }
         except Exception as e:
-            print(f"최근 주가 변화 수집 중 오류: {e}")
+            self._log("ERROR", f"최근 주가 변화 수집 중 오류: {e}")
             return {}
     
     def _calculate_market_volatility(self) -> float:
-        """시장 변동성 계산"""
+        """시장 변동성 계산 (변동률의 모표준편차)"""
         try:
-            if not self.stocks:
+            if not len(self.stocks):
                 return 0.0
-            
-            changes = [stock_data.get("change_rate", 0) for stock_data in self.stocks.values()]
-            if not changes:
-                return 0.0
-            
-            # 표준편차 계산
-            mean_change = sum(changes) / len(changes)
-            variance = sum((x - mean_change) ** 2 for x in changes) / len(changes)
-            volatility = variance ** 0.5
-            
-            return volatility
+            return float(np.std(self.stocks.change_rate_or_zero()))
         except Exception as e:
-            print(f"시장 변동성 계산 중 오류: {e}")
-            return 0.0 
\ No newline at end of file
+            self._log("ERROR", f"시장 변동성 계산 중 오류: {e}")
+            return 0.0
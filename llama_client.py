@@ -1,19 +1,527 @@
+import json
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
-def query_llm(prompt: str, model: str = "llama3.2:3b", max_tokens: int = 512) -> str:
-    url = "http://localhost:11434/api/generate"
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "stream": False,
-        "options": {
-            "temperature": 0.7,
-            "num_predict": max_tokens
+from utils.env import env_number
+from utils.llm_cache import LLMCache, get_llm_cache, make_cache_key
+from utils.llm_scheduler import LLMScheduler, current_deadline, get_llm_scheduler, llm_request_context
+from utils.llm_telemetry import LLMTelemetry, get_llm_telemetry
+
+DEFAULT_BASE_URL = "http://localhost:11434"
+DEFAULT_MODEL = "llama3.2:3b"
+
+# 재시도할 HTTP 상태 코드 (모델 로딩 중/과부하)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# prefill()로 얻은 prefix context를 몇 개까지 보관할지 (사건 1건 = prefix 1개)
+DEFAULT_PREFIX_CACHE_SIZE = 32
+# prefill이 실패한 prefix는 이 시간(초) 동안 다시 평가하지 않고 바로 전체 프롬프트로 보냄
+PREFILL_FAILURE_TTL = 30.0
+
+
+def join_prompt(prefix: Optional[str], prompt: str) -> str:
+    """prefix + 꼬리 프롬프트 → 전체 프롬프트 (prefix 재사용을 쓰지 않을 때 보내는 텍스트)"""
+    return prompt if prefix is None else f"{prefix}\n\n{prompt}"
+
+
+class LlamaClient:
+    """
+    Ollama HTTP 클라이언트 (프로세스 공유).
+
+    - requests.Session + 커넥션 풀로 매 호출마다 TCP 연결을 새로 맺지 않음
+    - 연결/응답 타임아웃 분리, 연결 오류·타임아웃·5xx는 지수 백오프 + 지터로 재시도
+    - 모든 요청에 keep_alive를 실어 보내 유휴 후에도 모델이 메모리에 남아 있도록 함
+    - warmup()으로 시작 시 모델을 미리 로드해 첫 사건 생성의 콜드 로드를 피함
+    - cache가 있으면 (model, prompt, options)가 같은 요청은 LLM을 다시 호출하지 않음
+    - prefix를 주면 공통 앞부분은 한 번만 평가하고 그 context 위에 꼬리 프롬프트만 이어 보냄
+    - format(JSON 스키마 또는 "json")을 주면 Ollama가 그 형식에 맞는 출력만 생성하도록 제약
+    - scheduler가 있으면 실제 HTTP 요청마다 실행 슬롯을 잡음 (캐시 적중은 슬롯 없이 반환)
+    - telemetry가 있으면 호출마다 지연 시간·토큰 수·오류 종류를 프롬프트 유형/시뮬레이션별로 기록
+    - 요청 컨텍스트에 마감 시각이 있으면 슬롯 대기·타임아웃·재시도·스트림 수신을 그 안으로 제한
+      (호출 측이 포기한 요청이 백엔드에 남아 다음 요청을 늦추지 않게)
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        model: str = DEFAULT_MODEL,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 120.0,
+        max_retries: int = 2,
+        backoff: float = 0.5,
+        keep_alive: str = "30m",
+        pool_size: int = 8,
+        session: Optional[requests.Session] = None,
+        cache: Optional[LLMCache] = None,
+        scheduler: Optional[LLMScheduler] = None,
+        telemetry: Optional[LLMTelemetry] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.keep_alive = keep_alive
+        self.session = session or self._build_session(pool_size)
+        self.cache = cache
+        self.scheduler = scheduler
+        self.telemetry = telemetry
+        self._warm_models = set()
+        self._warming = set()
+        self._lock = threading.Lock()
+        self.prefix_cache_size = DEFAULT_PREFIX_CACHE_SIZE
+        self._prefix_contexts: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._prefix_locks: Dict[str, threading.Lock] = {}
+        self.prefill_failure_ttl = PREFILL_FAILURE_TTL
+        self._prefix_failures: Dict[str, float] = {}
+
+    @classmethod
+    def from_env(cls) -> "LlamaClient":
+        """환경 변수로 설정 (OLLAMA_BASE_URL / OLLAMA_HOST, OLLAMA_MODEL, SAMS_LLM_*)"""
+        host = os.environ.get("OLLAMA_BASE_URL") or os.environ.get("OLLAMA_HOST") or DEFAULT_BASE_URL
+        if not host.startswith("http"):
+            host = f"http://{host}"
+        return cls(
+            base_url=host,
+            model=os.environ.get("OLLAMA_MODEL", DEFAULT_MODEL),
+            connect_timeout=env_number("SAMS_LLM_CONNECT_TIMEOUT", 3.0, float),
+            read_timeout=env_number("SAMS_LLM_READ_TIMEOUT", 120.0, float),
+            max_retries=env_number("SAMS_LLM_RETRIES", 2),
+            keep_alive=os.environ.get("SAMS_LLM_KEEP_ALIVE", "30m"),
+            pool_size=env_number("SAMS_LLM_POOL_SIZE", 8),
+            cache=get_llm_cache(),
+            scheduler=get_llm_scheduler(),
+            telemetry=get_llm_telemetry(),
+        )
+
+    @staticmethod
+    def _build_session(pool_size: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    # -----------------------------
+    # 요청
+    # -----------------------------
+    def _slot(self):
+        """스케줄러 실행 슬롯 (우선순위/시뮬레이션 ID는 llm_request_context에서 가져옴)"""
+        return self.scheduler.slot() if self.scheduler is not None else nullcontext()
+
+    def _record_call(self, latency: float, meta: Optional[Dict[str, Any]] = None, streamed_tokens: int = 0):
+        if self.telemetry is not None:
+            self.telemetry.record_call(latency, meta, streamed_tokens=streamed_tokens)
+
+    def _record_error(self, error: BaseException):
+        if self.telemetry is not None:
+            self.telemetry.record_error(error)
+
+    def _record_cache_hit(self):
+        if self.telemetry is not None:
+            self.telemetry.record_cache_hit()
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._request(path, payload).json()
+
+    @staticmethod
+    def _remaining() -> Optional[float]:
+        """요청 컨텍스트 마감 시각까지 남은 시간(초), 마감이 없으면 None. 이미 지났으면 requests.Timeout"""
+        deadline = current_deadline()
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.Timeout("LLM 요청 마감 시각 초과")
+        return remaining
+
+    def _timeout(self) -> Tuple[float, float]:
+        """(연결, 응답) 타임아웃 — 마감 시각이 있으면 남은 시간으로 줄임"""
+        remaining = self._remaining()
+        if remaining is None:
+            return self.timeout
+        return min(self.timeout[0], remaining), min(self.timeout[1], remaining)
+
+    def _request(self, path: str, payload: Dict[str, Any], stream: bool = False) -> requests.Response:
+        """요청 전송 (응답 본문을 받기 전까지의 실패만 재시도, 마감 시각이 있으면 그 안에서만)"""
+        url = f"{self.base_url}{path}"
+        attempt = 0
+        while True:
+            try:
+                response = self.session.post(url, json=payload, timeout=self._timeout(), stream=stream)
+                if response.status_code in RETRY_STATUS and attempt < self.max_retries:
+                    raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+                response.raise_for_status()
+                return response
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                failed = getattr(e, "response", None)
+                if failed is not None:
+                    # 스트림 응답은 닫아야 연결이 커넥션 풀로 돌아간다 (재시도/실패 모두)
+                    failed.close()
+                status = getattr(failed, "status_code", None)
+                retryable = status is None or status in RETRY_STATUS
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                delay = self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+                remaining = self._remaining()
+                if remaining is not None and delay >= remaining:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+
+    def _generate_payload(
+        self,
+        prompt: str,
+        model: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        stream: bool,
+        format: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        payload = {
+            "model": model or self.model,
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": self.keep_alive,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
         }
-    }
+        if format is not None:
+            payload["format"] = format
+        return payload
+
+    def generate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        prefix: Optional[str] = None,
+        format: Optional[Union[str, Dict[str, Any]]] = None,
+        use_cache: bool = True,
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> str:
+        """
+        prefix를 주면 prefix 뒤에 prompt가 이어지는 요청으로 취급하되,
+        prefix는 prefill()로 한 번만 평가해 얻은 context를 재사용하고 prompt(꼬리)만 전송한다.
+        format: Ollama 구조화 출력 (JSON 스키마 dict 또는 "json")
+        use_cache: False면 캐시를 읽지도 쓰지도 않음 (같은 프롬프트로 다시 샘플링하는 재시도용)
+        accept: 응답을 캐시에 저장할지 판단 (False를 반환한 응답은 호출 측이 버린 것이므로 저장하지 않음)
+        """
+        payload = self._generate_payload(prompt, model, max_tokens, temperature, stream=False, format=format)
+        cache_key, cached = self._prepare_request(payload, prefix, use_cache)
+        if cached is not None:
+            self._record_cache_hit()
+            return cached
+
+        try:
+            with self._slot():
+                # 지연 시간은 스케줄러 대기를 뺀 실제 요청 시간
+                started = time.monotonic()
+                data = self._post("/api/generate", payload)
+                latency = time.monotonic() - started
+        except Exception as e:
+            self._record_error(e)
+            raise
+        self._record_call(latency, data)
+        self._warm_models.add(payload["model"])
+        if cache_key and (accept is None or accept(data["response"])):
+            self.cache.put(cache_key, data["response"])
+        return data["response"]
+
+    def generate_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        on_partial: Optional[Callable[[str, str], Optional[bool]]] = None,
+        prefix: Optional[str] = None,
+        format: Optional[Union[str, Dict[str, Any]]] = None,
+        use_cache: bool = True,
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> str:
+        """
+        Ollama NDJSON 스트림으로 생성하며 토큰이 올 때마다 on_partial(지금까지의 텍스트, 새 조각)을 호출.
+        on_partial이 True를 반환하면 연결을 닫아 생성을 중단하고 그때까지의 텍스트를 반환한다.
+        캐시에 있으면 저장된 텍스트를 조각 하나로 전달한다 (끝까지(done) 받은 응답만 저장).
+        prefix, format, use_cache, accept는 generate()와 같다.
+        """
+        payload = self._generate_payload(prompt, model, max_tokens, temperature, stream=True, format=format)
+        cache_key, cached = self._prepare_request(payload, prefix, use_cache)
+        if cached is not None:
+            self._record_cache_hit()
+            if on_partial is not None and cached:
+                on_partial(cached, cached)
+            return cached
+
+        parts = []
+        meta = None  # 마지막(done) 조각의 토큰 수/소요 시간 (조기 종료하면 없음)
+        try:
+            with self._slot():
+                started = time.monotonic()
+                response = self._request("/api/generate", payload, stream=True)
+                self._warm_models.add(payload["model"])
+                try:
+                    for line in response.iter_lines():
+                        self._remaining()  # 마감이 지나면 연결을 닫아 백엔드 생성도 멈춤
+                        if not line:
+                            continue
+                        data = json.loads(line)
+                        if data.get("error"):
+                            raise RuntimeError(f"LLM 스트림 오류: {data['error']}")
+                        chunk = data.get("response", "")
+                        if chunk:
+                            parts.append(chunk)
+                            if on_partial is not None and on_partial("".join(parts), chunk):
+                                break
+                        if data.get("done"):
+                            meta = data
+                            break
+                finally:
+                    # 조기 종료 시 연결을 닫으면 Ollama도 해당 요청의 생성을 멈춘다
+                    response.close()
+                latency = time.monotonic() - started
+        except Exception as e:
+            self._record_error(e)
+            raise
+        # Ollama는 조각 하나에 토큰 하나를 보내므로 메타데이터가 없으면 조각 수로 추정
+        self._record_call(latency, meta, streamed_tokens=len(parts))
+        text = "".join(parts)
+        # 조기 종료된 응답은 잘린 텍스트라 저장하지 않는다
+        if cache_key and meta is not None and (accept is None or accept(text)):
+            self.cache.put(cache_key, text)
+        return text
+
+    def _prepare_request(
+        self, payload: Dict[str, Any], prefix: Optional[str], use_cache: bool
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        prefix context를 붙이고, 실제로 보낼 요청 기준의 (캐시 키, 캐시된 응답)을 반환.
+        context 이어 쓰기는 chat 템플릿으로 평가한 prefix(+ 샘플된 토큰 1개) 뒤에 꼬리를 새 턴으로 보내는 것이라
+        전체 프롬프트 요청과 같은 출력이 아니므로, 두 경우를 서로 다른 키로 저장한다.
+        캐시 적중이면 prefill도 하지 않는다.
+        """
+        use_cache = use_cache and self.cache is not None
+        if prefix is not None and use_cache and not self._prefill_failed(payload["model"], prefix):
+            key = self._cache_key(payload, context_prefix=prefix)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return key, cached
+            self._attach_prefix(payload, prefix)
+            if "context" in payload:
+                return key, None
+        else:
+            self._attach_prefix(payload, prefix)
+        if not use_cache:
+            return None, None
+        # prefix 없이 보내거나 prefill 실패로 전체 프롬프트를 보내는 경우
+        key = self._cache_key(payload)
+        return key, self.cache.get(key)
+
+    def _cache_key(self, payload: Dict[str, Any], context_prefix: Optional[str] = None) -> str:
+        """보내는 payload 기준 키 (context_prefix가 있으면 그 prefix의 context 위에 꼬리만 보내는 요청)"""
+        options = payload["options"]
+        if "format" in payload:
+            options = {**options, "format": payload["format"]}
+        if context_prefix is not None:
+            options = {**options, "prefix_context": context_prefix}
+        return make_cache_key(payload["model"], payload["prompt"], options)
+
+    # -----------------------------
+    # 공통 프롬프트 앞부분(prefix) 재사용
+    # -----------------------------
+    def prefill(self, prefix: str, model: Optional[str] = None) -> Optional[List[int]]:
+        """
+        prefix만 평가해 Ollama가 돌려주는 context(토큰 배열)를 반환 (모델·prefix별 LRU 캐시).
+        같은 prefix를 여러 스레드가 동시에 요청해도 실제 평가는 한 번만 일어난다.
+        실패했거나 context가 없었던 prefix는 prefill_failure_ttl초 동안 요청 없이 None을 반환한다
+        (장애 중에 언론사마다 재시도·백오프를 반복하지 않도록).
+        """
+        model = model or self.model
+        key = self._prefix_key(model, prefix)
+        with self._lock:
+            context = self._prefix_contexts.get(key)
+            if context is not None:
+                self._prefix_contexts.move_to_end(key)
+                return context
+            if self._failed_recently(key):
+                return None
+            key_lock = self._prefix_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                context = self._prefix_contexts.get(key)
+                failed = self._failed_recently(key)
+            if context is not None or failed:
+                return context
+            # 응답 토큰 1개만 생성 (prompt 평가 결과인 context가 목적)
+            try:
+                with llm_request_context(prompt_type="prefill"):
+                    try:
+                        with self._slot():
+                            started = time.monotonic()
+                            data = self._post("/api/generate", {
+                                "model": model,
+                                "prompt": prefix,
+                                "stream": False,
+                                "keep_alive": self.keep_alive,
+                                "options": {"temperature": 0, "num_predict": 1},
+                            })
+                            latency = time.monotonic() - started
+                    except Exception as e:
+                        self._record_error(e)
+                        raise
+                    self._record_call(latency, data)
+                context = data.get("context") or None
+            finally:
+                with self._lock:
+                    self._prefix_locks.pop(key, None)
+                    if context is not None:
+                        self._prefix_contexts[key] = context
+                        while len(self._prefix_contexts) > self.prefix_cache_size:
+                            self._prefix_contexts.popitem(last=False)
+                    else:
+                        self._remember_prefill_failure(key)
+        return context
+
+    @staticmethod
+    def _prefix_key(model: str, prefix: str) -> str:
+        return make_cache_key(model, prefix, {"prefill": True})
+
+    def _failed_recently(self, key: str) -> bool:
+        """self._lock 안에서 호출"""
+        failed_at = self._prefix_failures.get(key)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < self.prefill_failure_ttl:
+            return True
+        del self._prefix_failures[key]
+        return False
+
+    def _remember_prefill_failure(self, key: str):
+        """self._lock 안에서 호출 (만료된 항목은 이때 정리)"""
+        now = time.monotonic()
+        self._prefix_failures = {
+            k: t for k, t in self._prefix_failures.items() if now - t < self.prefill_failure_ttl
+        }
+        self._prefix_failures[key] = now
+
+    def _prefill_failed(self, model: str, prefix: str) -> bool:
+        with self._lock:
+            return self._failed_recently(self._prefix_key(model, prefix))
+
+    def _attach_prefix(self, payload: Dict[str, Any], prefix: Optional[str]):
+        """prefix의 context를 payload에 붙임 (prefill 실패 시 전체 프롬프트를 그대로 보냄)"""
+        if prefix is None:
+            return
+        try:
+            context = self.prefill(prefix, payload["model"])
+        except Exception as e:
+            print(f"[LLM] prefix 평가 실패, 전체 프롬프트로 요청: {e}")
+            context = None
+        if context:
+            payload["context"] = context
+        else:
+            payload["prompt"] = join_prompt(prefix, payload["prompt"])
+
+    # -----------------------------
+    # 모델 로드 관리
+    # -----------------------------
+    def warmup(self, model: Optional[str] = None) -> bool:
+        """빈 프롬프트로 모델만 메모리에 올림 (실패해도 예외를 던지지 않음)"""
+        model = model or self.model
+        started = time.time()
+        try:
+            self._post("/api/generate", {"model": model, "prompt": "", "keep_alive": self.keep_alive})
+        except Exception as e:
+            print(f"[LLM] 워밍업 실패 ({model}): {e}")
+            return False
+        finally:
+            with self._lock:
+                self._warming.discard(model)
+        self._warm_models.add(model)
+        print(f"[LLM] 워밍업 완료 ({model}): {time.time() - started:.1f}s")
+        return True
+
+    def warmup_async(self, model: Optional[str] = None) -> Optional[threading.Thread]:
+        """백그라운드 스레드로 워밍업 (이미 로드됐거나 진행 중이면 None)"""
+        model = model or self.model
+        with self._lock:
+            if model in self._warm_models or model in self._warming:
+                return None
+            self._warming.add(model)
+        thread = threading.Thread(target=self.warmup, args=(model,), name="llm-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def unload(self, model: Optional[str] = None):
+        """keep_alive=0으로 모델을 즉시 내림"""
+        model = model or self.model
+        self._post("/api/generate", {"model": model, "prompt": "", "keep_alive": 0})
+        self._warm_models.discard(model)
+
+    def close(self):
+        self.session.close()
+
+
+_CLIENT: Optional[LlamaClient] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_client() -> LlamaClient:
+    """프로세스 공유 클라이언트 (최초 호출 시 환경 변수로 생성)"""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = LlamaClient.from_env()
+    return _CLIENT
+
+
+def set_client(client: Optional[LlamaClient]):
+    """공유 클라이언트 교체 (테스트/대체 백엔드용, None이면 다음 호출 시 재생성)"""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        _CLIENT = client
+
+
+def query_llm(
+    prompt: str,
+    model: Optional[str] = None,
+    max_tokens: int = 512,
+    prefix: Optional[str] = None,
+    format: Optional[Union[str, Dict[str, Any]]] = None,
+    use_cache: bool = True,
+    accept: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """공유 클라이언트로 생성 요청 (model 기본값은 클라이언트 설정, 기본 llama3.2:3b)"""
+    return get_client().generate(
+        prompt, model=model, max_tokens=max_tokens, prefix=prefix, format=format, use_cache=use_cache, accept=accept
+    )
 
-    response = requests.post(url, json=payload)
-    response.raise_for_status()
 
-    return response.json()["response"]
\ No newline at end of file
+def query_llm_stream(
+    prompt: str,
+    model: Optional[str] = None,
+    max_tokens: int = 512,
+    on_partial: Optional[Callable[[str, str], Optional[bool]]] = None,
+    prefix: Optional[str] = None,
+    format: Optional[Union[str, Dict[str, Any]]] = None,
+    use_cache: bool = True,
+    accept: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """스트리밍 생성 요청 (on_partial이 True를 반환하면 조기 종료)"""
+    return get_client().generate_stream(
+        prompt, model=model, max_tokens=max_tokens, on_partial=on_partial, prefix=prefix, format=format,
+        use_cache=use_cache, accept=accept,
+    )
@@ -1,7 +1,7 @@
 from core.models.announcer.announcer import Announcer
 from core.models.announcer.event import Event
 from core.models.announcer.news import Media
-from core.models.config.generator import get_internal_params, build_entities_from_params
+from core.models.config.generator import get_internal_params, build_entities_from_params, entities_to_market_params
 from core.models.coach.coach import Coach
 from core.models.main_model import main_model
 from core.models.simulation_engine import SimulationEngine, SimulationSpeed
@@ -40,33 +40,7 @@ if __name__ == "__main__":
 
 	# 3) 시뮬레이션 엔진 초기화
 	# entity_params를 딕셔너리로 변환
-	market_params_dict = {
-		"public": {
-			"consumer_index": entity_params["public"].consumer_index,
-			"risk_appetite": entity_params["public"].risk_appetite,
-			"news_sensitivity": entity_params["public"].news_sensitivity,
-		},
-		"company": {
-			"industry": entity_params["company"].industry,
-			"orientation": entity_params["company"].orientation,
-			"size": entity_params["company"].size,
-			"rnd_focus": entity_params["company"].rnd_focus,
-			"volatility": entity_params["company"].volatility,
-		},
-		"government": {
-			"policy_direction": entity_params["government"].policy_direction,
-			"interest_rate": entity_params["government"].interest_rate,
-			"tax_policy": entity_params["government"].tax_policy,
-			"industry_support": entity_params["government"].industry_support,
-		},
-		"news": {
-			"bias": entity_params["news"].bias,
-			"credibility": entity_params["news"].credibility,
-			"impact_level": entity_params["news"].impact_level,
-			"category": entity_params["news"].category,
-			"sentiment": entity_params["news"].sentiment,
-		}
-	}
+	market_params_dict = entities_to_market_params(entity_params)
 	
 	initial_data = {
 		"stocks": {
@@ -4,13 +4,17 @@ from decimal import Decimal
 import json
 import threading
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from django.http import JsonResponse
 from .models import Portfolio, Stock, Position, Transaction, Watchlist
 from core.models.simulation_engine import SimulationEngine, SimulationSpeed
-from core.models.config.generator import get_internal_params, build_entities_from_params
+from core.models.config.generator import get_internal_params, build_entities_from_params, entities_to_market_params
 from utils.id_generator import generate_id
+from utils.llm_scheduler import get_llm_scheduler
+from utils.llm_telemetry import get_llm_telemetry
+from utils.process_stats import get_process_usage
 from utils.logger import save_event_log, save_market_snapshot
+from utils.write_behind import get_write_queue
 from data.parameter_templates import get_initial_data
 
 
@@ -326,6 +330,7 @@ class SimulationService:
         "media_bias_scale": 1.0,
         "media_credibility_scale": 1.0,
         "price_volatility_scale": 1.0,
+        "sector_spillover_weight": 0.0,
     }
     
     @classmethod
@@ -340,33 +345,7 @@ class SimulationService:
             entity_params = build_entities_from_params(raw_params)
             
             # entity_params를 딕셔너리로 변환
-            market_params_dict = {
-                "public": {
-                    "consumer_index": entity_params["public"].consumer_index,
-                    "risk_appetite": entity_params["public"].risk_appetite,
-                    "news_sensitivity": entity_params["public"].news_sensitivity,
-                },
-                "company": {
-                    "industry": entity_params["company"].industry,
-                    "orientation": entity_params["company"].orientation,
-                    "size": entity_params["company"].size,
-                    "rnd_focus": entity_params["company"].rnd_focus,
-                    "volatility": entity_params["company"].volatility,
-                },
-                "government": {
-                    "policy_direction": entity_params["government"].policy_direction,
-                    "interest_rate": entity_params["government"].interest_rate,
-                    "tax_policy": entity_params["government"].tax_policy,
-                    "industry_support": entity_params["government"].industry_support,
-                },
-                "news": {
-                    "bias": entity_params["news"].bias,
-                    "credibility": entity_params["news"].credibility,
-                    "impact_level": entity_params["news"].impact_level,
-                    "category": entity_params["news"].category,
-                    "sentiment": entity_params["news"].sentiment,
-                }
-            }
+            market_params_dict = entities_to_market_params(entity_params)
             
             # 초기 주가 데이터
             initial_data = {
@@ -418,6 +397,7 @@ class SimulationService:
             cls._background_simulation.sim_id = "background-sim"
             cls._background_simulation.set_speed(SimulationSpeed.FAST)
             cls._background_simulation.set_event_generation_interval(10)  # 10초마다 이벤트 생성
+            cls._background_simulation.enable_event_pool(per_category=3)  # 카테고리별 사건 3개씩 미리 생성
             
             # 백그라운드 스레드 시작
             cls._background_thread = threading.Thread(
@@ -445,6 +425,7 @@ class SimulationService:
                 # 보류 중인 설정이 있으면 다음 틱에 반영
                 try:
                     cls._background_simulation.price_volatility_scale = float(cls._pending_settings.get("price_volatility_scale", 1.0))
+                    cls._background_simulation.sector_spillover_weight = float(cls._pending_settings.get("sector_spillover_weight", 0.0))
                     # 언론 파라미터 스케일은 엔진 내부 cred 사용처에서 곱해 주기 위해 market_params에도 반영
                     mp = cls._background_simulation.market_params
                     if "news" in mp:
@@ -514,15 +495,18 @@ class SimulationService:
                 'recent_news': current_state['recent_news'],
                 'settings': {
                     'price_volatility_scale': getattr(cls._background_simulation, 'price_volatility_scale', 1.0),
+                    'sector_spillover_weight': getattr(cls._background_simulation, 'sector_spillover_weight', 0.0),
                     'media_bias_scale': cls._pending_settings.get('media_bias_scale', 1.0),
                     'media_credibility_scale': cls._pending_settings.get('media_credibility_scale', 1.0),
-                }
+                },
+                'llm_scheduler': get_llm_scheduler().stats(),
+                'llm': get_llm_telemetry().snapshot(cls._background_simulation.sim_id),
             }
         except Exception as e:
             return {'error': str(e)}
 
     @classmethod
-    def update_background_settings(cls, *, media_bias_scale: float = None, media_credibility_scale: float = None, price_volatility_scale: float = None) -> dict:
+    def update_background_settings(cls, *, media_bias_scale: float = None, media_credibility_scale: float = None, price_volatility_scale: float = None, sector_spillover_weight: float = None) -> dict:
         """다음 틱부터 반영될 관리자 설정 업데이트"""
         try:
             if media_bias_scale is not None:
@@ -531,6 +515,8 @@ class SimulationService:
                 cls._pending_settings["media_credibility_scale"] = float(media_credibility_scale)
             if price_volatility_scale is not None:
                 cls._pending_settings["price_volatility_scale"] = float(price_volatility_scale)
+            if sector_spillover_weight is not None:
+                cls._pending_settings["sector_spillover_weight"] = max(0.0, float(sector_spillover_weight))
             return {"success": True, "message": "설정이 업데이트되었으며 다음 틱부터 반영됩니다."}
         except Exception as e:
             return {"success": False, "message": str(e)}
@@ -549,8 +535,9 @@ class SimulationService:
                     cls._active_simulations[simulation_id]['status'] = 'running'
                     return {'success': True, 'message': f'시뮬레이션 {simulation_id}가 재개되었습니다.'}
                 elif current_status in ['stopped', 'error']:
-                    # 정지된 상태라면 기존 데이터 정리 후 새로 시작
+                    # 정지된 상태라면 기존 데이터(LLM 통계 포함) 정리 후 새로 시작
                     del cls._active_simulations[simulation_id]
+                    get_llm_telemetry().drop_simulation(simulation_id)
             
             # 시뮬레이션 데이터 초기화
             cls._active_simulations[simulation_id] = {
@@ -635,6 +622,7 @@ class SimulationService:
         elapsed_time = datetime.now() - sim_data['start_time']
         elapsed_hours = int(elapsed_time.total_seconds() // 3600)
         elapsed_minutes = int((elapsed_time.total_seconds() % 3600) // 60)
+        engine = sim_data.get('engine')
         
         return {
             'simulation_id': simulation_id,
@@ -645,9 +633,12 @@ class SimulationService:
             'total_news': sim_data['total_news'],
             'last_event_time': sim_data['last_event_time'].isoformat() if sim_data['last_event_time'] else None,
             'performance': {
-                'cpu_usage': '45%',  # 실제로는 시스템 모니터링 필요
-                'memory_usage': '2.3GB',
-                'events_per_minute': sim_data['total_events'] / max(1, elapsed_time.total_seconds() / 60)
+                **get_process_usage(),  # 서버 프로세스 전체 (시뮬레이션들이 한 프로세스에서 돎)
+                'events_per_minute': sim_data['total_events'] / max(1, elapsed_time.total_seconds() / 60),
+                'llm_scheduler': get_llm_scheduler().stats(),  # 전체 시뮬레이션이 공유하는 LLM 대기열
+                'llm': get_llm_telemetry().snapshot(simulation_id),  # 프롬프트 유형별/이 시뮬레이션의 LLM 지연·토큰 통계
+                'near_duplicates': engine.near_duplicate_stats() if engine else None,  # 근접 중복 사건 재생성/기사 재사용
+                'firestore_writes': get_write_queue().stats(),  # 쓰기 지연 큐 (대기/commit/대체/폐기 건수)
             }
         }
     
@@ -670,6 +661,7 @@ class SimulationService:
                 print(f"허용 카테고리: {settings.get('allowed_categories', [])}")
             
             engine = SimulationEngine(initial_data)
+            engine.sim_id = simulation_id
             
             # 관리자 대시보드 설정 적용
             news_enabled = settings.get('news_generation_enabled', True)
@@ -680,6 +672,8 @@ class SimulationService:
             engine.enable_news_generation(news_enabled)
             engine.set_event_generation_interval(event_interval)
             engine.set_allowed_categories(allowed_categories)
+            engine.enable_event_pool(per_category=settings.get('event_pool_per_category', 3))
+            engine.set_near_duplicate_mode(settings.get('near_duplicate_mode', 'reuse'))
             
             # 시뮬레이션 속도 설정
             if simulation_speed == 1:
@@ -782,12 +776,46 @@ class SimulationService:
             # 시뮬레이션 종료
             final_status = 'stopped' if cls._active_simulations[simulation_id]['status'] == 'stopping' else 'error'
             cls._active_simulations[simulation_id]['status'] = final_status
+            # 아직 commit되지 않은 이벤트 로그/스냅샷/기사를 내보냄
+            if not get_write_queue().flush(timeout=10):
+                print(f"시뮬레이션 {simulation_id} 종료 - 저장 대기 중인 쓰기가 남아 있습니다: {get_write_queue().stats()}")
             print(f"시뮬레이션 {simulation_id} 종료 - 상태: {final_status}")
             
         except Exception as e:
             cls._active_simulations[simulation_id]['status'] = 'error'
             print(f"시뮬레이션 오류 ({simulation_id}): {str(e)}")
     
+    @classmethod
+    def _get_engine(cls, simulation_id):
+        """시뮬레이션 ID로 실행 중인 엔진 조회 (백그라운드 시뮬레이션 포함)"""
+        background = cls._background_simulation
+        if background is not None and getattr(background, 'sim_id', None) == simulation_id:
+            return background
+        sim_data = cls._active_simulations.get(simulation_id)
+        if sim_data:
+            return sim_data.get('engine')
+        return None
+    
+    @classmethod
+    def get_active_events_for_ticker(cls, simulation_id, ticker):
+        """종목에 현재 영향을 주는 이벤트 목록 (엔진 역색인 기반), 엔진이 없으면 None"""
+        engine = cls._get_engine(simulation_id)
+        if engine is None:
+            return None
+        
+        window = timedelta(seconds=engine.EVENT_ACTIVE_SECONDS)
+        return [{
+            'id': sim_event.id,
+            'event_type': sim_event.event.event_type,
+            'category': sim_event.event.category,
+            'sentiment': sim_event.event.sentiment,
+            'impact_level': sim_event.event.impact_level,
+            'duration': sim_event.event.duration,
+            'market_impact': sim_event.market_impact,
+            'simulation_time': sim_event.timestamp.isoformat(),
+            'expires_at': (sim_event.timestamp + window).isoformat(),
+        } for sim_event in engine.get_active_events_for_ticker(ticker)]
+    
     @classmethod
     def get_all_simulation_status(cls):
         """모든 시뮬레이션 상태 조회"""
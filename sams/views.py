@@ -18,6 +18,10 @@ from utils.logger import (
     get_event_log,
     get_recent_events_for_context
 )
+from utils.sim_log import LogRingBuffer, find_log_buffer
+from utils.llm_telemetry import get_llm_telemetry
+from utils.process_stats import get_process_usage
+from core.models.event_dedup import NEAR_DUPLICATE_MODES
 
 def landing(request):
     return render(request, 'landing.html')
@@ -169,9 +173,9 @@ def get_simulation_control_status(request):
                     'total_news': 0,
                     'last_event_time': None,
                     'performance': {
-                        'cpu_usage': '0%',
-                        'memory_usage': '0GB',
-                        'events_per_minute': 0
+                        **get_process_usage(),
+                        'events_per_minute': 0,
+                        'llm': get_llm_telemetry().snapshot(sim_id),
                     }
                 }
             })
@@ -194,37 +198,24 @@ def get_simulation_logs(request):
     
     try:
         sim_id = request.GET.get('simulation_id', 'default-sim')
-        limit = int(request.GET.get('limit', 50))
-        
-        # 실제로는 시뮬레이션 로그를 조회
-        # 여기서는 예시 데이터 반환
+        limit = max(1, min(int(request.GET.get('limit', 50)), 500))
+        level = request.GET.get('level', 'INFO')
+        cursor = request.GET.get('cursor')
+        cursor = int(cursor) if cursor not in (None, '') else None
         
-        logs = [
-            {
-                'timestamp': '2024-01-15T12:30:00Z',
-                'level': 'INFO',
-                'message': '새로운 이벤트 생성: AI 칩 수요 폭증',
-                'event_id': 'event-123'
-            },
-            {
-                'timestamp': '2024-01-15T12:29:45Z',
-                'level': 'INFO',
-                'message': '뉴스 기사 생성 완료: 조선일보, 한겨레, 매일경제',
-                'event_id': 'event-122'
-            },
-            {
-                'timestamp': '2024-01-15T12:29:30Z',
-                'level': 'WARNING',
-                'message': 'LLM 응답 지연: 3초',
-                'event_id': None
-            }
-        ]
+        # 시뮬레이션별 로그 링 버퍼에서 조회 (최신순, cursor 이후 항목만; 조회만으로 버퍼를 만들지 않음)
+        buffer = find_log_buffer(sim_id)
+        if buffer is None:
+            buffer = LogRingBuffer(capacity=0, echo=False)
+        logs, next_cursor = buffer.query(min_level=level, cursor=cursor, limit=limit)
         
         return JsonResponse({
             'success': True,
             'data': {
                 'logs': logs,
-                'total_count': len(logs)
+                'total_count': len(logs),
+                'cursor': next_cursor,
+                'buffer': buffer.stats()
             }
         })
     except Exception as e:
@@ -242,6 +233,13 @@ def update_simulation_settings(request):
     try:
         data = json.loads(request.body)
         
+        near_duplicate_mode = data.get('near_duplicate_mode', 'reuse')
+        if near_duplicate_mode not in NEAR_DUPLICATE_MODES:
+            return JsonResponse({
+                'success': False,
+                'message': f'near_duplicate_mode는 {", ".join(NEAR_DUPLICATE_MODES)} 중 하나여야 합니다.'
+            })
+        
         # 설정 업데이트 로직
         settings = {
             'event_generation_interval': data.get('event_generation_interval', 30),
@@ -249,6 +247,7 @@ def update_simulation_settings(request):
             'max_events_per_hour': data.get('max_events_per_hour', 10),
             'simulation_speed': data.get('simulation_speed', 2),
             'allowed_categories': data.get('allowed_categories', ['경제', '정책', '기업', '기술', '국제']),
+            'near_duplicate_mode': near_duplicate_mode,
             'market_params': data.get('market_params', {})
         }
         
@@ -472,6 +471,41 @@ def get_recent_events(request):
             'message': f'이벤트 목록 조회 중 오류가 발생했습니다: {str(e)}'
         })
 
+@login_required
+def get_events_for_ticker(request):
+    """특정 종목에 현재 영향을 주는 이벤트 조회 API (실행 중인 엔진의 역색인 사용)"""
+    try:
+        sim_id = request.GET.get('simulation_id', 'default-sim')
+        ticker = request.GET.get('ticker')
+        
+        if not ticker:
+            return JsonResponse({
+                'success': False,
+                'message': 'ticker가 필요합니다.'
+            })
+        
+        events = SimulationService.get_active_events_for_ticker(sim_id, ticker)
+        if events is None:
+            return JsonResponse({
+                'success': False,
+                'message': f'시뮬레이션 {sim_id}가 실행 중이 아닙니다.'
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'data': {
+                'ticker': ticker,
+                'events': events,
+                'total_count': len(events)
+            }
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'success': False, 
+            'message': f'종목별 이벤트 조회 중 오류가 발생했습니다: {str(e)}'
+        })
+
 @login_required
 def get_event_detail(request):
     """특정 이벤트 상세 정보 조회 API"""
@@ -837,10 +871,12 @@ def update_background_parameters(request):
         media_bias_scale = body.get('media_bias_scale')
         media_credibility_scale = body.get('media_credibility_scale')
         price_volatility_scale = body.get('price_volatility_scale')
+        sector_spillover_weight = body.get('sector_spillover_weight')
         result = SimulationService.update_background_settings(
             media_bias_scale=media_bias_scale,
             media_credibility_scale=media_credibility_scale,
             price_volatility_scale=price_volatility_scale,
+            sector_spillover_weight=sector_spillover_weight,
         )
         return JsonResponse(result)
     except Exception as e:
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+LLM 경로 벤치마크: SimulationEngine → Announcer → LlamaClient 전체를 돌려 사건/분, 기사/분을 측정.
+기본은 프로세스 내 가짜 LLM(utils.fake_llm)을 사용하므로 Ollama 없이 오프라인/CI에서 실행된다.
+이벤트 로그/기사 저장은 메모리 저장소로 대체한다 (Firestore 없이 뉴스 경로가 이벤트 로그를 읽을 수 있도록,
+그리고 벤치마크가 실제 데이터를 오염시키지 않도록).
+
+예)
+	python scripts/bench_llm_pipeline.py --events 30 --latency 0.3 --tokens-per-sec 40
+	python scripts/bench_llm_pipeline.py --mode realtime --duration 60 --event-pool 3
+	python scripts/bench_llm_pipeline.py --url http://localhost:11434   # 실제 Ollama 또는 fake_llm 서버
+"""
+import argparse
+import contextlib
+import io
+import json
+from pathlib import Path
+import sys
+import os
+import threading
+import time
+
+# Ensure project root (parent of scripts/) is on sys.path
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+	sys.path.insert(0, PROJECT_ROOT)
+
+import core.models.announcer.announcer as announcer_module
+import core.models.simulation_engine as engine_module
+from core.models.announcer.announcer import Announcer
+from core.models.simulation_engine import ClockMode, SimulationEngine, SimulationSpeed
+from data.parameter_templates import get_initial_data
+from llama_client import LlamaClient, set_client
+from utils.fake_llm import FakeLLM, install_fake_llm
+from utils.llm_scheduler import get_llm_scheduler
+from utils.llm_telemetry import get_llm_telemetry
+
+
+class MemoryEventStore:
+	"""이벤트 로그/스냅샷/기사 저장 함수를 메모리 구현으로 교체 (utils.logger와 같은 시그니처)"""
+
+	def __init__(self):
+		self._lock = threading.Lock()
+		self.events = {}
+		self.articles = 0
+
+	def save_event_log(self, sim_id, *, event_id, event_payload, affected_stocks, market_impact, simulation_time, meta=None):
+		with self._lock:
+			self.events.setdefault(sim_id, {})[event_id] = {
+				"event": event_payload,
+				"affected_stocks": affected_stocks,
+				"market_impact": float(market_impact),
+				"simulation_time": simulation_time.isoformat(),
+				"meta": meta or {},
+			}
+		return event_id
+
+	def save_market_snapshot(self, sim_id, **kwargs):
+		return "snapshot"
+
+	def get_event_log(self, sim_id, event_id):
+		with self._lock:
+			return self.events.get(sim_id, {}).get(event_id)
+
+	def get_recent_events_for_context(self, sim_id, limit=5):
+		with self._lock:
+			return list(self.events.get(sim_id, {}).values())[-limit:][::-1]
+
+	def save_news_article(self, sim_id, **kwargs):
+		with self._lock:
+			self.articles += 1
+		return kwargs.get("news_id")
+
+	def install(self):
+		engine_module.save_event_log = self.save_event_log
+		engine_module.save_market_snapshot = self.save_market_snapshot
+		engine_module.save_news_article = self.save_news_article
+		announcer_module.get_event_log = self.get_event_log
+		announcer_module.get_recent_events_for_context = self.get_recent_events_for_context
+		announcer_module.save_news_article = self.save_news_article
+
+
+def build_engine(args) -> SimulationEngine:
+	engine = SimulationEngine(get_initial_data())
+	engine.sim_id = "bench-sim"
+	engine.announcer = Announcer(
+		news_concurrency=args.news_concurrency,
+		news_batch_size=args.batch_size,
+		news_latency_budget=args.latency_budget,
+		use_streaming=not args.no_stream,
+		reuse_prefix=not args.no_prefix_reuse,
+	)
+	engine.set_speed(SimulationSpeed.NORMAL)
+	engine.set_event_generation_interval(args.event_interval)
+	engine.set_near_duplicate_mode(args.near_duplicate_mode)
+	return engine
+
+
+def run_virtual(engine: SimulationEngine, n_events: int) -> float:
+	"""가상 시계: 스텝마다 사건 1건 (사건 생성 → 저장 → 기사 생성이 모두 동기)"""
+	engine.set_clock_mode(ClockMode.VIRTUAL)
+	engine.set_event_generation_interval(1)
+	engine.start()
+	t0 = time.perf_counter()
+	engine.advance(n_events)
+	elapsed = time.perf_counter() - t0
+	engine.stop()
+	return elapsed
+
+
+def run_realtime(engine: SimulationEngine, duration: float, event_pool: int) -> float:
+	"""실시간 시계: 백그라운드 사건 생산자(또는 이벤트 풀) + 후처리 스레드로 duration초 동안 실행"""
+	if event_pool > 0:
+		engine.enable_event_pool(per_category=event_pool, batch_size=event_pool)
+	engine.start()
+	t0 = time.perf_counter()
+	while time.perf_counter() - t0 < duration:
+		engine.update()
+		time.sleep(0.05)
+	elapsed = time.perf_counter() - t0
+	engine.stop()
+	return elapsed
+
+
+def main():
+	parser = argparse.ArgumentParser(description="LLM 경로 벤치마크 (사건/분, 기사/분)")
+	parser.add_argument("--mode", type=str, default="virtual", choices=["virtual", "realtime"])
+	parser.add_argument("--events", type=int, default=20, help="virtual 모드에서 생성할 사건 수")
+	parser.add_argument("--duration", type=float, default=30.0, help="realtime 모드 실행 시간(초)")
+	parser.add_argument("--event-interval", type=int, default=1, help="realtime 모드 사건 생성 간격(초)")
+	parser.add_argument("--event-pool", type=int, default=0, help="realtime 모드 카테고리당 사전 생성 사건 수 (0이면 단건 생산자)")
+	parser.add_argument("--no-news", action="store_true", help="기사 생성 끔 (사건 경로만 측정)")
+	parser.add_argument("--near-duplicate-mode", type=str, default="reuse", choices=list(SimulationEngine.NEAR_DUPLICATE_MODES))
+	# Announcer 설정
+	parser.add_argument("--batch-size", type=int, default=None, help="LLM 1회 호출로 생성할 언론사 수")
+	parser.add_argument("--news-concurrency", type=int, default=None)
+	parser.add_argument("--latency-budget", type=float, default=None, help="사건당 기사 생성 시간 예산(초)")
+	parser.add_argument("--no-stream", action="store_true")
+	parser.add_argument("--no-prefix-reuse", action="store_true")
+	parser.add_argument("--cache", action="store_true", help="LLM 응답 캐시 사용 (기본: 끔, 매 호출이 LLM까지 가도록)")
+	# 백엔드
+	parser.add_argument("--url", type=str, default=None, help="실제 /api/generate 엔드포인트 (없으면 프로세스 내 가짜 LLM)")
+	parser.add_argument("--latency", type=float, default=0.2, help="가짜 LLM 요청당 평균 지연(초)")
+	parser.add_argument("--jitter", type=float, default=0.3, help="가짜 LLM 지연 로그정규 분산")
+	parser.add_argument("--tokens-per-sec", type=float, default=60.0, help="가짜 LLM 생성 속도 (0이면 즉시)")
+	parser.add_argument("--malformed-rate", type=float, default=0.0)
+	parser.add_argument("--failure-rate", type=float, default=0.0)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--out", type=str, default=None, help="결과 JSON 저장 경로")
+	args = parser.parse_args()
+
+	cache = None
+	if args.cache:
+		from utils.llm_cache import LLMCache
+		cache = LLMCache()
+	fake = None
+	if args.url:
+		set_client(LlamaClient(base_url=args.url, cache=cache, scheduler=get_llm_scheduler(), telemetry=get_llm_telemetry()))
+	else:
+		fake = FakeLLM(
+			latency=args.latency,
+			jitter=args.jitter,
+			tokens_per_sec=args.tokens_per_sec,
+			malformed_rate=args.malformed_rate,
+			failure_rate=args.failure_rate,
+			seed=args.seed,
+		)
+		install_fake_llm(fake, cache=cache, scheduler=get_llm_scheduler(), telemetry=get_llm_telemetry())
+
+	store = MemoryEventStore()
+	store.install()
+	engine = build_engine(args)
+	engine.enable_news_generation(not args.no_news)
+
+	# 엔진/Announcer의 진행 로그(print)는 결과 출력과 섞이지 않게 버림
+	with contextlib.redirect_stdout(io.StringIO()):
+		if args.mode == "virtual":
+			elapsed = run_virtual(engine, args.events)
+		else:
+			elapsed = run_realtime(engine, args.duration, args.event_pool)
+
+	events = len(engine.events_history)
+	articles = len(engine.news_history)
+	llm = get_llm_telemetry().snapshot(engine.sim_id)
+	minutes = max(elapsed, 1e-9) / 60
+	result = {
+		"mode": args.mode,
+		"backend": args.url or "fake",
+		"elapsed_sec": round(elapsed, 3),
+		"events": events,
+		"articles": articles,
+		"events_per_min": round(events / minutes, 2),
+		"articles_per_min": round(articles / minutes, 2),
+		"llm": llm["totals"],
+		"llm_by_prompt_type": llm["by_prompt_type"],
+		"near_duplicates": engine.near_duplicate_stats(),
+		"fake_llm": fake.stats() if fake else None,
+	}
+
+	totals = llm["totals"]
+	print(f"mode={args.mode} backend={result['backend']} elapsed={elapsed:.2f}s")
+	print(f"events={events} ({result['events_per_min']}/min)  articles={articles} ({result['articles_per_min']}/min)")
+	print(f"llm calls={totals['calls']} p50={totals['latency_ms_p50']}ms p95={totals['latency_ms_p95']}ms "
+		  f"tokens/s={totals['tokens_per_sec']} errors={totals['errors']} fallbacks={totals['fallbacks']}")
+
+	if args.out:
+		out_path = Path(args.out)
+		out_path.parent.mkdir(parents=True, exist_ok=True)
+		with out_path.open("w", encoding="utf-8") as f:
+			json.dump(result, f, ensure_ascii=False, indent=2)
+		print(f"saved: {out_path}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+import argparse
+import json
+from pathlib import Path
+import sys
+import os
+import time
+
+# Ensure project root (parent of scripts/) is on sys.path
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+if PROJECT_ROOT not in sys.path:
+	sys.path.insert(0, PROJECT_ROOT)
+
+from core.models.ensemble import run_ensemble
+from core.models.simulation_engine import SimulationSpeed
+
+
+def main():
+	parser = argparse.ArgumentParser(description="몬테카를로 앙상블 시뮬레이션 (오프라인, 합성 이벤트)")
+	parser.add_argument("--scenario", type=str, default="default", help="SCENARIO_TEMPLATES 키")
+	parser.add_argument("--seed-start", type=int, default=0)
+	parser.add_argument("--paths", type=int, default=16, help="경로 수 K (시드 seed-start ~ seed-start+K-1)")
+	parser.add_argument("--steps", type=int, default=48, help="경로당 가상 시계 스텝 수")
+	parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+	parser.add_argument("--speed", type=str, default="NORMAL", choices=[s.name for s in SimulationSpeed])
+	parser.add_argument("--event-interval", type=int, default=5)
+	parser.add_argument("--out", type=str, default=None, help="결과 JSON 저장 경로 (밴드/최종 통계)")
+	args = parser.parse_args()
+
+	seeds = range(args.seed_start, args.seed_start + args.paths)
+	t0 = time.perf_counter()
+	result = run_ensemble(
+		scenario=args.scenario,
+		seeds=seeds,
+		n_steps=args.steps,
+		max_workers=args.workers,
+		speed=SimulationSpeed[args.speed],
+		event_interval=args.event_interval,
+	)
+	elapsed = time.perf_counter() - t0
+
+	print(f"scenario={args.scenario} paths={len(result['seeds'])} steps={args.steps} elapsed={elapsed:.2f}s")
+	print(f"{'ticker':<8} {'p5':>12} {'p50':>12} {'p95':>12} {'mean_ret':>9} {'P(up)':>6}")
+	for ticker, stats in result["terminal"].items():
+		print(f"{ticker:<8} {stats['p5']:>12,.0f} {stats['p50']:>12,.0f} {stats['p95']:>12,.0f} "
+			  f"{stats['mean_return']:>+9.2%} {stats['prob_up']:>6.2f}")
+
+	if args.out:
+		out_path = Path(args.out)
+		out_path.parent.mkdir(parents=True, exist_ok=True)
+		payload = {
+			"scenario": result["scenario"],
+			"seeds": result["seeds"],
+			"tickers": result["tickers"],
+			"times": [t.isoformat() for t in result["times"]],
+			"events_per_path": result["events_per_path"],
+			"bands": result["bands"],
+			"terminal": result["terminal"],
+		}
+		with out_path.open("w", encoding="utf-8") as f:
+			json.dump(payload, f, ensure_ascii=False, indent=2)
+		print(f"saved: {out_path}")
+
+
+if __name__ == "__main__":
+	main()
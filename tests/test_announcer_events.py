@@ -0,0 +1,64 @@
+import json
+import unittest
+
+from core.models.announcer.announcer import Announcer
+from core.models.announcer.prompt_builder import build_event_schema
+
+
+def _event(title, category="기술", **overrides):
+    item = {"event_type": title, "category": category, "sentiment": 0.4, "impact_level": 3, "duration": "mid"}
+    item.update(overrides)
+    return item
+
+
+class TestStructuredEvents(unittest.TestCase):
+    def _announcer(self, replies):
+        calls = []
+
+        def fake_query(prompt, kind, json_expected, max_tokens=512, prefix=None, format=None,
+                       use_cache=True, accept=None):
+            calls.append((prompt, format, use_cache, accept))
+            return replies.pop(0)
+
+        announcer = Announcer(structured_output=True)
+        announcer._query_llm = fake_query
+        return announcer, calls
+
+    def test_only_invalid_items_are_requested_again(self):
+        announcer, calls = self._announcer([
+            json.dumps([_event("A"), _event("B", category="스포츠"), _event("C", sentiment=3.0)]),
+            json.dumps([_event("D"), _event("E")]),
+        ])
+        events = announcer.generate_events(count=3, allowed_categories=["기술", "금융"])
+
+        self.assertEqual([e.event_type for e in events], ["A", "D", "E"])
+        self.assertEqual(len(calls), 2)
+        first_prompt, first_format, first_cached, accept = calls[0]
+        second_prompt, second_format, second_cached, _ = calls[1]
+        self.assertIn("새 사건 3개", first_prompt)
+        self.assertEqual(first_format["items"]["properties"]["category"]["enum"], ["기술", "금융"])
+        self.assertIn("새 사건 2개", second_prompt)
+        self.assertEqual(second_format["maxItems"], 2)
+        # 검증 실패한 첫 응답은 캐시에 저장되지 않고, 재시도는 캐시를 거치지 않음
+        self.assertEqual((first_cached, second_cached), (True, False))
+        self.assertFalse(accept(json.dumps([_event("A"), _event("B", category="스포츠"), _event("C")])))
+        self.assertTrue(accept(json.dumps([_event("A"), _event("B"), _event("C")])))
+
+    def test_truncated_response_keeps_complete_items_then_falls_back(self):
+        truncated = json.dumps([_event("A"), _event("B")], ensure_ascii=False)[:-30]
+        announcer, calls = self._announcer([truncated, "죄송합니다, 생성할 수 없습니다."])
+        events = announcer.generate_events(count=2, allowed_categories=["기술"])
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(events[0].event_type, "A")
+        self.assertEqual(len(events), 2)  # 나머지 1개는 합성 사건
+
+    def test_schema_pins_count_and_ranges(self):
+        schema = build_event_schema(2)
+        self.assertEqual((schema["minItems"], schema["maxItems"]), (2, 2))
+        self.assertEqual(schema["items"]["properties"]["category"], {"type": "string"})
+        self.assertEqual(schema["items"]["properties"]["impact_level"]["maximum"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import contextlib
+import io
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+from core.models.announcer import announcer as announcer_module
+from core.models.announcer.announcer import Announcer
+from core.models.announcer.news import Media
+
+EVENT_LOG = {"event": {"event_type": "정책 금리 조정 논의", "category": "경제", "sentiment": 0.2, "impact_level": 2}}
+
+
+class TestEnvSettings(unittest.TestCase):
+    def test_invalid_values_fall_back_to_defaults(self):
+        env = {"SAMS_NEWS_CONCURRENCY": "four", "SAMS_NEWS_BATCH_SIZE": "8.5",
+               "SAMS_NEWS_LATENCY_BUDGET": "5s"}
+        with mock.patch.dict("os.environ", env), contextlib.redirect_stdout(io.StringIO()) as out:
+            announcer = Announcer(use_llm=False)
+        self.assertEqual(announcer.news_concurrency, announcer_module.DEFAULT_NEWS_CONCURRENCY)
+        self.assertEqual(announcer.news_batch_size, announcer_module.DEFAULT_NEWS_BATCH_SIZE)
+        self.assertIn("SAMS_NEWS_CONCURRENCY", out.getvalue())
+        self.assertIsNone(announcer.news_latency_budget)
+        self.assertIn("SAMS_NEWS_BATCH_SIZE", out.getvalue())
+        self.assertIn("SAMS_NEWS_LATENCY_BUDGET", out.getvalue())
+
+        with mock.patch.dict("os.environ", {"SAMS_NEWS_CONCURRENCY": "2"}):
+            self.assertEqual(Announcer(use_llm=False).news_concurrency, 2)
+        with mock.patch.dict("os.environ", {"SAMS_NEWS_LATENCY_BUDGET": "2.5"}):
+            self.assertEqual(Announcer(use_llm=False).news_latency_budget, 2.5)
+
+
+class TestNewsFanOut(unittest.TestCase):
+    def setUp(self):
+        self.outlets = [Media(f"언론{i}", 0.0, 0.8) for i in range(6)]
+        self.saved = []
+        self.methods = []
+        patches = [
+            mock.patch.object(announcer_module, "get_event_log", return_value=EVENT_LOG),
+            mock.patch.object(announcer_module, "get_recent_events_for_context", return_value=[]),
+            mock.patch.object(announcer_module, "save_news_article", side_effect=self._record_save),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _record_save(self, **kw):
+        self.saved.append(kw["media_name"])
+        self.methods.append(kw["meta"]["generation_method"])
+
+    def _generate(self, announcer):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return announcer.generate_news_for_event_from_firestore("sim", "event-1", self.outlets)
+
+    def test_outlets_run_concurrently_and_keep_order(self):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow_article(event_log, outlet, recent_events):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            return f"{outlet.name} 기사"
+
+        announcer = Announcer(news_concurrency=3, news_batch_size=1)
+        announcer.generate_news_from_event_log = slow_article
+        news = self._generate(announcer)
+
+        self.assertEqual([n.media for n in news], [o.name for o in self.outlets])
+        self.assertEqual([n.article_text for n in news], [f"{o.name} 기사" for o in self.outlets])
+        self.assertEqual(state["peak"], 3)
+        self.assertEqual(sorted(self.saved), sorted(o.name for o in self.outlets))
+
+    def test_failed_outlet_falls_back_to_synthetic_article(self):
+        def flaky(event_log, outlet, recent_events):
+            if outlet.name == "언론2":
+                raise RuntimeError("timeout")
+            return "ok"
+
+        announcer = Announcer(news_concurrency=4, news_batch_size=1)
+        announcer.generate_news_from_event_log = flaky
+        news = self._generate(announcer)
+        self.assertEqual(len(news), len(self.outlets))
+        self.assertNotEqual(news[2].article_text, "ok")
+        self.assertTrue(news[2].article_text)
+
+    def test_batch_mode_uses_one_call_per_batch(self):
+        prompts = []
+
+        def fake_query(prompt, kind, json_expected, max_tokens=512, prefix=None):
+            prompts.append(prefix + prompt)
+            names = [o.name for o in self.outlets if f"- 이름: {o.name} /" in prompt]
+            return json.dumps({"articles": [
+                {"outlet": name, "news_article": f"{name}의 기사 본문입니다. " * 5} for name in names
+            ]}, ensure_ascii=False)
+
+        announcer = Announcer(news_concurrency=2, news_batch_size=4)
+        announcer._query_llm = fake_query
+        news = self._generate(announcer)
+
+        self.assertEqual(len(prompts), 2)
+        self.assertEqual(prompts[0].count("정책 금리 조정 논의"), 1)
+        self.assertEqual([n.media for n in news], [o.name for o in self.outlets])
+        self.assertTrue(all(n.article_text.startswith(f"{n.media}의 기사") for n in news))
+        self.assertEqual(sorted(self.saved), sorted(o.name for o in self.outlets))
+
+    def test_batch_mode_falls_back_only_for_missing_entries(self):
+        body = "금리 조정 논의가 시장에 미칠 영향을 두고 전문가들의 해석이 엇갈리고 있습니다. " * 2
+        reply = json.dumps({"articles": [
+            {"outlet": "언론0", "news_article": body},
+            {"outlet": "언론1", "news_article": "짧음"},
+            {"outlet": "모르는 언론", "news_article": body},
+            {"outlet": "언론3", "news_article": body},
+        ]}, ensure_ascii=False)
+
+        announcer = Announcer(news_concurrency=1, news_batch_size=8)
+        announcer._query_llm = lambda prompt, kind, json_expected, max_tokens=512, prefix=None: reply
+        news = self._generate(announcer)
+
+        synthetic = {o.name: announcer._build_synthetic_article(EVENT_LOG["event"], o, []) for o in self.outlets}
+        for item in news:
+            if item.media in ("언론0", "언론3"):
+                self.assertEqual(item.article_text, body.strip())
+            else:
+                self.assertEqual(item.article_text, synthetic[item.media])
+
+    def test_truncated_batch_reply_keeps_complete_articles(self):
+        body = "금리 조정 논의가 시장에 미칠 영향을 두고 전문가들의 해석이 엇갈리고 있습니다. " * 2
+        full = json.dumps({"articles": [
+            {"outlet": "언론0", "news_article": body},
+            {"outlet": "언론1", "news_article": body},
+            {"outlet": "언론2", "news_article": body},
+        ]}, ensure_ascii=False)
+        reply = "다음은 요청한 기사입니다.\n" + full[:full.rindex("언론2") + 20]
+
+        announcer = Announcer(news_concurrency=1, news_batch_size=8)
+        announcer._query_llm = lambda prompt, kind, json_expected, max_tokens=512, prefix=None: reply
+        news = self._generate(announcer)
+
+        self.assertEqual([n.article_text for n in news[:2]], [body.strip()] * 2)
+        synthetic = announcer._build_synthetic_article(EVENT_LOG["event"], self.outlets[2], [])
+        self.assertEqual(news[2].article_text, synthetic)
+
+    def test_batch_reply_keyed_by_outlet_name(self):
+        body = "금리 조정 논의가 시장에 미칠 영향을 두고 전문가들의 해석이 엇갈리고 있습니다. " * 2
+        reply = json.dumps({o.name: f"{o.name} {body}" for o in self.outlets}, ensure_ascii=False)
+
+        announcer = Announcer(news_concurrency=1, news_batch_size=8)
+        announcer._query_llm = lambda prompt, kind, json_expected, max_tokens=512, prefix=None: reply
+        news = self._generate(announcer)
+        self.assertEqual([n.article_text for n in news], [f"{o.name} {body}".strip() for o in self.outlets])
+
+    def test_latency_budget_switches_late_outlets_to_synthetic(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def article(event_log, outlet, recent_events):
+            if outlet.name in ("언론1", "언론4"):
+                release.wait(2)
+            return f"{outlet.name} 기사"
+
+        announcer = Announcer(news_concurrency=6, news_batch_size=1, news_latency_budget=0.1)
+        announcer.generate_news_from_event_log = article
+        started = time.perf_counter()
+        news = self._generate(announcer)
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+        for item in news:
+            if item.media in ("언론1", "언론4"):
+                self.assertNotEqual(item.article_text, f"{item.media} 기사")
+                self.assertTrue(item.article_text)
+            else:
+                self.assertEqual(item.article_text, f"{item.media} 기사")
+        self.assertEqual(self.methods.count("synthetic_latency_budget"), 2)
+        self.assertEqual(announcer.budget_fallbacks, 2)
+
+    def test_batch_latency_budget_keeps_finished_batches(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        body = "금리 조정 논의가 시장에 미칠 영향을 두고 전문가들의 해석이 엇갈리고 있습니다. " * 2
+
+        def query(prompt, kind, json_expected, max_tokens=512, prefix=None):
+            if "언론0" not in prompt:
+                release.wait(2)
+            names = [o.name for o in self.outlets if o.name in prompt]
+            return json.dumps([{"outlet": n, "news_article": f"{n} {body}"} for n in names], ensure_ascii=False)
+
+        announcer = Announcer(news_concurrency=2, news_batch_size=3, news_latency_budget=0.2)
+        announcer._query_llm = query
+        started = time.perf_counter()
+        news = self._generate(announcer)
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+        for item in news[:3]:
+            self.assertEqual(item.article_text, f"{item.media} {body}".strip())
+        for item in news[3:]:
+            self.assertNotIn(body.strip(), item.article_text)
+        self.assertEqual(self.methods.count("firestore_batch_with_fallback"), 3)
+        self.assertEqual(self.methods.count("synthetic_latency_budget"), 3)
+        self.assertEqual(announcer.budget_fallbacks, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
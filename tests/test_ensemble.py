@@ -0,0 +1,32 @@
+import unittest
+
+import numpy as np
+
+from core.models.ensemble import run_ensemble, summarize_paths
+
+
+class TestEnsemble(unittest.TestCase):
+    def test_paths_are_reproducible_per_seed(self):
+        stocks = {"005930": {"price": 79000, "volume": 1000000}, "000660": {"price": 45000, "volume": 500000}}
+        a = run_ensemble(seeds=[3, 4], n_steps=6, max_workers=1, initial_stocks=stocks)
+        b = run_ensemble(seeds=[3, 4], n_steps=6, max_workers=1, initial_stocks=stocks)
+        self.assertEqual(a["paths"].shape, (2, 7, 2))
+        self.assertEqual(a["tickers"], ["005930", "000660"])
+        np.testing.assert_allclose(a["paths"], b["paths"])
+        np.testing.assert_allclose(a["paths"][:, 0, 0], [79000, 79000])
+        self.assertTrue(all(n > 0 for n in a["events_per_path"]))
+
+    def test_summarize_paths(self):
+        paths = np.array([
+            [[100.0], [110.0]],
+            [[100.0], [90.0]],
+            [[100.0], [120.0]],
+        ])
+        summary = summarize_paths(["A"], paths)
+        self.assertAlmostEqual(summary["terminal"]["A"]["p50"], 110.0)
+        self.assertAlmostEqual(summary["terminal"]["A"]["prob_up"], 2 / 3)
+        self.assertEqual(summary["bands"]["A"]["p50"], [100.0, 110.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
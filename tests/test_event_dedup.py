@@ -0,0 +1,88 @@
+import contextlib
+import io
+import unittest
+
+from core.models.announcer.event import Event
+from core.models.announcer.news import News
+from core.models.event_dedup import NearDuplicateFilter, title_shingles
+from core.models.simulation_engine import SimulationEngine
+from data.parameter_templates import get_initial_data
+
+
+def _event(event_id, title, category="기업", sentiment=0.4):
+    return Event(id=event_id, event_type=title, category=category, sentiment=sentiment,
+                 impact_level=3, duration="mid")
+
+
+class TestNearDuplicateFilter(unittest.TestCase):
+    def test_matches_same_title_within_category_and_sentiment_bucket(self):
+        dedup = NearDuplicateFilter(window=10, threshold=0.7)
+        dedup.add(_event("e1", "주요 기업 실적 발표"))
+        self.assertEqual(dedup.find(_event("e2", "주요 기업, 실적 발표")), ("e1", 1.0))
+        self.assertIsNone(dedup.find(_event("e3", "주요 기업 실적 발표", category="기술")))
+        self.assertIsNone(dedup.find(_event("e4", "주요 기업 실적 발표", sentiment=-0.5)))
+        self.assertIsNone(dedup.find(_event("e5", "신규 공장 증설 계획")))
+        self.assertIsNone(dedup.find(_event("e1", "주요 기업 실적 발표")))  # 자기 자신 제외
+        self.assertEqual(dedup.stats()["duplicates"], 1)
+
+    def test_window_evicts_old_events(self):
+        dedup = NearDuplicateFilter(window=2)
+        dedup.add(_event("e1", "주요 기업 실적 발표"))
+        dedup.add(_event("e2", "신규 공장 증설 계획"))
+        dedup.add(_event("e3", "해외 법인 설립 추진"))
+        self.assertIsNone(dedup.find(_event("e4", "주요 기업 실적 발표")))
+        self.assertEqual(len(dedup), 2)
+
+    def test_shingles_ignore_spacing_and_punctuation(self):
+        self.assertEqual(title_shingles("정부, 지원 정책"), title_shingles("정부 지원정책"))
+
+
+class TestEngineNearDuplicates(unittest.TestCase):
+    def setUp(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.engine = SimulationEngine(get_initial_data())
+        self.engine.enable_persistence(False)
+        self.news_calls = []
+
+        def generate_news(sim_id, event_id, outlets, context_events_limit=5):
+            self.news_calls.append(event_id)
+            return [News(id=f"news-{event_id}", media="언론사 A", article_text=f"{event_id} 기사")]
+
+        self.engine.announcer.generate_news_for_event_from_firestore = generate_news
+
+    def test_reuses_articles_of_near_duplicate_event(self):
+        self.engine._apply_events([_event("e1", "주요 기업 실적 발표")], {})
+        self.engine._apply_events([_event("e2", "주요 기업 실적 발표!")], {})
+        self.engine._apply_events([_event("e3", "신규 공장 증설 계획")], {})
+
+        self.assertEqual(self.news_calls, ["e1", "e3"])
+        articles = self.engine.news_history.recent(3)
+        self.assertEqual([n.article_text for n in articles], ["e1 기사", "e1 기사", "e3 기사"])
+        self.assertNotEqual(articles[0].id, articles[1].id)
+        self.assertEqual(self.engine.near_duplicate_stats()["news_reused"], 1)
+
+    def test_off_mode_generates_news_for_every_event(self):
+        self.engine.set_near_duplicate_mode("off")
+        self.engine._apply_events([_event("e1", "주요 기업 실적 발표")], {})
+        self.engine._apply_events([_event("e2", "주요 기업 실적 발표")], {})
+        self.assertEqual(self.news_calls, ["e1", "e2"])
+        with self.assertRaises(ValueError):
+            self.engine.set_near_duplicate_mode("drop")
+
+    def test_regenerate_mode_replaces_duplicate_before_apply(self):
+        self.engine.set_near_duplicate_mode("regenerate")
+        self.engine._apply_events([_event("e1", "주요 기업 실적 발표")], {})
+        batches = [[_event("e2", "주요 기업 실적 발표"), _event("e3", "해외 법인 설립 추진")],
+                   [_event("e4", "신규 공장 증설 계획")]]
+        self.engine.announcer.generate_events = lambda **kw: batches.pop(0)
+
+        events = self.engine._generate_unique_events(count=2)
+        self.assertEqual([e.id for e in events], ["e4", "e3"])
+        self.assertEqual(self.engine.events_regenerated, 1)
+        # 적용 전 미리 보기는 통계에 들어가지 않음 (e1 적용 시 1회만)
+        stats = self.engine.near_duplicate_stats()
+        self.assertEqual((stats["checked"], stats["duplicates"]), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
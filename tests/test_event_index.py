@@ -0,0 +1,46 @@
+import unittest
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List
+
+from core.models.event_index import ActiveEventIndex
+
+
+@dataclass
+class _SimEvent:
+    id: str
+    timestamp: datetime
+    affected_stocks: List[str]
+
+
+class TestActiveEventIndex(unittest.TestCase):
+    def setUp(self):
+        self.t0 = datetime(2024, 1, 1, 9, 0)
+        self.index = ActiveEventIndex(window=timedelta(hours=1))
+
+    def test_lookup_by_ticker(self):
+        e1 = _SimEvent("e1", self.t0, ["005930", "000660"])
+        e2 = _SimEvent("e2", self.t0 + timedelta(minutes=10), ["005930"])
+        self.index.add(e1)
+        self.index.add(e2)
+        self.assertEqual(self.index.active("005930"), [e1, e2])
+        self.assertEqual(self.index.active("000660"), [e1])
+        self.assertEqual(self.index.active("035420"), [])
+
+    def test_expire_by_simulation_time(self):
+        e1 = _SimEvent("e1", self.t0, ["005930", "000660"])
+        e2 = _SimEvent("e2", self.t0 + timedelta(minutes=30), ["005930"])
+        self.index.add(e1)
+        self.index.add(e2)
+
+        # 59분 경과: 둘 다 유효
+        self.assertEqual(len(self.index.active("005930", now=self.t0 + timedelta(minutes=59))), 2)
+        # 정확히 1시간 경과: e1 만료 (기존 '< 3600초' 조건과 동일)
+        self.assertEqual(self.index.active("005930", now=self.t0 + timedelta(hours=1)), [e2])
+        self.assertEqual(self.index.active("000660"), [])
+        self.assertNotIn("000660", self.index.active_tickers())
+        self.assertEqual(len(self.index), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
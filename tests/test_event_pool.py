@@ -0,0 +1,181 @@
+import contextlib
+import io
+import time
+import unittest
+from datetime import timedelta
+
+from core.models.announcer.event import Event
+from core.models.event_pool import EventPool
+from core.models.simulation_engine import SimulationEngine
+from data.parameter_templates import get_initial_data
+from utils.llm_scheduler import current_request_context
+
+
+def _events(category, count):
+    return [Event(id=f"event-{category}-{i}", event_type=f"{category} 사건", category=category,
+                  sentiment=0.1, impact_level=2, duration="short") for i in range(count)]
+
+
+class TestEventPool(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.market = {"average_change_rate": 0.0, "market_volatility": 0.01}
+
+        def generate(category, count):
+            self.calls.append((category, count))
+            return _events(category, count)
+
+        self.pool = EventPool(generate, lambda: dict(self.market), ["경제", "기술"],
+                              per_category=2, batch_size=2, drift_threshold=0.02)
+
+    def _fill(self):
+        while self.pool.refill_once():
+            pass
+
+    def test_refills_each_category_in_batches(self):
+        self._fill()
+        self.assertEqual(self.calls, [("경제", 2), ("기술", 2)])
+        self.assertEqual(self.pool.stats()["ready"], {"경제": 2, "기술": 2})
+
+    def test_pop_rotates_categories_and_never_blocks(self):
+        self._fill()
+        popped = [self.pool.pop(self.market).category for _ in range(4)]
+        self.assertEqual(popped, ["경제", "기술", "경제", "기술"])
+        self.assertIsNone(self.pool.pop(self.market))
+        self.assertEqual(self.pool.stats()["misses"], 1)
+
+    def test_drifted_events_are_replaced_by_refill_thread(self):
+        self._fill()
+        self.market = {"average_change_rate": 0.05, "market_volatility": 0.01}
+        # 교체 전에는 오래된 사건이라도 내줘서 틱이 기다리지 않게 함
+        self.assertEqual(self.pool.pop(self.market).category, "경제")
+        self.assertEqual(self.pool.pop(self.market).category, "기술")
+        self.assertEqual(self.pool.stats()["stale_served"], 2)
+
+        self.assertTrue(self.pool.refill_once())  # 빈 자리 보충 먼저
+        self.assertTrue(self.pool.refill_once())
+        self.assertEqual(self.calls[-2:], [("경제", 1), ("기술", 1)])
+        # 모두 차 있으면 오래된 사건을 꺼내 간 수만큼만 batch_size 이내로 교체
+        self.assertTrue(self.pool.refill_once())
+        self.assertEqual(self.calls[-1], ("경제", 1))
+        self.assertTrue(self.pool.refill_once())
+        self.assertEqual(self.calls[-1], ("기술", 1))
+        self.assertFalse(self.pool.refill_once())
+        stats = self.pool.stats()
+        self.assertEqual((stats["refreshed"], stats["discarded"]), (2, 2))
+        self.assertEqual(stats["ready"], {"경제": 2, "기술": 2})
+
+    def test_pop_prefers_fresh_events(self):
+        self._fill()
+        self.market = {"average_change_rate": 0.05, "market_volatility": 0.01}
+        self.pool.pop(self.market)  # 경제 (오래됨)
+        self.pool.refill_once()  # 경제 새 사건 1개
+        self.assertEqual(self.pool.pop(self.market).category, "경제")  # 기술 차례지만 기술은 모두 오래됨
+        self.assertEqual(self.pool.stats()["stale_served"], 1)
+
+    def test_refreshes_are_bounded_by_served_events(self):
+        self._fill()
+        self.market = {"average_change_rate": 0.05, "market_volatility": 0.01}
+        self.assertFalse(self.pool.refill_once())  # 아직 꺼내 간 사건이 없음
+        self.pool.pop(self.market)
+        while self.pool.refill_once():
+            pass
+        stats = self.pool.stats()
+        self.assertEqual((stats["served"], stats["refreshed"]), (1, 1))
+
+    def test_top_up_requests_only_missing_events(self):
+        pool = EventPool(lambda category, count: self.calls.append((category, count)) or _events(category, count),
+                         lambda: dict(self.market), ["경제"], per_category=3, batch_size=2)
+        while pool.refill_once():
+            pass
+        pool.pop(self.market)
+        pool.refill_once()
+        self.assertEqual(self.calls, [("경제", 2), ("경제", 1), ("경제", 1)])
+        self.assertEqual(pool.stats()["ready"], {"경제": 3})
+
+    def test_category_change_drops_removed_pool(self):
+        self._fill()
+        self.pool.set_categories(["기술", "정책"])
+        self.assertEqual(self.pool.stats()["ready"], {"기술": 2, "정책": 0})
+        self.assertTrue(self.pool.refill_once())
+        self.assertEqual(self.calls[-1], ("정책", 2))
+
+    def test_top_up_waits_for_idle_backend(self):
+        busy = [False]
+        pool = EventPool(lambda category, count: _events(category, count), lambda: dict(self.market), ["경제"],
+                         per_category=4, batch_size=2, idle=lambda: not busy[0])
+        busy[0] = True
+        self.assertTrue(pool.refill_once())  # 비어 있으면 바쁘더라도 보충
+        self.assertFalse(pool.refill_once())
+        self.assertEqual(pool.stats()["deferred"], 1)
+        busy[0] = False
+        self.assertTrue(pool.refill_once())
+        self.assertEqual(pool.size(), 4)
+
+
+class TestEngineEventPool(unittest.TestCase):
+    def test_tick_pops_from_pool(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = SimulationEngine(get_initial_data())
+        engine.announcer.generate_events = lambda **kw: _events(kw["allowed_categories"][0], kw["count"])
+        engine.enable_news_generation(False)
+        engine.enable_persistence(False)
+        engine.set_allowed_categories(["경제"])
+        engine.enable_event_pool(per_category=2, batch_size=2)
+        engine.start()
+        engine._ensure_background_workers()
+        try:
+            deadline = time.time() + 2
+            while engine.get_current_state()["pending_events"] < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            with contextlib.redirect_stdout(io.StringIO()):
+                engine._tick(event_due=True)
+            self.assertEqual(len(engine.events_history), 1)
+            self.assertEqual(engine.events_history.recent(1)[0].event.category, "경제")
+        finally:
+            engine.stop()
+
+    def test_running_engine_keeps_discards_bounded(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = SimulationEngine(get_initial_data())
+        engine.announcer.generate_events = lambda **kw: _events(kw["allowed_categories"][0], kw["count"])
+        engine.enable_news_generation(False)
+        engine.enable_persistence(False)
+        engine.set_allowed_categories(["경제", "기술"])
+        engine.enable_event_pool(per_category=3, batch_size=2)
+        engine.start()
+        engine._ensure_background_workers()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                for i in range(60):
+                    engine.simulation_time += timedelta(hours=engine.speed.value)  # update()와 같은 진행
+                    engine._tick(event_due=i % 5 == 0)
+                    time.sleep(0.01)
+            stats = engine._event_pool.stats()
+        finally:
+            engine.stop()
+        self.assertEqual(stats["served"], 12)
+        self.assertLessEqual(stats["discarded"], stats["served"])
+        self.assertTrue(all(n <= 3 for n in stats["ready"].values()))
+
+    def test_pool_refills_use_backfill_priority_unless_empty(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = SimulationEngine(get_initial_data())
+        engine.sim_id = "sim-pool"
+        priorities = []
+
+        def generate(**kw):
+            priorities.append(current_request_context())
+            return _events(kw["allowed_categories"][0], kw["count"])
+
+        engine.announcer.generate_events = generate
+        engine._generate_pool_events("경제", 1)
+        engine._event_pool = EventPool(lambda c, n: _events(c, n), engine._market_signature, ["경제"])
+        engine._event_pool.refill_once()
+        engine._generate_pool_events("경제", 1)
+        self.assertEqual(priorities[0], ("event", "sim-pool"))
+        self.assertEqual(priorities[-1], ("backfill", "sim-pool"))
+
+
+if __name__ == "__main__":
+    unittest.main()
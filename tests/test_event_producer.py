@@ -0,0 +1,91 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+
+from core.models.announcer.event import Event
+from core.models.event_producer import EventProducer
+from core.models.simulation_engine import SimulationEngine
+from data.parameter_templates import get_initial_data
+
+
+class TestEventProducer(unittest.TestCase):
+    def test_queue_is_bounded_and_poll_never_blocks(self):
+        calls = []
+        producer = EventProducer(lambda: calls.append(1) or len(calls), maxsize=2)
+        self.assertIsNone(producer.poll())
+        producer.start()
+        try:
+            deadline = time.time() + 2
+            while producer.qsize() < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            self.assertEqual(producer.qsize(), 2)
+            # 큐가 가득 찬 동안 생산자는 최대 1개만 더 만들어 두고 대기
+            self.assertLessEqual(len(calls), 3)
+            self.assertEqual(producer.poll(), 1)
+        finally:
+            producer.stop()
+
+    def test_errors_are_reported_and_retried(self):
+        errors = []
+        state = {"n": 0}
+
+        def produce():
+            state["n"] += 1
+            if state["n"] == 1:
+                raise RuntimeError("llm down")
+            return "ok"
+
+        producer = EventProducer(produce, on_error=errors.append, retry_delay=0.01)
+        producer.start()
+        try:
+            deadline = time.time() + 2
+            item = None
+            while item is None and time.time() < deadline:
+                item = producer.poll()
+                time.sleep(0.01)
+            self.assertEqual(item, "ok")
+            self.assertEqual(len(errors), 1)
+        finally:
+            producer.stop()
+
+
+class TestAsyncTick(unittest.TestCase):
+    def test_tick_does_not_wait_for_slow_event_generation(self):
+        release = threading.Event()
+
+        def slow_events(**kwargs):
+            release.wait(2)
+            return [Event(id="event-slow", event_type="정책 금리 조정 논의", category="경제",
+                          sentiment=0.2, impact_level=2, duration="short")]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = SimulationEngine(get_initial_data())
+        engine.announcer.generate_events = slow_events
+        engine.enable_news_generation(False)
+        engine.enable_persistence(False)
+        engine.start()
+        engine._ensure_background_workers()
+        try:
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                engine._tick(event_due=True)
+                engine._tick(event_due=False)
+            self.assertLess(time.perf_counter() - started, 0.5)
+            self.assertEqual(len(engine.events_history), 0)
+
+            release.set()
+            deadline = time.time() + 2
+            while not engine._event_producer.qsize() and time.time() < deadline:
+                time.sleep(0.01)
+            with contextlib.redirect_stdout(io.StringIO()):
+                engine._tick(event_due=False)  # 밀린 이벤트는 준비되는 대로 적용
+            self.assertEqual(len(engine.events_history), 1)
+        finally:
+            engine.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
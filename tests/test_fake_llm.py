@@ -0,0 +1,74 @@
+import contextlib
+import io
+import json
+import unittest
+
+import requests
+
+from core.models.announcer.announcer import Announcer
+from core.models.announcer.news import Media
+from core.models.announcer.prompt_builder import build_event_prompt, build_multi_outlet_news_prompt
+from llama_client import LlamaClient, set_client
+from utils.fake_llm import FakeLLM, FakeLLMSession, install_fake_llm, split_tokens
+
+
+class TestFakeLLM(unittest.TestCase):
+    def setUp(self):
+        self.outlets = [Media("언론사 A", -0.5, 0.9), Media("언론사 B", 0.6, 0.4)]
+
+    def tearDown(self):
+        set_client(None)
+
+    def _client(self, fake, **kwargs):
+        return LlamaClient(session=FakeLLMSession(fake), backoff=0.0, **kwargs)
+
+    def test_event_prompt_gets_json_array_in_allowed_categories(self):
+        client = self._client(FakeLLM(seed=1))
+        prompt = build_event_prompt(count=3, allowed_categories=["기술", "금융"])
+        events = json.loads(client.generate(prompt))
+        self.assertEqual(len(events), 3)
+        self.assertTrue(all(e["category"] in ("기술", "금융") for e in events))
+
+    def test_batch_prompt_streams_articles_for_each_outlet_via_prefix_context(self):
+        fake = FakeLLM(seed=1)
+        client = self._client(fake)
+        prefix = "[사건 정보]\n- 제목: 반도체 수출 급증\n- 카테고리: 기술\n- 감성 점수: 0.6\n- 영향 수준: 4"
+        chunks = []
+        text = client.generate_stream(
+            build_multi_outlet_news_prompt(self.outlets), max_tokens=2000,
+            on_partial=lambda _, chunk: chunks.append(chunk), prefix=prefix,
+        )
+        articles = json.loads(text)["articles"]
+        self.assertEqual([a["outlet"] for a in articles], ["언론사 A", "언론사 B"])
+        self.assertIn("반도체 수출 급증", articles[0]["news_article"])
+        self.assertGreater(len(chunks), 10)
+        self.assertEqual(fake.stats()["requests"], 2)  # prefill + 본문
+
+    def test_malformed_and_failure_injection(self):
+        client = self._client(FakeLLM(malformed_rate=1.0, seed=1))
+        with self.assertRaises(json.JSONDecodeError):
+            json.loads(client.generate(build_event_prompt(count=2)))
+
+        fake = FakeLLM(failure_rate=1.0)
+        with self.assertRaises(requests.HTTPError):
+            self._client(fake, max_retries=2).generate("안녕")
+        self.assertEqual(fake.stats()["failures"], 3)
+
+    def test_announcer_runs_against_fake_backend(self):
+        install_fake_llm(FakeLLM(seed=3))
+        announcer = Announcer(news_batch_size=2)
+        events = announcer.generate_events(count=1, allowed_categories=["정책"])
+        self.assertEqual(events[0].category, "정책")
+        event_log = {"event": {"event_type": events[0].event_type, "category": "정책", "sentiment": 0.1}}
+        with contextlib.redirect_stdout(io.StringIO()):
+            articles, late = announcer._generate_batched_articles(event_log, self.outlets, [])
+        self.assertEqual(set(articles), {"언론사 A", "언론사 B"})
+        self.assertEqual(late, set())
+
+    def test_split_tokens_round_trips(self):
+        text = "정부는 오늘  새 정책을 발표했다.\n"
+        self.assertEqual("".join(split_tokens(text)), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
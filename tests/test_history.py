@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from core.models.history import SpillingHistory
+
+
+class TestSpillingHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sim", "events.jsonl")
+        self.history = SpillingHistory(3, spill_path=self.path, serializer=lambda x: {"n": x})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_memory_window_is_bounded(self):
+        for n in range(10):
+            self.history.append(n)
+        self.assertEqual(self.history.in_memory_count, 3)
+        self.assertEqual(len(self.history), 10)
+        self.assertEqual(self.history[-2:], [8, 9])
+        self.assertEqual(self.history.recent(5), [7, 8, 9])
+        self.assertEqual(list(self.history), [7, 8, 9])
+
+    def test_spilled_entries_can_be_paged_back(self):
+        for n in range(10):
+            self.history.append(n)
+        self.assertEqual(self.history.spilled_count, 7)
+        self.assertEqual(self.history.page(0, 3), [{"n": 0}, {"n": 1}, {"n": 2}])
+        self.assertEqual(self.history.page(5, 10), [{"n": 5}, {"n": 6}])
+
+    def test_spills_are_written_in_chunks(self):
+        history = SpillingHistory(1, spill_path=self.path, serializer=lambda x: {"n": x}, spill_chunk=3)
+        for n in range(3):
+            history.append(n)
+        self.assertFalse(os.path.exists(self.path))  # 2건은 아직 버퍼에
+        history.append(3)
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 3)
+        history.append(4)
+        self.assertEqual(history.page(0, 10), [{"n": n} for n in range(4)])  # 조회 전에 버퍼를 비움
+
+    def test_spill_errors_go_to_on_error(self):
+        errors = []
+        blocked = os.path.join(self.tmp.name, "file")
+        open(blocked, "w").close()
+        history = SpillingHistory(1, spill_path=os.path.join(blocked, "events.jsonl"),
+                                  serializer=lambda x: {"n": x}, spill_chunk=1, on_error=errors.append)
+        history.append(0)
+        history.append(1)
+        self.assertEqual(len(errors), 1)
+        self.assertIn("1건", errors[0])
+
+    def test_without_spill_path_old_entries_are_dropped(self):
+        history = SpillingHistory(2)
+        for n in range(5):
+            history.append(n)
+        self.assertEqual(history.recent(10), [3, 4])
+        self.assertEqual(history.page(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
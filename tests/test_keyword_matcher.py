@@ -0,0 +1,53 @@
+import json
+import os
+import tempfile
+import unittest
+
+from core.models.keyword_matcher import KeywordAutomaton, get_keyword_automaton
+
+
+class TestKeywordAutomaton(unittest.TestCase):
+    def setUp(self):
+        self.automaton = KeywordAutomaton({
+            "반도체": ["005930", "000660"],
+            "전자": ["005930", "011070"],
+            "금리": ["055550"],
+            "AI": ["035420"],
+        })
+
+    def test_matches_overlapping_terms(self):
+        # '반도체' 안의 부분 문자열이 아닌 '전자'도 함께 매칭되어야 함
+        self.assertEqual(
+            sorted(self.automaton.match("반도체", "전자 부품 수출 호조")),
+            ["000660", "005930", "011070"],
+        )
+        self.assertEqual(self.automaton.match("기준금리 동결", "경제"), ["055550"])
+        self.assertEqual(self.automaton.match("정책", "사회"), [])
+
+    def test_texts_are_not_concatenated(self):
+        self.assertEqual(self.automaton.match("금", "리"), [])
+
+    def test_same_as_substring_scan(self):
+        mapping = {"ab": ["1"], "bc": ["2"], "abcd": ["3"], "d": ["4"], "cd": ["5"]}
+        automaton = KeywordAutomaton(mapping)
+        for text in ["abcd", "xbcdx", "abab", "", "dcba", "zabcdz"]:
+            expected = sorted({t for term, ts in mapping.items() if term in text for t in ts})
+            self.assertEqual(sorted(automaton.match(text)), expected, text)
+
+    def test_load_merges_groups_and_reloads_on_change(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "map.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"sectors": {"방산": ["012450"]}, "keywords": {"방산": ["009540"]}}, f)
+            automaton = get_keyword_automaton(path)
+            self.assertIs(get_keyword_automaton(path), automaton)
+            self.assertEqual(sorted(automaton.match("방산 수출")), ["009540", "012450"])
+
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"sectors": {"조선": ["010140"]}}, f)
+            os.utime(path, ns=(0, 1))
+            self.assertEqual(get_keyword_automaton(path).match("조선"), ["010140"])
+
+
+if __name__ == "__main__":
+    unittest.main()
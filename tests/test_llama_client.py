@@ -0,0 +1,269 @@
+import contextlib
+import io
+import json
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from llama_client import LlamaClient
+from utils.json_stream import JsonStreamScanner, decode_json_items
+from utils.llm_cache import LLMCache
+from utils.llm_scheduler import llm_request_context
+from utils.llm_telemetry import LLMTelemetry
+
+
+class _Response:
+    def __init__(self, status_code=200, payload=None, chunks=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self._chunks = chunks or []
+        self.lines_read = 0
+        self.closed = False
+
+    def json(self):
+        return self._payload
+
+    def iter_lines(self):
+        for i, chunk in enumerate(self._chunks):
+            self.lines_read += 1
+            done = i == len(self._chunks) - 1
+            yield json.dumps({"response": chunk, "done": done}).encode("utf-8")
+
+    def close(self):
+        self.closed = True
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+
+class _StubSession:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def post(self, url, json=None, timeout=None, stream=False):
+        self.calls.append({"url": url, "json": json, "timeout": timeout, "stream": stream})
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def close(self):
+        pass
+
+
+class TestLlamaClient(unittest.TestCase):
+    def _client(self, outcomes, **kwargs):
+        session = _StubSession(outcomes)
+        client = LlamaClient(session=session, backoff=0.0, connect_timeout=1.5, read_timeout=30, **kwargs)
+        return client, session
+
+    def test_generate_sends_keep_alive_and_timeouts(self):
+        client, session = self._client([_Response(payload={"response": "안녕"})], keep_alive="10m")
+        self.assertEqual(client.generate("hi", max_tokens=16), "안녕")
+        call = session.calls[0]
+        self.assertTrue(call["url"].endswith("/api/generate"))
+        self.assertEqual(call["timeout"], (1.5, 30))
+        self.assertEqual(call["json"]["keep_alive"], "10m")
+        self.assertEqual(call["json"]["options"]["num_predict"], 16)
+
+    def test_retries_connection_errors_and_5xx(self):
+        client, session = self._client([
+            requests.ConnectionError("refused"),
+            _Response(status_code=503),
+            _Response(payload={"response": "ok"}),
+        ], max_retries=2)
+        self.assertEqual(client.generate("hi"), "ok")
+        self.assertEqual(len(session.calls), 3)
+
+    def test_gives_up_after_max_retries_and_on_4xx(self):
+        client, _ = self._client([requests.Timeout("slow")] * 2, max_retries=1)
+        with self.assertRaises(requests.Timeout):
+            client.generate("hi")
+
+        client, session = self._client([_Response(status_code=404)], max_retries=3)
+        with self.assertRaises(requests.HTTPError):
+            client.generate("hi")
+        self.assertEqual(len(session.calls), 1)
+
+    def test_failed_responses_are_closed(self):
+        busy, missing = _Response(status_code=503), _Response(status_code=404)
+        client, _ = self._client([busy, missing], max_retries=1)
+        with self.assertRaises(requests.HTTPError):
+            client.generate_stream("hi")
+        self.assertTrue(busy.closed and missing.closed)
+
+    def test_warmup_runs_once(self):
+        client, session = self._client([_Response(payload={"response": ""})])
+        with contextlib.redirect_stdout(io.StringIO()):
+            thread = client.warmup_async()
+            thread.join(2)
+        self.assertIsNone(client.warmup_async())
+        self.assertEqual(session.calls[0]["json"]["prompt"], "")
+        self.assertEqual(len(session.calls), 1)
+
+    def test_from_env_falls_back_on_malformed_values(self):
+        env = {"SAMS_LLM_CONNECT_TIMEOUT": "3s", "SAMS_LLM_READ_TIMEOUT": "", "SAMS_LLM_RETRIES": "two",
+               "SAMS_LLM_POOL_SIZE": "16"}
+        with mock.patch.dict("os.environ", env), contextlib.redirect_stdout(io.StringIO()) as out:
+            client = LlamaClient.from_env()
+        self.assertEqual((client.timeout, client.max_retries), ((3.0, 120.0), 2))
+        self.assertIn("SAMS_LLM_RETRIES", out.getvalue())
+
+    def test_generate_stream_reports_partials(self):
+        response = _Response(chunks=["시장", "이 ", "상승"])
+        client, session = self._client([response])
+        partials = []
+        text = client.generate_stream("hi", on_partial=lambda text, chunk: partials.append(text))
+        self.assertEqual(text, "시장이 상승")
+        self.assertEqual(partials, ["시장", "시장이 ", "시장이 상승"])
+        self.assertTrue(session.calls[0]["json"]["stream"])
+        self.assertTrue(session.calls[0]["stream"])
+        self.assertTrue(response.closed)
+
+    def test_generate_stream_stops_when_json_completes(self):
+        chunks = ["설명: ", '[{"event_type": "금리 [인상]",', ' "sentiment": -0.4}', "]", " 이상입니다", " 끝"]
+        response = _Response(chunks=chunks)
+        client, _ = self._client([response])
+        scanner = JsonStreamScanner()
+        client.generate_stream("hi", on_partial=lambda text, chunk: scanner.feed(chunk))
+        self.assertEqual(json.loads(scanner.block), [{"event_type": "금리 [인상]", "sentiment": -0.4}])
+        self.assertEqual(response.lines_read, 4)
+        self.assertTrue(response.closed)
+
+    def test_only_complete_streams_are_cached(self):
+        cache = LLMCache()
+        client, session = self._client([
+            _Response(chunks=['{"a": 1}', " 꼬리"]),
+            _Response(chunks=['{"a": 1}', " 꼬리"]),
+        ], cache=cache)
+        scanner = JsonStreamScanner()
+        client.generate_stream("hi", on_partial=lambda text, chunk: scanner.feed(chunk))
+        self.assertEqual(len(cache), 0)  # 조기 종료 → 저장 안 함
+        client.generate_stream("hi")
+        client.generate_stream("hi")
+        self.assertEqual(len(session.calls), 2)
+        self.assertEqual(client.generate_stream("hi"), '{"a": 1} 꼬리')
+
+    def test_request_deadline_caps_timeout_and_skips_late_requests(self):
+        client, session = self._client([_Response(payload={"response": "ok"})])
+        with llm_request_context(deadline=time.monotonic() + 2):
+            client.generate("hi")
+        self.assertLessEqual(session.calls[0]["timeout"][1], 2)
+
+        with llm_request_context(deadline=time.monotonic() - 1):
+            with self.assertRaises(requests.Timeout):
+                client.generate("hi")
+        self.assertEqual(len(session.calls), 1)  # 마감이 지난 요청은 보내지 않음
+
+    def test_prefix_is_evaluated_once_and_context_reused(self):
+        client, session = self._client([
+            _Response(payload={"response": "네", "context": [1, 2, 3]}),
+            _Response(payload={"response": "기사 A"}),
+            _Response(payload={"response": "기사 B"}),
+        ])
+        self.assertEqual(client.generate("언론사 A", prefix="사건 맥락"), "기사 A")
+        self.assertEqual(client.generate("언론사 B", prefix="사건 맥락"), "기사 B")
+
+        prefill, first, second = (call["json"] for call in session.calls)
+        self.assertEqual(prefill["prompt"], "사건 맥락")
+        self.assertEqual(prefill["options"]["num_predict"], 1)
+        self.assertEqual((first["prompt"], first["context"]), ("언론사 A", [1, 2, 3]))
+        self.assertEqual((second["prompt"], second["context"]), ("언론사 B", [1, 2, 3]))
+
+    def test_prefix_falls_back_to_full_prompt(self):
+        client, session = self._client([_Response(status_code=404), _Response(payload={"response": "ok"})])
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(client.generate("꼬리", prefix="머리"), "ok")
+        self.assertEqual(session.calls[1]["json"]["prompt"], "머리\n\n꼬리")
+        self.assertNotIn("context", session.calls[1]["json"])
+
+    def test_failed_prefill_is_not_retried_per_call(self):
+        client, session = self._client([
+            _Response(status_code=503), _Response(payload={"response": "A"}), _Response(payload={"response": "B"}),
+        ], max_retries=0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            client.generate("언론사 A", prefix="머리")
+            client.generate("언론사 B", prefix="머리")
+        self.assertEqual(len(session.calls), 3)  # prefill 1회 + 전체 프롬프트 2회
+        self.assertEqual(session.calls[2]["json"]["prompt"], "머리\n\n언론사 B")
+
+    def test_context_continuation_is_cached_apart_from_full_prompt(self):
+        client, session = self._client([
+            _Response(payload={"response": "네", "context": [1, 2]}),
+            _Response(payload={"response": "context 기사"}),
+            _Response(payload={"response": "전체 기사"}),
+        ], cache=LLMCache())
+        self.assertEqual(client.generate("꼬리", prefix="머리"), "context 기사")
+        self.assertEqual(client.generate("머리\n\n꼬리"), "전체 기사")
+        self.assertEqual(client.generate("꼬리", prefix="머리"), "context 기사")
+        self.assertEqual(len(session.calls), 3)
+
+    def test_format_is_sent_and_keyed_separately_in_cache(self):
+        client, session = self._client([
+            _Response(payload={"response": "[]"}),
+            _Response(payload={"response": "자유 형식"}),
+        ], cache=LLMCache())
+        schema = {"type": "array"}
+        self.assertEqual(client.generate("사건", format=schema), "[]")
+        self.assertEqual(client.generate("사건"), "자유 형식")
+        self.assertEqual(session.calls[0]["json"]["format"], schema)
+        self.assertNotIn("format", session.calls[1]["json"])
+
+    def test_telemetry_records_calls_errors_and_stream_tokens(self):
+        telemetry = LLMTelemetry()
+        session = _StubSession([
+            _Response(payload={"response": "ok", "eval_count": 8, "eval_duration": 4e8}),
+            _Response(status_code=404),
+            _Response(chunks=["a", "b", "c"]),
+        ])
+        client = LlamaClient(session=session, backoff=0.0, max_retries=0, telemetry=telemetry)
+        with llm_request_context(sim_id="sim-a", prompt_type="event"):
+            client.generate("사건")
+            with self.assertRaises(requests.HTTPError):
+                client.generate("사건")
+        with llm_request_context(sim_id="sim-a", prompt_type="news"):
+            client.generate_stream("기사")
+
+        stats = telemetry.snapshot("sim-a")
+        event = stats["by_prompt_type"]["event"]
+        self.assertEqual((event["calls"], event["eval_tokens"], event["tokens_per_sec"]), (1, 8, 20.0))
+        self.assertEqual(event["errors"], {"HTTPError": 1})
+        # 스트림 메타데이터에 토큰 수가 없으면 받은 조각 수로 계산
+        self.assertEqual(stats["by_prompt_type"]["news"]["eval_tokens"], 3)
+        self.assertEqual(stats["simulation"]["calls"], 2)
+
+
+class TestJsonStreamScanner(unittest.TestCase):
+    def test_skips_bracketed_prose_before_json(self):
+        scanner = JsonStreamScanner()
+        self.assertFalse(scanner.feed("[참고] 결과는 "))
+        self.assertTrue(scanner.feed('{"a": "\\"}"} 꼬리'))
+        self.assertEqual(json.loads(scanner.block), {"a": "\"}"})
+
+    def test_leading_only_ignores_plain_text(self):
+        scanner = JsonStreamScanner(leading_only=True)
+        self.assertFalse(scanner.feed("정부는 {예산} 을 "))
+        self.assertFalse(scanner.feed('{"news_article": "x"}'))
+        self.assertTrue(scanner.disabled)
+
+        scanner = JsonStreamScanner(leading_only=True)
+        self.assertTrue(scanner.feed('  {"news_article": "본문"}'))
+
+
+class TestDecodeJsonItems(unittest.TestCase):
+    def test_keeps_items_before_truncation_and_skips_bracketed_prose(self):
+        items, complete = decode_json_items('[참고] 결과: [{"a": 1}, {"b": "]"}, {"c": ')
+        self.assertEqual((items, complete), ([{"a": 1}, {"b": "]"}], False))
+
+    def test_object_with_list_key_or_single_object(self):
+        self.assertEqual(decode_json_items('{"events": [1, 2]}', list_key="events"), ([1, 2], True))
+        self.assertEqual(decode_json_items('설명 {"a": 1} 끝'), ([{"a": 1}], True))
+        self.assertEqual(decode_json_items("JSON 없음"), ([], False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from llama_client import LlamaClient
+from utils import llm_cache
+from utils.llm_cache import LLMCache, make_cache_key
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, text):
+        self._text = text
+
+    def json(self):
+        return {"response": self._text}
+
+    def raise_for_status(self):
+        pass
+
+
+class _CountingSession:
+    def __init__(self):
+        self.calls = 0
+
+    def post(self, url, json=None, timeout=None, stream=False):
+        self.calls += 1
+        return _Response(f"응답-{self.calls}")
+
+    def close(self):
+        pass
+
+
+class TestLLMCache(unittest.TestCase):
+    def test_key_depends_on_model_prompt_and_options(self):
+        base = make_cache_key("m", "p", {"temperature": 0.7, "num_predict": 10})
+        self.assertEqual(base, make_cache_key("m", "p", {"num_predict": 10, "temperature": 0.7}))
+        self.assertNotEqual(base, make_cache_key("m2", "p", {"temperature": 0.7, "num_predict": 10}))
+        self.assertNotEqual(base, make_cache_key("m", "p", {"temperature": 0.2, "num_predict": 10}))
+
+    def test_lru_eviction_and_counters(self):
+        cache = LLMCache(capacity=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        self.assertEqual(cache.get("a"), "A")
+        cache.put("c", "C")  # b가 가장 오래 안 쓰였으므로 밀려남
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "C")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stores"]), (2, 1, 3))
+
+    def test_ttl_expiry(self):
+        cache = LLMCache(ttl=10)
+        with mock.patch("utils.llm_cache.time.time", return_value=1000.0):
+            cache.put("k", "v")
+        with mock.patch("utils.llm_cache.time.time", return_value=1005.0):
+            self.assertEqual(cache.get("k"), "v")
+        with mock.patch("utils.llm_cache.time.time", return_value=1011.0):
+            self.assertIsNone(cache.get("k"))
+
+    def test_shared_cache_ignores_malformed_env(self):
+        env = {"SAMS_LLM_CACHE_SIZE": "1k", "SAMS_LLM_CACHE_TTL": "1h", "SAMS_LLM_CACHE_PATH": ""}
+        with mock.patch.dict(os.environ, env), mock.patch.object(llm_cache, "_CACHE", None), \
+                contextlib.redirect_stdout(io.StringIO()) as out:
+            cache = llm_cache.get_llm_cache()
+        self.assertEqual((cache.capacity, cache.ttl), (llm_cache.DEFAULT_CAPACITY, None))
+        self.assertIn("SAMS_LLM_CACHE_SIZE", out.getvalue())
+
+    def test_disk_store_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite3")
+            first = LLMCache(path=path)
+            first.put("k", "저장된 응답")
+            first.close()
+
+            second = LLMCache(path=path)
+            self.assertEqual(second.get("k"), "저장된 응답")
+            self.assertEqual(second.stats()["disk_hits"], 1)
+            second.close()
+
+    def test_client_hits_llm_once_per_prompt(self):
+        session = _CountingSession()
+        client = LlamaClient(session=session, cache=LLMCache())
+        self.assertEqual(client.generate("같은 프롬프트"), "응답-1")
+        self.assertEqual(client.generate("같은 프롬프트"), "응답-1")
+        self.assertEqual(client.generate("같은 프롬프트", max_tokens=64), "응답-2")
+        self.assertEqual(session.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
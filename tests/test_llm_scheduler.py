@@ -0,0 +1,128 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+from unittest import mock
+
+from utils import llm_scheduler
+
+from utils.llm_scheduler import (
+    LLMScheduler, SchedulerRejected, current_deadline, current_request_context, llm_request_context,
+)
+
+
+class TestLLMScheduler(unittest.TestCase):
+    def _queue_waiters(self, scheduler, requests):
+        """슬롯을 막아 둔 상태에서 (priority, sim_id) 요청들을 순서대로 대기열에 넣고 실행 순서를 기록"""
+        order = []
+        threads = []
+        for priority, sim_id in requests:
+            def run(priority=priority, sim_id=sim_id):
+                scheduler.acquire(priority, sim_id)
+                order.append((priority, sim_id))
+                scheduler.release()
+            thread = threading.Thread(target=run)
+            thread.start()
+            threads.append(thread)
+            while scheduler.stats()["queued"] < len(threads):
+                time.sleep(0.001)
+        return order, threads
+
+    def test_higher_priority_runs_first(self):
+        scheduler = LLMScheduler(max_concurrency=1)
+        scheduler.acquire("news", "sim-a")
+        order, threads = self._queue_waiters(scheduler, [
+            ("backfill", "sim-a"), ("news", "sim-a"), ("event", "sim-a"),
+        ])
+        scheduler.release()
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual([p for p, _ in order], ["event", "news", "backfill"])
+
+    def test_round_robin_between_simulations(self):
+        scheduler = LLMScheduler(max_concurrency=1)
+        scheduler.acquire("news", "sim-a")
+        order, threads = self._queue_waiters(scheduler, [
+            ("news", "sim-a"), ("news", "sim-a"), ("news", "sim-a"), ("news", "sim-b"),
+        ])
+        scheduler.release()
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual([s for _, s in order][:2], ["sim-a", "sim-b"])
+
+    def test_rejects_when_queue_is_full_or_wait_expires(self):
+        scheduler = LLMScheduler(max_concurrency=1, max_queue=0)
+        scheduler.acquire()
+        with self.assertRaises(SchedulerRejected):
+            scheduler.acquire()
+
+        scheduler = LLMScheduler(max_concurrency=1, max_queue=4, max_wait=0.05)
+        scheduler.acquire()
+        with self.assertRaises(SchedulerRejected):
+            scheduler.acquire()
+        stats = scheduler.stats()
+        self.assertEqual((stats["timed_out"], stats["queued"], stats["running"]), (1, 0, 1))
+
+    def test_request_deadline_bounds_the_wait(self):
+        scheduler = LLMScheduler(max_concurrency=1, max_wait=None)
+        scheduler.acquire()
+        started = time.monotonic()
+        with llm_request_context(deadline=started + 0.05):
+            with self.assertRaises(SchedulerRejected):
+                with scheduler.slot():
+                    pass
+        self.assertLess(time.monotonic() - started, 1.0)
+        scheduler.release()
+        with self.assertRaises(SchedulerRejected):  # 이미 지난 마감은 빈 슬롯이 있어도 거절
+            scheduler.acquire(deadline=time.monotonic() - 1)
+        self.assertEqual(scheduler.stats()["timed_out"], 2)
+
+    def test_concurrency_cap(self):
+        scheduler = LLMScheduler(max_concurrency=2)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def work():
+            with scheduler.slot():
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                time.sleep(0.02)
+                with lock:
+                    state["active"] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(state["peak"], 2)
+        self.assertEqual(scheduler.stats()["admitted"], 6)
+
+    def test_outer_request_context_wins(self):
+        with llm_request_context(priority="backfill", sim_id="sim-a"):
+            with llm_request_context(priority="news", sim_id="sim-b"):
+                self.assertEqual(current_request_context(), ("backfill", "sim-a"))
+        self.assertEqual(current_request_context(), ("news", "default-sim"))
+
+    def test_shared_scheduler_ignores_malformed_env(self):
+        env = {"SAMS_LLM_MAX_CONCURRENCY": "four", "SAMS_LLM_MAX_QUEUE": "8", "SAMS_LLM_MAX_WAIT": "1m"}
+        with mock.patch.dict("os.environ", env), mock.patch.object(llm_scheduler, "_SCHEDULER", None), \
+                contextlib.redirect_stdout(io.StringIO()) as out:
+            scheduler = llm_scheduler.get_llm_scheduler()
+        self.assertEqual(scheduler.max_concurrency, llm_scheduler.DEFAULT_MAX_CONCURRENCY)
+        self.assertEqual((scheduler.max_queue, scheduler.max_wait), (8, llm_scheduler.DEFAULT_MAX_WAIT))
+        self.assertIn("SAMS_LLM_MAX_CONCURRENCY", out.getvalue())
+
+    def test_earliest_deadline_wins(self):
+        with llm_request_context(deadline=10.0):
+            with llm_request_context(deadline=20.0):
+                self.assertEqual(current_deadline(), 10.0)
+            with llm_request_context(deadline=5.0):
+                self.assertEqual(current_deadline(), 5.0)
+        self.assertIsNone(current_deadline())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import requests
+
+from utils.llm_scheduler import llm_request_context
+from utils.llm_telemetry import LLMTelemetry
+from utils.process_stats import get_process_usage
+
+
+class TestLLMTelemetry(unittest.TestCase):
+    def test_tags_calls_by_prompt_type_and_simulation(self):
+        telemetry = LLMTelemetry()
+        with llm_request_context(priority="event", sim_id="sim-a", prompt_type="event"):
+            telemetry.record_call(0.2, {"prompt_eval_count": 100, "eval_count": 50, "eval_duration": 1e9})
+        with llm_request_context(sim_id="sim-b"):
+            telemetry.record_call(3.0, {"eval_count": 10, "eval_duration": 5e8})
+            telemetry.record_error(requests.Timeout())
+            telemetry.record_fallback("error")
+
+        snapshot = telemetry.snapshot("sim-a")
+        event = snapshot["by_prompt_type"]["event"]
+        self.assertEqual((event["calls"], event["prompt_tokens"], event["eval_tokens"]), (1, 100, 50))
+        self.assertEqual(event["tokens_per_sec"], 50.0)
+        self.assertEqual(event["latency_histogram"]["<=250ms"], 1)
+        # prompt_type을 지정하지 않으면 우선순위(news)로 집계
+        news = snapshot["by_prompt_type"]["news"]
+        self.assertEqual((news["errors"], news["fallbacks"]), ({"Timeout": 1}, {"error": 1}))
+        self.assertEqual(snapshot["simulation"]["calls"], 1)
+        self.assertEqual(snapshot["totals"]["calls"], 2)
+        self.assertEqual(snapshot["totals"]["tokens_per_sec"], 40.0)
+
+    def test_percentiles_come_from_histogram(self):
+        telemetry = LLMTelemetry()
+        for latency in [0.05] * 19 + [40.0]:
+            telemetry.record_call(latency, prompt_type="news", sim_id="sim")
+        stats = telemetry.snapshot()["totals"]
+        self.assertEqual((stats["latency_ms_p50"], stats["latency_ms_p95"]), (100.0, 100.0))
+        self.assertEqual(stats["latency_ms_max"], 40000.0)
+        self.assertEqual(telemetry.snapshot()["totals"]["latency_histogram"]["<=60000ms"], 1)
+
+    def test_per_simulation_series_are_bounded(self):
+        telemetry = LLMTelemetry(max_simulations=2)
+        for sim_id in ("a", "b", "a", "c"):
+            telemetry.record_call(0.1, prompt_type="event", sim_id=sim_id)
+        self.assertEqual(telemetry.snapshot("b")["simulation"]["calls"], 0)  # 가장 오래 안 쓰인 b 제거
+        self.assertEqual(telemetry.snapshot("a")["simulation"]["calls"], 2)
+        telemetry.drop_simulation("a")
+        self.assertEqual(telemetry.snapshot("a")["simulation"]["calls"], 0)
+        self.assertEqual(telemetry.snapshot()["totals"]["calls"], 4)
+
+    def test_process_usage_is_formatted(self):
+        usage = get_process_usage()
+        self.assertTrue(usage["cpu_usage"].endswith("%"))
+        self.assertRegex(usage["memory_usage"], r"^(\d+\.\d\dGB|N/A)$")
+
+
+if __name__ == "__main__":
+    unittest.main()
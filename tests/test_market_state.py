@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+
+from core.models.market_state import MarketState
+
+
+class TestMarketState(unittest.TestCase):
+    def setUp(self):
+        self.state = MarketState({
+            "005930": {"price": 79000, "volume": 1000000, "base_price": 79000},
+            "000660": {"price": 45000, "volume": 500000},
+        })
+
+    def test_dict_compatible_view(self):
+        row = self.state["005930"]
+        self.assertEqual(row["price"], 79000.0)
+        self.assertEqual(row.get("change_rate", 0.0), 0.0)  # 아직 없는 키
+        self.assertNotIn("base_price", self.state["000660"])
+        self.assertEqual(list(self.state.keys()), ["005930", "000660"])
+
+    def test_view_writes_through_to_arrays(self):
+        self.state["000660"]["price"] = 46000
+        self.state["000660"]["change_rate"] = 0.02
+        idx = self.state.index["000660"]
+        self.assertEqual(self.state.price[idx], 46000.0)
+        self.assertAlmostEqual(self.state.change_rate[idx], 0.02)
+
+    def test_apply_updates_is_vectorized(self):
+        idx = self.state.indices(["000660", "005930"])
+        self.state.apply_updates(idx, np.array([44000.0, 80000.0]), np.array([-0.02, 0.01]))
+        self.assertEqual(self.state["005930"]["price"], 80000.0)
+        self.assertEqual(self.state["000660"]["price"], 44000.0)
+
+    def test_change_from_base_falls_back_to_current_price(self):
+        self.state["005930"]["price"] = 86900
+        changes = self.state.change_from_base()
+        self.assertAlmostEqual(changes[self.state.index["005930"]], 0.1)
+        self.assertEqual(changes[self.state.index["000660"]], 0.0)
+
+    def test_to_dict_returns_plain_values(self):
+        data = self.state.to_dict()
+        self.assertEqual(data["000660"], {"price": 45000.0, "volume": 500000})
+        self.assertIsInstance(data["005930"]["volume"], int)
+
+
+if __name__ == "__main__":
+    unittest.main()
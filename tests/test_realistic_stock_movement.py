@@ -0,0 +1,136 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from core.models import realistic_stock_movement as rsm
+
+
+def _write_series(path, labels):
+    with open(path, "w", encoding="utf-8") as f:
+        for label in labels:
+            f.write(json.dumps({"label": label}) + "\n")
+
+
+class TestModelRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = self.tmp.name
+        _write_series(os.path.join(self.data_dir, "005930_KS_h1.jsonl"), [0.01, -0.02] * 10)
+        rsm.clear_model_registry()
+
+    def tearDown(self):
+        rsm.clear_model_registry()
+        self.tmp.cleanup()
+
+    def test_same_instance_is_shared(self):
+        m1 = rsm.get_realistic_model(self.data_dir)
+        m2 = rsm.get_realistic_model(self.data_dir)
+        self.assertIs(m1, m2)
+
+    def test_reload_only_when_data_changes(self):
+        m1 = rsm.get_realistic_model(self.data_dir)
+        # 지문 재확인 간격을 무시하도록 강제 재확인
+        rsm._FINGERPRINT_CHECKED_AT.clear()
+        self.assertIs(rsm.get_realistic_model(self.data_dir), m1)
+
+        _write_series(os.path.join(self.data_dir, "000660_KS_h1.jsonl"), [0.03, -0.01] * 10)
+        rsm._FINGERPRINT_CHECKED_AT.clear()
+        m2 = rsm.get_realistic_model(self.data_dir)
+        self.assertIsNot(m1, m2)
+        self.assertIn("000660", m2.volatility_patterns)
+
+    def test_shared_instance_is_read_only(self):
+        model = rsm.get_realistic_model(self.data_dir)
+        with self.assertRaises(TypeError):
+            model.volatility_patterns["999999"] = {}
+
+    def test_ticker_arrays_are_built_once_across_threads(self):
+        model = rsm.get_realistic_model(self.data_dir)
+        results = []
+        with mock.patch.object(model, "_build_ticker_arrays", wraps=model._build_ticker_arrays) as build:
+            threads = [threading.Thread(target=lambda: results.append(model._ticker_arrays(["005930"])))
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(build.call_count, 1)
+        self.assertTrue(all(arrays is results[0] for arrays in results))
+        with self.assertRaises(ValueError):
+            results[0]["volatility"][0] = 1.0
+
+
+class _MidpointRng:
+    """노이즈 0, 균등분포는 구간 중앙값을 돌려주는 결정적 난수 생성기"""
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        return np.zeros(size) + loc
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return np.zeros(size) + (low + high) / 2
+
+
+class TestBatchChange(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        _write_series(os.path.join(self.tmp.name, "005930_KS_h1.jsonl"), [0.01, -0.02, 0.03, 0.01] * 5)
+        _write_series(os.path.join(self.tmp.name, "000660_KS_h1.jsonl"), [0.005, 0.004, -0.03] * 5)
+        self.model = rsm.RealisticStockMovement(data_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_scalar_function(self):
+        events = [
+            {"event_type": "a", "category": "기술", "sentiment": 0.6, "impact_level": 4},
+            {"event_type": "b", "category": "정치", "sentiment": -0.8, "impact_level": 2},
+            {"event_type": "c", "category": "미분류", "sentiment": 0.1, "impact_level": 5},
+        ]
+        codes = ["005930", "000660", "005380", "999999"]
+        prices = np.array([[79000.0, 45000.0, 180000.0, 1000.0], [70000.0, 50000.0, 170000.0, 1100.0]])
+
+        batch = self.model.calculate_realistic_change_batch(events, codes, prices, rng=_MidpointRng())
+        self.assertEqual(batch["delta"].shape, (3, 2, 4))
+
+        with mock.patch.object(rsm.np.random, "normal", lambda loc, scale: loc), \
+                mock.patch.object(rsm.random, "uniform", lambda a, b: (a + b) / 2):
+            for e, event in enumerate(events):
+                for p in range(prices.shape[0]):
+                    for t, code in enumerate(codes):
+                        expected = self.model.calculate_realistic_change(event, code, prices[p, t])
+                        self.assertAlmostEqual(batch["delta"][e, p, t], expected["delta"], places=6)
+                        self.assertAlmostEqual(batch["price"][e, p, t], expected["price"], places=4)
+                        self.assertAlmostEqual(batch["volume"][e, p, t], expected["volume"], places=6)
+
+    def test_correlation_matrix_matches_rules(self):
+        self.assertEqual(self.model._get_sector_correlation("기술", "IT/전자"), 1.0)
+        self.assertEqual(self.model._get_sector_correlation("기술", "자동차"), 0.4)
+        self.assertEqual(self.model._get_sector_correlation("정치", "금융"), 1.0)
+        self.assertEqual(self.model._get_sector_correlation("정치", "통신"), 0.1)
+        self.assertEqual(self.model._get_sector_correlation("미분류", "금융"), 0.3)
+
+    def test_spillover_raises_related_sectors(self):
+        direct = self.model.sector_correlations(["금융"])[0]
+        spilled = self.model.sector_correlations(["금융"], spillover_weight=0.5)[0]
+        j = self.model.sector_index
+        # 금융 이벤트 → IT/전자(직접) → 통신(관계 0.2)으로 번짐
+        self.assertAlmostEqual(spilled[j["통신"]], direct[j["통신"]] + 0.5 * 0.2, places=6)
+        # IT/전자와 음의 관계인 건설은 오히려 약해짐
+        self.assertLess(spilled[j["건설"]], direct[j["건설"]])
+        self.assertTrue(np.all((spilled >= 0.0) & (spilled <= 1.0)))
+
+    def test_unknown_ticker_is_unchanged(self):
+        event = {"category": "기술", "sentiment": 1.0, "impact_level": 5}
+        result = self.model.calculate_realistic_change_batch([event], ["999999"], [1234.0])
+        self.assertEqual(result["delta"][0, 0, 0], 0.0)
+        self.assertEqual(result["price"][0, 0, 0], 1234.0)
+        self.assertEqual(result["volume"][0, 0, 0], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
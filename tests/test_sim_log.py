@@ -0,0 +1,72 @@
+import unittest
+
+from utils import sim_log
+from utils.sim_log import LogRingBuffer, clear_log_buffers, drop_log_buffer, find_log_buffer, get_log_buffer
+
+
+class TestLogRingBuffer(unittest.TestCase):
+    def test_capacity_and_cursor(self):
+        buffer = LogRingBuffer(capacity=3, echo=False)
+        for n in range(5):
+            buffer.info(f"m{n}")
+        logs, cursor = buffer.query(limit=10)
+        self.assertEqual([log["message"] for log in logs], ["m4", "m3", "m2"])
+        self.assertEqual(cursor, 5)
+        self.assertEqual(buffer.stats()["evicted"], 2)
+
+        buffer.warning("m5")
+        logs, cursor = buffer.query(cursor=5)
+        self.assertEqual([log["message"] for log in logs], ["m5"])
+        self.assertEqual(buffer.query(cursor=cursor)[0], [])
+
+    def test_cursor_pages_forward_without_skipping(self):
+        buffer = LogRingBuffer(echo=False)
+        for n in range(5):
+            buffer.info(f"m{n}")
+        logs, cursor = buffer.query(cursor=0, limit=2)
+        self.assertEqual([log["message"] for log in logs], ["m1", "m0"])
+        self.assertEqual(cursor, 2)
+        logs, cursor = buffer.query(cursor=cursor, limit=2)
+        self.assertEqual([log["message"] for log in logs], ["m3", "m2"])
+        logs, cursor = buffer.query(cursor=cursor, limit=2)
+        self.assertEqual(([log["message"] for log in logs], cursor), (["m4"], 5))
+
+    def test_level_filter(self):
+        buffer = LogRingBuffer(echo=False)
+        buffer.debug("d")
+        buffer.info("i")
+        buffer.error("e")
+        logs, _ = buffer.query(min_level="WARNING")
+        self.assertEqual([log["level"] for log in logs], ["ERROR"])
+
+    def test_ticker_debug_logs_are_sampled(self):
+        buffer = LogRingBuffer(debug_sample_every=5, echo=False)
+        for _ in range(10):
+            buffer.debug("tick", ticker="005930")
+            buffer.info("tick", ticker="005930")
+        logs, _ = buffer.query(limit=100)
+        self.assertEqual(sum(1 for log in logs if log["level"] == "DEBUG"), 2)
+        self.assertEqual(sum(1 for log in logs if log["level"] == "INFO"), 10)
+        self.assertEqual(buffer.stats()["sampled_out"], 8)
+
+    def test_registry_is_per_simulation(self):
+        clear_log_buffers()
+        self.assertIs(get_log_buffer("a"), get_log_buffer("a"))
+        self.assertIsNot(get_log_buffer("a"), get_log_buffer("b"))
+        drop_log_buffer("b")
+        self.assertIsNone(find_log_buffer("b"))
+        clear_log_buffers()
+
+    def test_registry_evicts_least_recently_used(self):
+        clear_log_buffers()
+        first = get_log_buffer("sim-0")
+        for n in range(1, sim_log.MAX_BUFFERS + 1):
+            get_log_buffer(f"sim-{n}")
+        self.assertIsNone(find_log_buffer("sim-0"))
+        self.assertIsNotNone(find_log_buffer(f"sim-{sim_log.MAX_BUFFERS}"))
+        self.assertIsNot(get_log_buffer("sim-0"), first)
+        clear_log_buffers()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import contextlib
+import io
+import unittest
+from datetime import datetime, timedelta
+
+from core.models.announcer.event import Event
+from core.models.simulation_engine import ClockMode, SimulationEngine, SimulationSpeed
+from data.parameter_templates import get_initial_data
+
+
+def _fixed_events(**kwargs):
+    return [Event(id="event-fixed", event_type="정책 금리 조정 논의", category="경제",
+                  sentiment=0.2, impact_level=2, duration="short")]
+
+
+class TestVirtualClock(unittest.TestCase):
+    def setUp(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.engine = SimulationEngine(get_initial_data())
+            self.engine.announcer.generate_events = _fixed_events
+            self.engine.enable_news_generation(False)
+            self.engine.set_speed(SimulationSpeed.NORMAL)
+            self.engine.set_event_generation_interval(5)  # 5초 × 2시간 = 시뮬레이션 10시간마다
+            self.engine.set_clock_mode(ClockMode.VIRTUAL)
+        self.t0 = datetime(2024, 1, 1, 9, 0)
+
+    def _quiet(self, fn, *args, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn(*args, **kwargs)
+
+    def test_advance_moves_simulation_time_in_fixed_steps(self):
+        self._quiet(self.engine.start, start_time=self.t0)
+        self.assertEqual(self._quiet(self.engine.advance, 12), 12)
+        self.assertEqual(self.engine.simulation_time, self.t0 + timedelta(hours=24))
+
+    def test_events_scheduled_on_simulation_time(self):
+        self._quiet(self.engine.start, start_time=self.t0)
+        # 24시간(12스텝) 동안 첫 스텝, +10h, +20h 에 이벤트 생성
+        self._quiet(self.engine.advance, 12)
+        self.assertEqual(len(self.engine.events_history), 3)
+
+    def test_update_is_noop_in_virtual_mode(self):
+        self._quiet(self.engine.start, start_time=self.t0)
+        self.engine.last_update = 0
+        self._quiet(self.engine.update)
+        self.assertEqual(self.engine.simulation_time, self.t0)
+
+    def test_advance_requires_virtual_mode(self):
+        self._quiet(self.engine.set_clock_mode, ClockMode.REALTIME)
+        self._quiet(self.engine.start, start_time=self.t0)
+        with self.assertRaises(RuntimeError):
+            self.engine.advance(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
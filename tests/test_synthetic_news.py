@@ -0,0 +1,42 @@
+import unittest
+
+from core.models.announcer.news import Media
+from core.models.announcer.synthetic_news import build_synthetic_article
+
+EVENT = {"event_type": "정책 금리 조정 논의", "category": "금융", "sentiment": -0.6, "impact_level": 4, "duration": "short"}
+
+
+class TestSyntheticNews(unittest.TestCase):
+    def test_deterministic_per_event_and_outlet(self):
+        outlet = Media("KBS", 0.0, 0.9)
+        self.assertEqual(build_synthetic_article(EVENT, outlet), build_synthetic_article(EVENT, outlet))
+
+    def test_articles_vary_across_outlets(self):
+        outlets = [Media(f"언론{i}", bias, cred) for i, (bias, cred) in
+                   enumerate([(-0.8, 0.7), (0.7, 0.8), (0.0, 0.6), (0.8, 0.3), (0.0, 0.9), (-0.5, 0.7)])]
+        articles = {build_synthetic_article(EVENT, o) for o in outlets}
+        self.assertEqual(len(articles), len(outlets))
+
+    def test_reflects_event_and_outlet_traits(self):
+        article = build_synthetic_article(EVENT, Media("SNS속보", 0.8, 0.3),
+                                          recent_events=[{"event": {"event_type": "대형 M&A 루머"}}])
+        self.assertIn("정책 금리 조정 논의", article)
+        self.assertIn("대형 M&A 루머", article)
+        self.assertIn("단기 재료", article)
+        self.assertGreaterEqual(len(article), 150)
+
+    def test_links_most_recent_other_event(self):
+        recent = [{"event": {"event_type": "정책 금리 조정 논의"}},  # 현재 사건 (최신순 첫 항목)
+                  {"event": {"event_type": "반도체 수출 급증"}},
+                  {"event": {"event_type": "오래된 사건"}}]
+        article = build_synthetic_article(EVENT, Media("YTN", 0.0, 0.7), recent_events=recent)
+        self.assertIn("반도체 수출 급증", article)
+        self.assertNotIn("오래된 사건", article)
+
+    def test_handles_missing_fields(self):
+        article = build_synthetic_article({}, Media("YTN", 0.0, 0.7))
+        self.assertIn("시장 동향", article)
+
+
+if __name__ == "__main__":
+    unittest.main()
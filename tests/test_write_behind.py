@@ -0,0 +1,189 @@
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import utils.logger as logger
+from utils.write_behind import WriteBehindQueue
+
+
+class _FakeRef:
+    def __init__(self, path=()):
+        self.path = path
+
+    def collection(self, name):
+        return _FakeRef(self.path + (name,))
+
+    def document(self, doc_id):
+        return _FakeRef(self.path + (doc_id,))
+
+
+class _FakeBatch:
+    def __init__(self, db):
+        self._db = db
+        self._writes = []
+
+    def set(self, ref, payload):
+        self._writes.append((ref.path, payload))
+
+    def commit(self):
+        self._db.gate.wait(2)
+        if self._db.fail_next:
+            self._db.fail_next -= 1
+            raise RuntimeError("unavailable")
+        self._db.commits.append(self._writes)
+
+
+class _FakeFirestore(_FakeRef):
+    """db.batch()와 collection/document 체인만 흉내내는 Firestore"""
+
+    def __init__(self):
+        super().__init__()
+        self.commits = []
+        self.fail_next = 0
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def batch(self):
+        return _FakeBatch(self)
+
+    def written_paths(self):
+        return [path for commit in self.commits for path, _ in commit]
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestWriteBehindQueue(unittest.TestCase):
+    def setUp(self):
+        self.db = _FakeFirestore()
+        self.queues = []
+
+    def tearDown(self):
+        self.db.gate.set()
+        for queue in self.queues:
+            queue.close(timeout=1)
+
+    def _queue(self, **kwargs):
+        kwargs.setdefault("retry_delay", 0.0)
+        kwargs.setdefault("on_error", lambda message: None)
+        queue = WriteBehindQueue(lambda: self.db, **kwargs)
+        self.queues.append(queue)
+        return queue
+
+    def test_commits_by_size_and_by_time(self):
+        queue = self._queue(batch_size=2, flush_interval=60)
+        queue.set(("sims", "s", "events", "e1"), {"n": 1})
+        queue.set(("sims", "s", "events", "e2"), {"n": 2})
+        self.assertTrue(_wait_until(lambda: len(self.db.commits) == 1))
+        self.assertEqual(len(self.db.commits[0]), 2)
+
+        queue = self._queue(batch_size=100, flush_interval=0.05)
+        queue.set(("sims", "s", "events", "e3"), {"n": 3})
+        self.assertTrue(_wait_until(lambda: len(self.db.commits) == 2))
+
+    def test_pending_writes_are_readable_until_committed(self):
+        queue = self._queue(flush_interval=60)
+        queue.set(("sims", "s", "events", "e1"), {"created_at": "1"})
+        queue.set(("sims", "s", "events", "e1", "news", "n1"), {"created_at": "2"})
+        self.assertEqual(queue.pending(("sims", "s", "events", "e1")), {"created_at": "1"})
+        self.assertEqual(queue.pending_in(("sims", "s", "events")), [{"created_at": "1"}])
+        self.assertTrue(queue.flush(timeout=2))
+        self.assertIsNone(queue.pending(("sims", "s", "events", "e1")))
+        self.assertEqual(self.db.commits[0][0], (("sims", "s", "events", "e1"), {"created_at": "1"}))
+
+    def test_backpressure_coalesces_snapshots_and_drops_them_first(self):
+        queue = self._queue(batch_size=1, flush_interval=0, max_pending=2, put_timeout=5)
+        self.db.gate.clear()
+        queue.set(("sims", "s", "snapshots", "a"), {"n": 1}, coalesce_key="snap")
+        self.assertTrue(_wait_until(lambda: queue.stats()["inflight"] == 1))
+        queue.set(("sims", "s", "events", "e1"), {"n": 2})
+        queue.set(("sims", "s", "snapshots", "b"), {"n": 3}, coalesce_key="snap")
+        self.assertTrue(queue.set(("sims", "s", "snapshots", "c"), {"n": 4}, coalesce_key="snap"))
+        # 가득 찬 큐에 합칠 수 없는 쓰기 → 대기 스냅샷을 버리고 들어감
+        self.assertTrue(queue.set(("sims", "s", "events", "e2"), {"n": 5}))
+        started = time.monotonic()
+        self.assertFalse(queue.set(("sims", "s", "events", "e3"), {"n": 6}))  # 버릴 스냅샷이 없으면 기다리지 않고 버림
+        self.assertLess(time.monotonic() - started, 1.0)
+
+        self.db.gate.set()
+        self.assertTrue(queue.flush(timeout=2))
+        self.assertEqual(
+            self.db.written_paths(),
+            [("sims", "s", "snapshots", "a"), ("sims", "s", "events", "e1"), ("sims", "s", "events", "e2")],
+        )
+        stats = queue.stats()
+        self.assertEqual((stats["coalesced"], stats["dropped"], stats["committed"]), (1, 2, 3))
+
+    def test_required_writes_are_never_dropped(self):
+        queue = self._queue(batch_size=1, flush_interval=0, max_pending=1)
+        self.db.gate.clear()
+        queue.set(("sims", "s", "events", "e1"), {"n": 1})
+        self.assertTrue(_wait_until(lambda: queue.stats()["inflight"] == 1))
+        queue.set(("sims", "s", "events", "e2", "news", "n1"), {"n": 2})
+        self.assertTrue(queue.set(("sims", "s", "events", "e3"), {"n": 3}, required=True))
+        self.assertEqual((queue.stats()["pending"], queue.stats()["overflowed"]), (2, 1))
+
+        self.db.gate.set()
+        self.assertTrue(queue.flush(timeout=2))
+        self.assertIn(("sims", "s", "events", "e3"), self.db.written_paths())
+        self.assertEqual(queue.stats()["dropped"], 0)
+
+    def test_blocking_set_waits_for_room(self):
+        queue = self._queue(batch_size=1, flush_interval=0, max_pending=1, put_timeout=2)
+        self.db.gate.clear()
+        queue.set(("sims", "s", "events", "e1"), {"n": 1})
+        self.assertTrue(_wait_until(lambda: queue.stats()["inflight"] == 1))
+        queue.set(("sims", "s", "events", "e2"), {"n": 2})
+        threading.Timer(0.05, self.db.gate.set).start()
+        self.assertTrue(queue.set(("sims", "s", "events", "e3"), {"n": 3}, block=True))
+        self.assertTrue(queue.flush(timeout=2))
+        self.assertEqual(len(self.db.written_paths()), 3)
+
+    def test_failed_commit_is_retried(self):
+        queue = self._queue(flush_interval=0)
+        self.db.fail_next = 1
+        queue.set(("sims", "s", "events", "e1"), {"n": 1})
+        self.assertTrue(queue.flush(timeout=2))
+        self.assertEqual(self.db.written_paths(), [("sims", "s", "events", "e1")])
+        self.assertEqual(queue.stats()["failed"], 0)
+
+    def test_logger_reads_through_pending_event_log(self):
+        queue = self._queue(flush_interval=60)
+        with mock.patch.object(logger, "get_firestore", return_value=self.db), \
+                mock.patch.object(logger, "get_write_queue", return_value=queue):
+            logger.save_event_log(
+                "sim", event_id="event-1", event_payload={"id": "event-1"}, affected_stocks=[],
+                market_impact=0.1, simulation_time=datetime(2024, 1, 1),
+            )
+            self.assertEqual(logger.get_event_log("sim", "event-1")["event"], {"id": "event-1"})
+            self.assertEqual(self.db.commits, [])
+            self.assertTrue(queue.flush(timeout=2))
+        self.assertEqual(self.db.written_paths(), [("simulations", "sim", "events", "event-1")])
+
+    def test_logger_event_logs_survive_a_full_queue(self):
+        queue = self._queue(flush_interval=60, max_pending=1)
+        with mock.patch.object(logger, "get_firestore", return_value=self.db), \
+                mock.patch.object(logger, "get_write_queue", return_value=queue):
+            logger.save_market_snapshot("sim", stocks={}, market_params={}, simulation_time=datetime(2024, 1, 1))
+            for event_id in ("event-1", "event-2"):
+                logger.save_event_log(
+                    "sim", event_id=event_id, event_payload={"id": event_id}, affected_stocks=[],
+                    market_impact=0.1, simulation_time=datetime(2024, 1, 1),
+                )
+            self.assertIsNotNone(logger.get_event_log("sim", "event-1"))
+            self.assertIsNotNone(logger.get_event_log("sim", "event-2"))
+            self.assertTrue(queue.flush(timeout=2))
+        paths = self.db.written_paths()
+        self.assertEqual([p for p in paths if p[2] == "events"],
+                         [("simulations", "sim", "events", "event-1"), ("simulations", "sim", "events", "event-2")])
+        self.assertEqual(queue.stats()["dropped"], 1)  # 스냅샷만 버려짐
+
+
+if __name__ == "__main__":
+    unittest.main()
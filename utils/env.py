@@ -0,0 +1,22 @@
+"""
+환경 변수 읽기 도우미
+설정용 숫자 환경 변수가 잘못되어도 프로세스가 죽거나 LLM 호출마다 예외가 나지 않도록,
+해석할 수 없는 값은 경고를 남기고 기본값으로 대체한다.
+"""
+
+import os
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def env_number(name: str, default: T, cast: Callable[[str], T] = int) -> T:
+    """환경 변수를 숫자로 읽음. 비어 있거나 형식이 잘못되면 경고를 남기고 기본값 사용"""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return cast(raw)
+    except ValueError:
+        print(f"⚠️ {name}={raw!r} 값을 해석할 수 없어 기본값 {default}를 사용합니다.")
+        return default
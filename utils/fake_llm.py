@@ -0,0 +1,412 @@
+"""
+가짜 LLM 백엔드 (Ollama /api/generate 프로토콜 호환)
+Ollama 없이 Announcer/SimulationEngine의 LLM 경로를 벤치마크하거나 CI에서 돌리기 위한 대역.
+
+- FakeLLM: 프롬프트 종류(사건 생성 / 언론사 묶음 기사 / 단일 기사 / prefix 평가 / 워밍업)를 알아보고
+  그 형식에 맞는 응답을 합성한다. 지연 시간 분포, 초당 토큰, 깨진 JSON 비율, 실패 비율을 설정할 수 있다.
+- FakeLLMSession: LlamaClient(session=...)에 바로 꽂는 프로세스 내 전송 계층 (HTTP 없이 같은 스레드에서 응답)
+- serve(): 같은 응답을 실제 HTTP 서버로 제공 (`python -m utils.fake_llm --port 11434`)
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from core.models.announcer.news import Media
+from core.models.announcer.synthetic_news import build_synthetic_article
+
+DEFAULT_CATEGORIES = ["경제", "정책", "기업", "기술", "국제", "금융", "화학", "에너지", "자동차", "통신"]
+EVENT_TITLES = [
+    "산업 지원 정책 발표", "분기 실적 발표", "신기술 상용화 추진", "해외 수요 급변",
+    "금리 조정 논의", "대형 M&A 추진설", "신규 공장 증설 계획", "규제 완화 방안 검토",
+]
+
+# 토큰 근사: 공백 + 글자 최대 3개 (한국어 기준 Ollama 토큰 수와 비슷한 규모)
+_TOKEN_RE = re.compile(r"\s*\S{1,3}|\s+")
+
+
+def split_tokens(text: str) -> List[str]:
+    """응답 텍스트를 스트림 조각(토큰 근사)으로 분할 (이어 붙이면 원문과 같음)"""
+    return _TOKEN_RE.findall(text)
+
+
+def _field(prompt: str, label: str, default: str = "") -> str:
+    match = re.search(rf"- {re.escape(label)}: ([^\n/(]+)", prompt)
+    return match.group(1).strip() if match else default
+
+
+def _float(value: str, default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class FakeLLM:
+    """
+    /api/generate 요청 payload → 응답 (텍스트 + Ollama 메타데이터).
+
+    Args:
+        latency: 요청당 평균 고정 지연(초, 프롬프트 평가 + 첫 토큰까지)
+        jitter: 지연 시간의 로그정규 분산 (0이면 항상 latency)
+        tokens_per_sec: 생성 속도 (0이면 즉시)
+        malformed_rate: JSON 응답을 중간에 자른 채 돌려줄 확률 (기사 본문은 머리말을 붙임)
+        failure_rate: HTTP failure_status로 실패할 확률
+        failure_status: 실패 시 상태 코드 (기본 503, LlamaClient가 재시도하는 코드)
+        seed: 난수 시드 (같은 시드 + 같은 요청 순서면 같은 결과)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        tokens_per_sec: float = 0.0,
+        malformed_rate: float = 0.0,
+        failure_rate: float = 0.0,
+        failure_status: int = 503,
+        seed: Optional[int] = None,
+    ):
+        self.latency = max(0.0, latency)
+        self.jitter = max(0.0, jitter)
+        self.tokens_per_sec = max(0.0, tokens_per_sec)
+        self.malformed_rate = malformed_rate
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        # prefill로 돌려준 context → prefix 텍스트 (context로 이어 보낸 요청의 전체 프롬프트 복원용)
+        self._contexts: Dict[int, str] = {}
+        self.requests = 0
+        self.failures = 0
+        self.malformed = 0
+
+    # -----------------------------
+    # 무작위 요소
+    # -----------------------------
+    def _random(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def sample_latency(self) -> float:
+        if self.latency <= 0:
+            return 0.0
+        if self.jitter <= 0:
+            return self.latency
+        with self._lock:
+            # 평균이 latency가 되도록 로그정규 분포의 위치를 보정
+            return self._rng.lognormvariate(0.0, self.jitter) * self.latency / (2.718281828 ** (self.jitter ** 2 / 2))
+
+    def token_delay(self) -> float:
+        return 1.0 / self.tokens_per_sec if self.tokens_per_sec > 0 else 0.0
+
+    # -----------------------------
+    # 응답 합성
+    # -----------------------------
+    def respond(self, payload: Dict[str, Any]) -> Tuple[int, Optional[str], Dict[str, Any]]:
+        """
+        Returns:
+            (HTTP 상태 코드, 응답 텍스트 또는 None(실패), 완료 메타데이터)
+        """
+        with self._lock:
+            self.requests += 1
+        if self.failure_rate and self._random() < self.failure_rate:
+            with self._lock:
+                self.failures += 1
+            return self.failure_status, None, {"error": "fake overload"}
+
+        prompt = payload.get("prompt") or ""
+        context = payload.get("context")
+        if context:
+            with self._lock:
+                prefix = self._contexts.get(context[0])
+            if prefix is not None:
+                prompt = f"{prefix}\n\n{prompt}"
+        options = payload.get("options") or {}
+
+        meta: Dict[str, Any] = {"model": payload.get("model"), "prompt_eval_count": len(split_tokens(prompt))}
+        if not prompt:  # 워밍업/언로드
+            text = ""
+        elif options.get("num_predict") == 1:  # prefill: context만 필요
+            key = zlib.crc32(prompt.encode("utf-8"))
+            with self._lock:
+                self._contexts[key] = prompt
+            meta["context"] = [key]
+            text = "네"
+        else:
+            text = self._generate_text(prompt)
+
+        limit = options.get("num_predict")
+        if limit and limit > 0:
+            text = "".join(split_tokens(text)[:limit])
+        return 200, text, meta
+
+    def _generate_text(self, prompt: str) -> str:
+        seed = zlib.crc32(prompt.encode("utf-8"))
+        rng = random.Random(seed)
+        if "[언론사 목록]" in prompt:
+            text = json.dumps({"articles": [
+                {"outlet": outlet.name, "news_article": self._article(prompt, outlet, rng)}
+                for outlet in self._parse_outlets(prompt)
+            ]}, ensure_ascii=False)
+            return self._maybe_malform(text, is_json=True)
+        if "새 사건" in prompt and "JSON" in prompt:
+            return self._maybe_malform(self._events(prompt, rng), is_json=True)
+        outlet = Media(
+            name=_field(prompt, "이름", "언론사"),
+            bias=_float(_field(prompt, "성향 (bias)"), 0.0),
+            credibility=_float(_field(prompt, "신뢰도 (credibility)"), 0.7),
+        )
+        return self._maybe_malform(self._article(prompt, outlet, rng), is_json=False)
+
+    @staticmethod
+    def _parse_outlets(prompt: str) -> List[Media]:
+        pattern = r"- 이름: (.+?) / 성향 \(bias\): ([-\d.]+) / 신뢰도 \(credibility\): ([\d.]+)"
+        return [Media(name=n, bias=float(b), credibility=float(c)) for n, b, c in re.findall(pattern, prompt)]
+
+    @staticmethod
+    def _article(prompt: str, outlet: Media, rng: random.Random) -> str:
+        event = {
+            "event_type": _field(prompt, "제목", "시장 동향"),
+            "category": _field(prompt, "카테고리", "경제"),
+            "sentiment": _float(_field(prompt, "감성 점수"), 0.0),
+            "impact_level": _float(_field(prompt, "영향 수준"), 3),
+            "duration": _field(prompt, "지속 기간", "mid"),
+        }
+        return build_synthetic_article(event, outlet, rng=rng)
+
+    @staticmethod
+    def _events(prompt: str, rng: random.Random) -> str:
+        count_match = re.search(r"새 사건 (\d+)개", prompt)
+        count = int(count_match.group(1)) if count_match else 1
+        categories_match = re.search(r'"category": "(.+?) 중 하나"', prompt)
+        categories = categories_match.group(1).split(", ") if categories_match else DEFAULT_CATEGORIES
+        events = []
+        for _ in range(count):
+            category = rng.choice(categories)
+            events.append({
+                "event_type": f"{category} {rng.choice(EVENT_TITLES)}",
+                "category": category,
+                "sentiment": round(rng.uniform(-1.0, 1.0), 2),
+                "impact_level": rng.randint(1, 5),
+                "duration": rng.choice(["short", "mid", "long"]),
+            })
+        return json.dumps(events, ensure_ascii=False, indent=2)
+
+    def _maybe_malform(self, text: str, is_json: bool) -> str:
+        if not self.malformed_rate or self._random() >= self.malformed_rate:
+            return text
+        with self._lock:
+            self.malformed += 1
+        if is_json:
+            # 닫는 괄호 전에 끊긴 응답 (토큰 한도/모델 실수 재현)
+            return text[: max(1, int(len(text) * 0.6))]
+        return f"뉴스 기사: {text}"
+
+    # -----------------------------
+    # 응답 본문 (지연 포함)
+    # -----------------------------
+    def finish(self, text: str, meta: Dict[str, Any], started: float) -> Dict[str, Any]:
+        """완료 조각 (Ollama done=true 응답의 메타데이터 필드)"""
+        total = time.monotonic() - started
+        eval_count = len(split_tokens(text))
+        eval_duration = eval_count * self.token_delay()
+        done = dict(meta)
+        done.update({
+            "response": "",
+            "done": True,
+            "eval_count": eval_count,
+            "eval_duration": int(eval_duration * 1e9),
+            "prompt_eval_duration": int(max(0.0, total - eval_duration) * 1e9),
+            "total_duration": int(total * 1e9),
+            "load_duration": 0,
+        })
+        return done
+
+    def iter_stream(self, text: str, meta: Dict[str, Any], started: float) -> Iterator[Dict[str, Any]]:
+        """NDJSON 스트림 조각들 (토큰마다 1개, 마지막은 메타데이터)"""
+        delay = self.token_delay()
+        for token in split_tokens(text):
+            if delay:
+                time.sleep(delay)
+            yield {"model": meta.get("model"), "response": token, "done": False}
+        yield self.finish(text, meta, started)
+
+    def complete(self, text: str, meta: Dict[str, Any], started: float) -> Dict[str, Any]:
+        """비스트리밍 응답 (생성 시간만큼 기다린 뒤 전체 텍스트)"""
+        delay = self.token_delay()
+        if delay:
+            time.sleep(delay * len(split_tokens(text)))
+        done = self.finish(text, meta, started)
+        done["response"] = text
+        return done
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"requests": self.requests, "failures": self.failures, "malformed": self.malformed}
+
+
+class FakeResponse:
+    """requests.Response 중 LlamaClient가 쓰는 부분만 구현"""
+
+    def __init__(self, fake: FakeLLM, status_code: int, text: Optional[str], meta: Dict[str, Any],
+                 started: float, stream: bool):
+        self.status_code = status_code
+        self._fake = fake
+        self._text = text
+        self._meta = meta
+        self._started = started
+        self._stream = stream
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+    def json(self) -> Dict[str, Any]:
+        if self._text is None:
+            return dict(self._meta)
+        return self._fake.complete(self._text, self._meta, self._started)
+
+    def iter_lines(self) -> Iterator[bytes]:
+        for chunk in self._fake.iter_stream(self._text or "", self._meta, self._started):
+            if self.closed:
+                return
+            yield json.dumps(chunk, ensure_ascii=False).encode("utf-8")
+
+    def close(self):
+        self.closed = True
+
+
+class FakeLLMSession:
+    """LlamaClient(session=FakeLLMSession(fake))로 HTTP 없이 가짜 응답을 받는 전송 계층"""
+
+    def __init__(self, fake: FakeLLM):
+        self.fake = fake
+
+    def post(self, url, json=None, timeout=None, stream=False) -> FakeResponse:
+        started = time.monotonic()
+        status, text, meta = self.fake.respond(json or {})
+        wait = self.fake.sample_latency()
+        if wait:
+            time.sleep(wait)
+        return FakeResponse(self.fake, status, text, meta, started, stream)
+
+    def close(self):
+        pass
+
+
+def install_fake_llm(fake: FakeLLM, **client_kwargs):
+    """
+    공유 LLM 클라이언트를 가짜 백엔드로 교체하고 그 클라이언트를 반환.
+    client_kwargs는 LlamaClient 인자 (기본: 캐시 없음, 재시도 백오프 없음)
+    """
+    from llama_client import LlamaClient, set_client
+
+    client_kwargs.setdefault("backoff", 0.0)
+    client = LlamaClient(session=FakeLLMSession(fake), **client_kwargs)
+    set_client(client)
+    return client
+
+
+# -----------------------------
+# HTTP 서버
+# -----------------------------
+def _make_handler(fake: FakeLLM):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            if self.path != "/api/generate":
+                self.send_error(404)
+                return
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            started = time.monotonic()
+            status, text, meta = fake.respond(payload)
+            wait = fake.sample_latency()
+            if wait:
+                time.sleep(wait)
+            if text is None:
+                self._send_json(status, meta)
+            elif payload.get("stream", True):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for chunk in fake.iter_stream(text, meta, started):
+                        line = json.dumps(chunk, ensure_ascii=False).encode("utf-8") + b"\n"
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                        self.wfile.flush()
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # 클라이언트 조기 종료
+            else:
+                self._send_json(200, fake.complete(text, meta, started))
+
+        def do_GET(self):
+            if self.path == "/api/tags":
+                self._send_json(200, {"models": [{"name": "fake"}]})
+            else:
+                self.send_error(404)
+
+        def _send_json(self, status: int, body: Dict[str, Any]):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(fake: FakeLLM, host: str = "127.0.0.1", port: int = 11434) -> ThreadingHTTPServer:
+    """가짜 백엔드를 HTTP 서버로 띄움 (백그라운드 스레드, server.shutdown()으로 종료)"""
+    server = ThreadingHTTPServer((host, port), _make_handler(fake))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-llm-server", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama /api/generate 호환 가짜 LLM 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--latency", type=float, default=0.3, help="요청당 평균 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.5, help="지연 시간 로그정규 분산")
+    parser.add_argument("--tokens-per-sec", type=float, default=40.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    fake = FakeLLM(
+        latency=args.latency,
+        jitter=args.jitter,
+        tokens_per_sec=args.tokens_per_sec,
+        malformed_rate=args.malformed_rate,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    server = serve(fake, args.host, args.port)
+    print(f"[fake-llm] http://{args.host}:{args.port} (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+스트리밍 LLM 응답용 증분 JSON 스캐너
+토큰 조각을 받을 때마다 이어서 훑어, 최상위 JSON 객체/배열이 닫히는 순간을 알려 준다.
+이미 본 문자는 다시 보지 않으므로 전체 비용은 O(응답 길이)이다.
+decode_json_items()는 완성된(또는 잘린) 응답의 배열을 원소 단위로 디코딩한다.
+"""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class JsonStreamScanner:
+    """
+    첫 최상위 JSON 값({...} 또는 [...])이 완성되었는지 추적.
+
+    - 문자열 리터럴 안의 괄호와 이스케이프는 깊이 계산에서 제외
+    - 괄호가 닫힌 후보가 json.loads에 실패하면(예: 설명문 속 "[참고]") 버리고 계속 탐색
+    - leading_only=True이면 응답이 JSON으로 시작할 때만 추적 (평문 기사 응답용)
+    """
+
+    def __init__(self, leading_only: bool = False):
+        self.leading_only = leading_only
+        self.block: Optional[str] = None
+        self.disabled = False
+        self._text = []
+        self._pos = 0
+        self._start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        return self.block is not None
+
+    def feed(self, chunk: str) -> bool:
+        """조각 추가, 완성된 JSON 블록이 생기면 True (이후 호출도 계속 True)"""
+        if self.block is not None:
+            return True
+        if self.disabled:
+            return False
+        self._text.append(chunk)
+        for ch in chunk:
+            pos = self._pos
+            self._pos += 1
+            if self._start is None:
+                if ch in "{[":
+                    self._start = pos
+                    self._depth = 1
+                elif self.leading_only and not ch.isspace():
+                    self.disabled = True
+                    return False
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    candidate = "".join(self._text)[self._start:pos + 1]
+                    try:
+                        json.loads(candidate)
+                    except ValueError:
+                        self._start = None
+                        if self.leading_only:
+                            self.disabled = True
+                            return False
+                        continue
+                    self.block = candidate
+                    return True
+        return False
+
+
+_DECODER = json.JSONDecoder()
+
+
+def decode_json_items(text: str, list_key: Optional[str] = None) -> Tuple[List[Any], bool]:
+    """
+    응답의 첫 JSON 값을 원소 단위로 디코딩 (정규식 없이 raw_decode로 앞에서부터 훑음).
+    - 배열이면 원소를 하나씩 디코딩해, 중간에 잘리거나 깨진 응답이어도 그 앞까지의 원소는 살린다
+    - 객체면 list_key 배열이 있으면 그 원소들, 없으면 객체 하나를 원소로 취급
+    - JSON 앞의 설명문 속 괄호(예: "[참고]")는 건너뛴다
+
+    Returns:
+        (원소 목록, 끝까지 정상적으로 디코딩했는지)
+    """
+    search = 0
+    while True:
+        starts = [i for i in (text.find("[", search), text.find("{", search)) if i >= 0]
+        if not starts:
+            return [], False
+        pos = min(starts)
+        items, complete = _decode_items_at(text, pos, list_key)
+        if items or complete:
+            return items, complete
+        search = pos + 1
+
+
+def _decode_items_at(text: str, pos: int, list_key: Optional[str]) -> Tuple[List[Any], bool]:
+    if text[pos] == "{":
+        try:
+            obj, _ = _DECODER.raw_decode(text, pos)
+        except ValueError:
+            return [], False
+        if list_key is not None and isinstance(obj.get(list_key), list):
+            return obj[list_key], True
+        return [obj], True
+
+    items: List[Any] = []
+    pos += 1
+    length = len(text)
+    while True:
+        while pos < length and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= length:
+            return items, False
+        if text[pos] == "]":
+            return items, True
+        try:
+            item, pos = _DECODER.raw_decode(text, pos)
+        except ValueError:
+            return items, False
+        items.append(item)
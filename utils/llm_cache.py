@@ -0,0 +1,172 @@
+"""
+LLM 응답 캐시 (내용 주소 기반)
+(model, prompt, options)의 해시를 키로 응답 텍스트를 저장해, 같은 사건/언론사/컨텍스트로
+다시 요청하거나 같은 시나리오를 재실행할 때 LLM을 다시 호출하지 않게 한다.
+
+- 메모리: LRU (capacity건), 선택적 TTL
+- 디스크: sqlite 파일 (재시작 후에도 유지, 메모리에서 밀려난 항목도 여기서 다시 읽음)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from utils.env import env_number
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_PATH = os.path.join(PROJECT_ROOT, "data", "llm_cache.sqlite3")
+DEFAULT_CAPACITY = 512
+
+
+def make_cache_key(model: str, prompt: str, options: Optional[Dict[str, Any]] = None) -> str:
+    """(model, prompt, options) → sha256 hex (options는 키 순서와 무관)"""
+    raw = json.dumps(
+        {"model": model, "prompt": prompt, "options": options or {}},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    메모리 LRU + sqlite 디스크 저장소.
+
+    Args:
+        capacity: 메모리에 보관할 최대 항목 수
+        ttl: 항목 유효 시간(초). None이면 만료 없음
+        path: sqlite 파일 경로. None이면 메모리 전용
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, ttl: Optional[float] = None, path: Optional[str] = None):
+        self.capacity = max(1, int(capacity))
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.path = path
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        if path:
+            self._open_db(path)
+
+    def _open_db(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[1]):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT response, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and not self._expired(row[1]):
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, response: str):
+        created = time.time()
+        with self._lock:
+            self._remember(key, response, created)
+            self.stores += 1
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)",
+                    (key, response, created),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, response: str, created: float):
+        self._memory[key] = (response, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        """메모리/디스크 항목과 카운터 모두 초기화"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+            self.hits = self.disk_hits = self.misses = self.stores = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "capacity": self.capacity,
+                "ttl": self.ttl,
+                "path": self.path,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+
+_CACHE: Optional[LLMCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """
+    프로세스 공유 캐시 (환경 변수로 설정, SAMS_LLM_CACHE=0이면 None).
+    SAMS_LLM_CACHE_PATH(기본 빈 값 = 메모리 전용), SAMS_LLM_CACHE_SIZE, SAMS_LLM_CACHE_TTL(초, 0이면 만료 없음)
+    디스크 캐시는 재시작 후에도 같은 샘플링 결과를 재생하므로(같은 초기 데이터면 같은 첫 사건)
+    재현 실행처럼 그게 목적일 때만 경로를 지정해 켠다 (예: DEFAULT_CACHE_PATH).
+    """
+    global _CACHE
+    if os.environ.get("SAMS_LLM_CACHE", "1") == "0":
+        return None
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                _CACHE = LLMCache(
+                    capacity=env_number("SAMS_LLM_CACHE_SIZE", DEFAULT_CAPACITY),
+                    ttl=env_number("SAMS_LLM_CACHE_TTL", 0.0, float),
+                    path=os.environ.get("SAMS_LLM_CACHE_PATH", "") or None,
+                )
+    return _CACHE
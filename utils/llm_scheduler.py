@@ -0,0 +1,258 @@
+"""
+프로세스 전역 LLM 요청 스케줄러
+여러 시뮬레이션(관리자 시뮬레이션들 + 백그라운드 시뮬레이션)이 같은 로컬 LLM 엔드포인트를
+동시에 두드리지 않도록 동시 실행 수를 제한하고, 대기열을 우선순위/시뮬레이션별로 관리한다.
+
+- 우선순위: event(사건 생성) > news(뉴스 기사) > backfill(과거 사건 일괄 기사 생성)
+- 같은 우선순위 안에서는 시뮬레이션 ID별 라운드로빈 (한 시뮬레이션이 대기열을 독점하지 못함)
+- 대기열이 가득 차거나 max_wait 안에 차례가 오지 않으면 SchedulerRejected → 호출 측은 합성 폴백
+- 요청 컨텍스트에 마감 시각(deadline)이 있으면 그때까지만 기다림 (호출 측이 이미 포기한 요청이 슬롯을 잡지 않게)
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+
+from utils.env import env_number
+
+PRIORITIES = ("event", "news", "backfill")
+DEFAULT_PRIORITY = "news"
+DEFAULT_SIM_ID = "default-sim"
+
+DEFAULT_MAX_CONCURRENCY = 4  # Ollama 기본 OLLAMA_NUM_PARALLEL
+DEFAULT_MAX_QUEUE = 32
+DEFAULT_MAX_WAIT = 60.0
+WAIT_SAMPLE_SIZE = 200  # 대기 시간 통계에 쓰는 최근 표본 수
+
+
+class SchedulerRejected(RuntimeError):
+    """대기열 초과/대기 시간 초과로 LLM 요청이 거절됨 (호출 측은 합성 결과로 폴백)"""
+
+
+_REQUEST_CONTEXT: ContextVar[Tuple[Optional[str], Optional[str]]] = ContextVar(
+    "llm_request_context", default=(None, None)
+)
+_PROMPT_TYPE: ContextVar[Optional[str]] = ContextVar("llm_prompt_type", default=None)
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("llm_deadline", default=None)
+
+
+@contextmanager
+def llm_request_context(
+    priority: Optional[str] = None,
+    sim_id: Optional[str] = None,
+    prompt_type: Optional[str] = None,
+    deadline: Optional[float] = None,
+):
+    """
+    블록 안에서 나가는 LLM 요청에 우선순위/시뮬레이션 ID를 붙인다.
+    바깥 블록에서 이미 지정한 값이 우선한다 (예: backfill 안에서 호출된 뉴스 생성은 backfill로 취급).
+    prompt_type(텔레메트리 태그: event, news, news_batch 등)은 반대로 가장 안쪽 값이 우선한다.
+    deadline(time.monotonic 기준 마감 시각)은 바깥과 안쪽 중 이른 쪽이 적용된다.
+    """
+    outer_priority, outer_sim_id = _REQUEST_CONTEXT.get()
+    token = _REQUEST_CONTEXT.set((outer_priority or priority, outer_sim_id or sim_id))
+    type_token = _PROMPT_TYPE.set(prompt_type or _PROMPT_TYPE.get())
+    outer_deadline = _DEADLINE.get()
+    if deadline is not None and outer_deadline is not None:
+        deadline = min(deadline, outer_deadline)
+    deadline_token = _DEADLINE.set(deadline if deadline is not None else outer_deadline)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(deadline_token)
+        _PROMPT_TYPE.reset(type_token)
+        _REQUEST_CONTEXT.reset(token)
+
+
+def current_request_context() -> Tuple[str, str]:
+    """현재 (priority, sim_id) — 지정되지 않았으면 기본값"""
+    priority, sim_id = _REQUEST_CONTEXT.get()
+    return priority or DEFAULT_PRIORITY, sim_id or DEFAULT_SIM_ID
+
+
+def current_deadline() -> Optional[float]:
+    """현재 요청 마감 시각 (time.monotonic 기준, 없으면 None)"""
+    return _DEADLINE.get()
+
+
+def current_prompt_type() -> str:
+    """현재 프롬프트 유형 — 지정되지 않았으면 우선순위 이름"""
+    return _PROMPT_TYPE.get() or current_request_context()[0]
+
+
+class _Waiter:
+    __slots__ = ("priority", "sim_id", "granted", "enqueued_at")
+
+    def __init__(self, priority: str, sim_id: str):
+        self.priority = priority
+        self.sim_id = sim_id
+        self.granted = False
+        self.enqueued_at = time.monotonic()
+
+
+class LLMScheduler:
+    """
+    동시 실행 수 제한 + 우선순위 대기열 + 시뮬레이션별 공정성.
+
+    Args:
+        max_concurrency: 동시에 LLM에 나가는 요청 수 상한
+        max_queue: 대기 중인 요청 수 상한 (초과 시 즉시 거절)
+        max_wait: 대기열에서 기다리는 최대 시간(초), None이면 무제한
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+    ):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_queue = max(0, int(max_queue))
+        self.max_wait = max_wait if max_wait and max_wait > 0 else None
+        self._cond = threading.Condition()
+        # 우선순위 → {sim_id: deque[_Waiter]} (OrderedDict 순서 = 라운드로빈 순서)
+        self._queues: Dict[str, "OrderedDict[str, deque]"] = {p: OrderedDict() for p in PRIORITIES}
+        self._queued = 0
+        self.running = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._waits: deque = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+    @contextmanager
+    def slot(self, priority: Optional[str] = None, sim_id: Optional[str] = None):
+        """실행 슬롯 하나를 잡고 블록이 끝나면 반납 (priority/sim_id/마감 시각은 현재 요청 컨텍스트)"""
+        ctx_priority, ctx_sim_id = current_request_context()
+        self.acquire(priority or ctx_priority, sim_id or ctx_sim_id, deadline=current_deadline())
+        try:
+            yield
+        finally:
+            self.release()
+
+    def is_idle(self) -> bool:
+        """대기 중인 요청이 없고 실행 슬롯이 남아 있는지 (선생성 작업이 끼어들어도 되는지)"""
+        with self._cond:
+            return self._queued == 0 and self.running < self.max_concurrency
+
+    def acquire(self, priority: str = DEFAULT_PRIORITY, sim_id: str = DEFAULT_SIM_ID, deadline: Optional[float] = None):
+        """
+        슬롯 하나를 잡을 때까지 대기. max_wait 또는 deadline(time.monotonic 기준) 중 먼저 오는 시각이 지나면
+        SchedulerRejected (deadline이 이미 지났으면 슬롯이 비어 있어도 거절).
+        """
+        if priority not in self._queues:
+            priority = DEFAULT_PRIORITY
+        with self._cond:
+            if deadline is not None and deadline <= time.monotonic():
+                self.timed_out += 1
+                raise SchedulerRejected("LLM 요청 마감 시각 초과")
+            if self.running < self.max_concurrency and self._queued == 0:
+                self.running += 1
+                self._admit(0.0)
+                return
+            if self._queued >= self.max_queue:
+                self.rejected += 1
+                raise SchedulerRejected(f"LLM 대기열 초과 ({self._queued}/{self.max_queue})")
+
+            waiter = _Waiter(priority, sim_id)
+            self._queues[priority].setdefault(sim_id, deque()).append(waiter)
+            self._queued += 1
+            wait_until = None if self.max_wait is None else waiter.enqueued_at + self.max_wait
+            if deadline is not None:
+                wait_until = deadline if wait_until is None else min(wait_until, deadline)
+            while not waiter.granted:
+                remaining = None if wait_until is None else wait_until - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._remove(waiter)
+                    self.timed_out += 1
+                    raise SchedulerRejected(f"LLM 대기 시간 초과 ({time.monotonic() - waiter.enqueued_at:.1f}s)")
+                self._cond.wait(remaining)
+            self._admit(time.monotonic() - waiter.enqueued_at)
+
+    def release(self):
+        with self._cond:
+            self.running -= 1
+            self._grant_next()
+
+    def _admit(self, waited: float):
+        self.admitted += 1
+        self._waits.append(waited)
+
+    def _grant_next(self):
+        """빈 슬롯만큼 대기자를 깨움: 높은 우선순위부터, 같은 우선순위 안에서는 시뮬레이션 라운드로빈"""
+        granted = False
+        while self.running < self.max_concurrency and self._queued:
+            for priority in PRIORITIES:
+                queues = self._queues[priority]
+                if queues:
+                    sim_id, waiters = next(iter(queues.items()))
+                    waiter = waiters.popleft()
+                    if waiters:
+                        queues.move_to_end(sim_id)
+                    else:
+                        del queues[sim_id]
+                    break
+            waiter.granted = True
+            self._queued -= 1
+            self.running += 1
+            granted = True
+        if granted:
+            self._cond.notify_all()
+
+    def _remove(self, waiter: _Waiter):
+        queues = self._queues[waiter.priority]
+        waiters = queues.get(waiter.sim_id)
+        if waiters is not None and waiter in waiters:
+            waiters.remove(waiter)
+            self._queued -= 1
+            if not waiters:
+                del queues[waiter.sim_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계 (대기열 깊이, 대기 시간 ms)"""
+        with self._cond:
+            waits = sorted(self._waits)
+            queued_by_priority = {p: sum(len(w) for w in q.values()) for p, q in self._queues.items()}
+            queued_by_sim: Dict[str, int] = {}
+            for queues in self._queues.values():
+                for sim_id, waiters in queues.items():
+                    queued_by_sim[sim_id] = queued_by_sim.get(sim_id, 0) + len(waiters)
+            oldest = min(
+                (w[0].enqueued_at for q in self._queues.values() for w in q.values()),
+                default=None,
+            )
+            return {
+                "running": self.running,
+                "max_concurrency": self.max_concurrency,
+                "queued": self._queued,
+                "max_queue": self.max_queue,
+                "queued_by_priority": queued_by_priority,
+                "queued_by_sim": queued_by_sim,
+                "oldest_wait_ms": round((time.monotonic() - oldest) * 1000, 1) if oldest is not None else 0.0,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "wait_ms_avg": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                "wait_ms_p95": round(waits[int(0.95 * (len(waits) - 1))] * 1000, 1) if waits else 0.0,
+                "wait_ms_max": round(waits[-1] * 1000, 1) if waits else 0.0,
+            }
+
+
+_SCHEDULER: Optional[LLMScheduler] = None
+_SCHEDULER_LOCK = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """프로세스 공유 스케줄러 (SAMS_LLM_MAX_CONCURRENCY, SAMS_LLM_MAX_QUEUE, SAMS_LLM_MAX_WAIT)"""
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        with _SCHEDULER_LOCK:
+            if _SCHEDULER is None:
+                _SCHEDULER = LLMScheduler(
+                    max_concurrency=env_number("SAMS_LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY),
+                    max_queue=env_number("SAMS_LLM_MAX_QUEUE", DEFAULT_MAX_QUEUE),
+                    max_wait=env_number("SAMS_LLM_MAX_WAIT", DEFAULT_MAX_WAIT, float),
+                )
+    return _SCHEDULER
@@ -0,0 +1,184 @@
+"""
+LLM 호출 텔레메트리
+모든 LLM 호출의 지연 시간 히스토그램, 프롬프트/생성 토큰 수와 초당 토큰(Ollama 응답 메타데이터 기준),
+오류 종류, 합성 결과로의 폴백 횟수를 프롬프트 유형(event, news, news_batch, prefill)과
+시뮬레이션 ID별로 집계해 관리자 상태 API에 제공한다.
+"""
+
+import bisect
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from utils.llm_scheduler import current_prompt_type, current_request_context
+
+# 지연 시간 히스토그램 구간 상한 (ms), 마지막 구간은 그 이상 전부
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+# 시뮬레이션별 통계를 보관할 최대 시뮬레이션 수 (초과 시 가장 오래 기록이 없던 것부터 제거)
+MAX_SIMULATIONS = 32
+
+
+class _Series:
+    """프롬프트 유형 또는 시뮬레이션 하나의 누적 통계"""
+
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.errors: Dict[str, int] = {}
+        self.fallbacks: Dict[str, int] = {}
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_ms_sum = 0.0
+        self.latency_ms_max = 0.0
+        self.prompt_tokens = 0
+        self.eval_tokens = 0
+        self.eval_seconds = 0.0
+
+    def add_call(self, latency_ms: float, prompt_tokens: int, eval_tokens: int, eval_seconds: float):
+        self.calls += 1
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self.latency_ms_sum += latency_ms
+        self.latency_ms_max = max(self.latency_ms_max, latency_ms)
+        self.prompt_tokens += prompt_tokens
+        self.eval_tokens += eval_tokens
+        self.eval_seconds += eval_seconds
+
+    def percentile(self, q: float) -> Optional[float]:
+        """히스토그램 기준 백분위 (해당 구간 상한 ms, 최상위 구간이면 관측 최대값)"""
+        if not self.calls:
+            return None
+        target = q * self.calls
+        seen = 0
+        for i, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else round(self.latency_ms_max, 1)
+        return round(self.latency_ms_max, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "errors": dict(self.errors),
+            "fallbacks": dict(self.fallbacks),
+            "latency_ms_avg": round(self.latency_ms_sum / self.calls, 1) if self.calls else 0.0,
+            "latency_ms_p50": self.percentile(0.5),
+            "latency_ms_p95": self.percentile(0.95),
+            "latency_ms_max": round(self.latency_ms_max, 1),
+            "latency_histogram": dict(zip(labels, self.histogram)),
+            "prompt_tokens": self.prompt_tokens,
+            "eval_tokens": self.eval_tokens,
+            "tokens_per_sec": round(self.eval_tokens / self.eval_seconds, 1) if self.eval_seconds > 0 else 0.0,
+        }
+
+
+class LLMTelemetry:
+    """프롬프트 유형별 / 시뮬레이션별 LLM 호출 통계 (스레드 안전, 시뮬레이션별은 최근 max_simulations개만)"""
+
+    def __init__(self, max_simulations: int = MAX_SIMULATIONS):
+        self._lock = threading.Lock()
+        self.max_simulations = max(1, max_simulations)
+        self._by_type: Dict[str, _Series] = {}
+        self._by_sim: "OrderedDict[str, _Series]" = OrderedDict()
+
+    def _series(self, prompt_type: str, sim_id: str):
+        by_type = self._by_type.setdefault(prompt_type, _Series())
+        by_sim = self._by_sim.get(sim_id)
+        if by_sim is None:
+            by_sim = self._by_sim[sim_id] = _Series()
+            while len(self._by_sim) > self.max_simulations:
+                self._by_sim.popitem(last=False)
+        else:
+            self._by_sim.move_to_end(sim_id)
+        return by_type, by_sim
+
+    def record_call(self, latency_s: float, meta: Optional[Dict[str, Any]] = None,
+                    streamed_tokens: int = 0, prompt_type: Optional[str] = None, sim_id: Optional[str] = None):
+        """
+        성공한 호출 1건 기록.
+        meta: Ollama 응답의 prompt_eval_count / eval_count / eval_duration(ns).
+              스트림을 조기 종료해 메타데이터가 없으면 streamed_tokens(받은 조각 수)와 전체 시간으로 추정
+        """
+        prompt_type, sim_id = self._tags(prompt_type, sim_id)
+        meta = meta or {}
+        eval_tokens = int(meta.get("eval_count") or streamed_tokens)
+        eval_seconds = (meta.get("eval_duration") or 0) / 1e9 or (latency_s if eval_tokens else 0.0)
+        prompt_tokens = int(meta.get("prompt_eval_count") or 0)
+        with self._lock:
+            for series in self._series(prompt_type, sim_id):
+                series.add_call(latency_s * 1000.0, prompt_tokens, eval_tokens, eval_seconds)
+
+    def record_cache_hit(self, prompt_type: Optional[str] = None, sim_id: Optional[str] = None):
+        prompt_type, sim_id = self._tags(prompt_type, sim_id)
+        with self._lock:
+            for series in self._series(prompt_type, sim_id):
+                series.cache_hits += 1
+
+    def record_error(self, error: BaseException, prompt_type: Optional[str] = None, sim_id: Optional[str] = None):
+        prompt_type, sim_id = self._tags(prompt_type, sim_id)
+        name = type(error).__name__
+        with self._lock:
+            for series in self._series(prompt_type, sim_id):
+                series.errors[name] = series.errors.get(name, 0) + 1
+
+    def record_fallback(self, reason: str, count: int = 1, prompt_type: Optional[str] = None,
+                        sim_id: Optional[str] = None):
+        """LLM 결과 대신 합성 결과를 쓴 횟수 (reason: error, latency_budget, invalid, missing 등)"""
+        if count <= 0:
+            return
+        prompt_type, sim_id = self._tags(prompt_type, sim_id)
+        with self._lock:
+            for series in self._series(prompt_type, sim_id):
+                series.fallbacks[reason] = series.fallbacks.get(reason, 0) + count
+
+    @staticmethod
+    def _tags(prompt_type: Optional[str], sim_id: Optional[str]):
+        """명시하지 않은 태그는 현재 LLM 요청 컨텍스트(llm_request_context)에서 가져옴"""
+        if sim_id is None:
+            sim_id = current_request_context()[1]
+        return prompt_type or current_prompt_type(), sim_id
+
+    def snapshot(self, sim_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        {"by_prompt_type": {유형: 통계}, "simulation": 통계(sim_id 지정 시), "totals": 통계}
+        """
+        with self._lock:
+            totals = _Series()
+            for series in self._by_type.values():
+                totals.calls += series.calls
+                totals.cache_hits += series.cache_hits
+                totals.histogram = [a + b for a, b in zip(totals.histogram, series.histogram)]
+                totals.latency_ms_sum += series.latency_ms_sum
+                totals.latency_ms_max = max(totals.latency_ms_max, series.latency_ms_max)
+                totals.prompt_tokens += series.prompt_tokens
+                totals.eval_tokens += series.eval_tokens
+                totals.eval_seconds += series.eval_seconds
+                for name, count in series.errors.items():
+                    totals.errors[name] = totals.errors.get(name, 0) + count
+                for reason, count in series.fallbacks.items():
+                    totals.fallbacks[reason] = totals.fallbacks.get(reason, 0) + count
+            result = {
+                "by_prompt_type": {t: s.to_dict() for t, s in self._by_type.items()},
+                "totals": totals.to_dict(),
+            }
+            if sim_id is not None:
+                result["simulation"] = (self._by_sim.get(sim_id) or _Series()).to_dict()
+            return result
+
+    def drop_simulation(self, sim_id: str):
+        """종료된 시뮬레이션의 통계 제거 (프롬프트 유형별 누적치는 유지)"""
+        with self._lock:
+            self._by_sim.pop(sim_id, None)
+
+    def reset(self):
+        with self._lock:
+            self._by_type.clear()
+            self._by_sim.clear()
+
+
+_TELEMETRY = LLMTelemetry()
+
+
+def get_llm_telemetry() -> LLMTelemetry:
+    """프로세스 공유 텔레메트리"""
+    return _TELEMETRY
@@ -1,10 +1,33 @@
 from typing import Any, Dict, Optional, List
 from datetime import datetime
 from utils.firebase import get_firestore
+from utils.write_behind import auto_id, get_write_queue
 
 # 경로 구조(권장):
 # simulations/{sim_id}/snapshots/{snapshot_id}
 # simulations/{sim_id}/events/{event_id}
+#
+# 저장 함수는 doc_ref.set()을 기다리지 않고 쓰기 지연 큐(utils.write_behind)에 넣는다.
+# 큐가 WriteBatch로 모아 commit하며, 조회 함수는 아직 commit되지 않은 문서도 함께 돌려준다.
+
+
+def _require_firestore():
+    """Firestore가 없으면(개발 모드) 큐에 쌓지 않고 바로 실패시킨다"""
+    db = get_firestore()
+    if db is None:
+        raise RuntimeError("Firestore 클라이언트가 초기화되지 않았습니다")
+    return db
+
+
+def _with_pending(collection: tuple, docs: List[Dict[str, Any]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """조회 결과에 미commit 문서를 합쳐 created_at 내림차순으로 (commit 직후 양쪽에 있는 문서는 한 번만)"""
+    merged = list(docs)
+    for payload in get_write_queue().pending_in(collection):
+        if payload not in merged:
+            merged.append(payload)
+    merged.sort(key=lambda d: d.get("created_at", ""), reverse=True)
+    return merged[:limit] if limit else merged
+
 
 def save_market_snapshot(
     sim_id: str,
@@ -17,14 +40,10 @@ def save_market_snapshot(
     """
     '이벤트가 발생한 시점'의 시장 상태(스냅샷)만 저장한다.
     이벤트 내용은 저장하지 않는다.
+    대기 쓰기가 많이 밀리면 같은 시뮬레이션의 아직 보내지 않은 스냅샷은 최신 것으로 대체된다.
     """
-    db = get_firestore()
-    doc_ref = (
-        db.collection("simulations")
-          .document(sim_id)
-          .collection("snapshots")
-          .document()  # 자동 ID
-    )
+    _require_firestore()
+    snapshot_id = auto_id()  # 자동 ID (commit 전에 돌려주기 위해 미리 생성)
     payload = {
         "stocks": stocks,                   # 현재 종목별 가격/체결 등 상태
         "market_params": market_params,     # public/government/company 등 엔진 파라미터
@@ -32,8 +51,12 @@ def save_market_snapshot(
         "created_at": datetime.utcnow().isoformat(),
         "meta": meta or {},
     }
-    doc_ref.set(payload)
-    return doc_ref.id
+    get_write_queue().set(
+        ("simulations", sim_id, "snapshots", snapshot_id),
+        payload,
+        coalesce_key=("snapshot", sim_id),
+    )
+    return snapshot_id
 
 
 def save_event_log(
@@ -50,13 +73,7 @@ def save_event_log(
     발생한 '사건(Event)'을 별도 컬렉션에 저장한다.
     나중에 프롬프트 컨텍스트로 재사용하기 위해 본문/카테고리/감성/영향도 등 원문 필드를 보관.
     """
-    db = get_firestore()
-    doc_ref = (
-        db.collection("simulations")
-          .document(sim_id)
-          .collection("events")
-          .document(event_id)  # 이벤트 ID를 문서 ID로 재사용(중복 방지)
-    )
+    _require_firestore()
     payload = {
         "event": event_payload,             # Event 객체를 dict로 변환한 내용
         "affected_stocks": affected_stocks,
@@ -65,14 +82,19 @@ def save_event_log(
         "created_at": datetime.utcnow().isoformat(),
         "meta": meta or {},
     }
-    doc_ref.set(payload)
-    return doc_ref.id
+    # 이벤트 ID를 문서 ID로 재사용(중복 방지)
+    # 기사 생성이 get_event_log로 다시 읽으므로 큐가 가득 차도 버리지 않는다
+    get_write_queue().set(("simulations", sim_id, "events", event_id), payload, required=True)
+    return event_id
 
 # 이벤트 로그 조회 함수들
 def get_event_log(sim_id: str, event_id: str) -> Optional[Dict[str, Any]]:
     """
-    특정 이벤트 로그를 조회한다.
+    특정 이벤트 로그를 조회한다 (아직 commit되지 않은 로그 포함).
     """
+    pending = get_write_queue().pending(("simulations", sim_id, "events", event_id))
+    if pending is not None:
+        return pending
     try:
         db = get_firestore()
         doc = (
@@ -111,7 +133,11 @@ def list_event_logs(
             col = col.start_after({"created_at": start_after_created_at})
         
         col = col.limit(limit)
-        return [doc.to_dict() for doc in col.stream()]
+        docs = [doc.to_dict() for doc in col.stream()]
+        # 첫 페이지에만 미commit 로그를 합침
+        if start_after_created_at:
+            return docs
+        return _with_pending(("simulations", sim_id, "events"), docs, limit)
     except Exception as e:
         print(f"이벤트 로그 목록 조회 중 오류: {e}")
         return []
@@ -130,7 +156,7 @@ def get_recent_events_for_context(sim_id: str, limit: int = 5) -> List[Dict[str,
               .limit(limit)
               .stream()
         )
-        return [doc.to_dict() for doc in docs]
+        return _with_pending(("simulations", sim_id, "events"), [doc.to_dict() for doc in docs], limit)
     except Exception as e:
         print(f"최근 이벤트 조회 중 오류: {e}")
         return []
@@ -148,15 +174,7 @@ def save_news_article(
     생성된 뉴스 기사를 저장한다.
     """
     try:
-        db = get_firestore()
-        doc_ref = (
-            db.collection("simulations")
-              .document(sim_id)
-              .collection("events")
-              .document(event_id)
-              .collection("news")
-              .document(news_id)
-        )
+        _require_firestore()
         payload = {
             "news_id": news_id,
             "media_name": media_name,
@@ -164,8 +182,9 @@ def save_news_article(
             "created_at": datetime.utcnow().isoformat(),
             "meta": meta or {},
         }
-        doc_ref.set(payload)
-        return doc_ref.id
+        # 기사 저장은 언론사별 작업 스레드에서 호출되므로 큐가 가득 차면 잠시 기다린다
+        get_write_queue().set(("simulations", sim_id, "events", event_id, "news", news_id), payload, block=True)
+        return news_id
     except Exception as e:
         print(f"뉴스 기사 저장 중 오류: {e}")
         return ""
@@ -185,7 +204,7 @@ def get_news_articles_for_event(sim_id: str, event_id: str) -> List[Dict[str, An
               .order_by("created_at", direction="DESCENDING")
               .stream()
         )
-        return [doc.to_dict() for doc in docs]
+        return _with_pending(("simulations", sim_id, "events", event_id, "news"), [doc.to_dict() for doc in docs])
     except Exception as e:
         print(f"뉴스 기사 조회 중 오류: {e}")
         return []
@@ -211,7 +230,7 @@ def get_recent_market_snapshots(sim_id: str, limit: int = 10) -> List[Dict[str,
               .limit(limit)
               .stream()
         )
-        return [doc.to_dict() for doc in docs]
+        return _with_pending(("simulations", sim_id, "snapshots"), [doc.to_dict() for doc in docs], limit)
     except Exception as e:
         print(f"시장 스냅샷 조회 중 오류: {e}")
         return []
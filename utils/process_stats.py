@@ -0,0 +1,59 @@
+"""
+현재 프로세스 CPU / 메모리 사용량 (관리자 상태 API용, 외부 패키지 없이 표준 라이브러리만 사용)
+- CPU: 직전 조회 이후 프로세스 CPU 시간 증가량 / 경과 시간 (첫 조회는 프로세스 시작 이후 평균)
+- 메모리: 현재 RSS (/proc/self/statm), 없으면 최대 RSS (resource.getrusage)
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_LOCK = threading.Lock()
+_START_WALL = time.monotonic()
+_last_sample = (_START_WALL, 0.0)
+
+
+def _cpu_seconds() -> float:
+    times = os.times()
+    return times.user + times.system
+
+
+def cpu_percent() -> float:
+    """직전 호출 이후 프로세스 CPU 사용률 (%, 멀티코어면 100을 넘을 수 있음)"""
+    global _last_sample
+    now, cpu = time.monotonic(), _cpu_seconds()
+    with _LOCK:
+        last_wall, last_cpu = _last_sample
+        _last_sample = (now, cpu)
+    elapsed = now - last_wall
+    return (cpu - last_cpu) / elapsed * 100.0 if elapsed > 0 else 0.0
+
+
+def memory_bytes() -> Optional[int]:
+    """프로세스 메모리(RSS) 바이트 수, 알 수 없으면 None"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def get_process_usage() -> dict:
+    """{'cpu_usage': '12.3%', 'memory_usage': '0.21GB'} (상태 API 표시 형식)"""
+    memory = memory_bytes()
+    return {
+        "cpu_usage": f"{cpu_percent():.1f}%",
+        "memory_usage": f"{memory / 1024 ** 3:.2f}GB" if memory is not None else "N/A",
+    }
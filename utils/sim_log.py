@@ -0,0 +1,190 @@
+"""
+시뮬레이션별 구조화 로그 링 버퍼
+엔진의 틱 경로에서 stdout 대신 고정 크기 메모리 버퍼에 기록하고,
+관리자 로그 API가 레벨/커서 조건으로 읽어 간다.
+"""
+
+import os
+import threading
+from collections import OrderedDict, deque
+from itertools import islice
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+DEFAULT_CAPACITY = 2000
+DEFAULT_DEBUG_SAMPLE_EVERY = 10  # 종목별 DEBUG 로그는 종목마다 N건 중 1건만 보관
+MAX_BUFFERS = 32  # 보관할 시뮬레이션별 버퍼 수 (초과 시 가장 오래 쓰이지 않은 버퍼부터 제거)
+
+
+def _level_no(level: str) -> int:
+    return LEVELS.get(str(level).upper(), LEVELS["INFO"])
+
+
+class LogRingBuffer:
+    """
+    고정 용량 로그 버퍼 (가득 차면 가장 오래된 항목부터 밀려남).
+
+    - 각 항목은 단조 증가하는 seq를 가지며, 조회 시 cursor(마지막으로 본 seq) 이후만 가져올 수 있다
+    - ticker 필드가 있는 DEBUG 로그는 종목별 카운터로 샘플링해 틱마다 쌓이는 양을 줄인다
+    - echo=True(또는 SAMS_LOG_STDOUT=1)이면 stdout에도 출력 (로컬 디버깅용)
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        debug_sample_every: int = DEFAULT_DEBUG_SAMPLE_EVERY,
+        min_level: str = "DEBUG",
+        echo: Optional[bool] = None,
+    ):
+        self.capacity = capacity
+        self.debug_sample_every = max(1, int(debug_sample_every))
+        self.min_level = _level_no(min_level)
+        self.echo = echo if echo is not None else os.environ.get("SAMS_LOG_STDOUT") == "1"
+        self._entries: deque = deque(maxlen=capacity)
+        self._seq = 0
+        self._sample_counters: Dict[str, int] = {}
+        self.sampled_out = 0
+        self._lock = threading.Lock()
+
+    def log(self, level: str, message: str, **fields: Any) -> Optional[int]:
+        """로그 1건 기록, 저장된 항목의 seq 반환 (레벨 미달/샘플링으로 버려지면 None)"""
+        level = str(level).upper()
+        level_no = _level_no(level)
+        if level_no < self.min_level:
+            return None
+
+        with self._lock:
+            ticker = fields.get("ticker")
+            if level_no == LEVELS["DEBUG"] and ticker is not None and self.debug_sample_every > 1:
+                count = self._sample_counters.get(ticker, 0)
+                self._sample_counters[ticker] = count + 1
+                if count % self.debug_sample_every:
+                    self.sampled_out += 1
+                    return None
+
+            self._seq += 1
+            entry = {
+                "seq": self._seq,
+                "timestamp": datetime.now().isoformat(),
+                "level": level,
+                "message": message,
+            }
+            entry.update(fields)
+            self._entries.append(entry)
+
+        if self.echo:
+            print(f"[{level}] {message}")
+        return entry["seq"]
+
+    def debug(self, message: str, **fields: Any) -> Optional[int]:
+        return self.log("DEBUG", message, **fields)
+
+    def info(self, message: str, **fields: Any) -> Optional[int]:
+        return self.log("INFO", message, **fields)
+
+    def warning(self, message: str, **fields: Any) -> Optional[int]:
+        return self.log("WARNING", message, **fields)
+
+    def error(self, message: str, **fields: Any) -> Optional[int]:
+        return self.log("ERROR", message, **fields)
+
+    def query(
+        self,
+        min_level: str = "DEBUG",
+        cursor: Optional[int] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        조건에 맞는 로그를 최대 limit건, 최신순으로 반환.
+
+        Args:
+            min_level: 이 레벨 이상만 반환
+            cursor: 지정하면 seq가 cursor보다 큰 항목을 cursor 쪽(오래된 것)부터 limit건 반환
+        Returns:
+            (logs, next_cursor) — next_cursor는 다음 폴링에 넘길 값.
+            cursor 이후 항목이 limit건보다 많으면 이번에 반환한 마지막 seq라서,
+            다음 폴링이 나머지를 이어서 가져간다 (없으면 현재 마지막 seq)
+        """
+        level_no = _level_no(min_level)
+        with self._lock:
+            next_cursor = self._seq
+            result = []
+            if cursor is None:
+                for entry in reversed(self._entries):
+                    if _level_no(entry["level"]) < level_no:
+                        continue
+                    result.append(dict(entry))
+                    if len(result) >= limit:
+                        break
+                return result, next_cursor
+
+            # seq는 연속이므로 cursor 다음 항목의 위치를 바로 계산
+            start = max(0, cursor - self._entries[0]["seq"] + 1) if self._entries else 0
+            for entry in islice(self._entries, start, None):
+                if _level_no(entry["level"]) < level_no:
+                    continue
+                result.append(dict(entry))
+                if len(result) >= limit:
+                    next_cursor = entry["seq"]
+                    break
+        result.reverse()
+        return result, next_cursor
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "buffered": len(self._entries),
+                "capacity": self.capacity,
+                "total_logged": self._seq,
+                "evicted": max(0, self._seq - len(self._entries)),
+                "sampled_out": self.sampled_out,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sample_counters.clear()
+            self.sampled_out = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_BUFFERS: "OrderedDict[str, LogRingBuffer]" = OrderedDict()
+_BUFFERS_LOCK = threading.Lock()
+
+
+def get_log_buffer(sim_id: str = "default-sim") -> LogRingBuffer:
+    """
+    시뮬레이션 ID별 로그 버퍼 (없으면 생성).
+    실행마다 ID가 달라지는 앙상블 등으로 무한히 늘지 않도록 최근 MAX_BUFFERS개만 유지한다.
+    """
+    with _BUFFERS_LOCK:
+        buffer = _BUFFERS.get(sim_id)
+        if buffer is None:
+            buffer = _BUFFERS[sim_id] = LogRingBuffer()
+            while len(_BUFFERS) > MAX_BUFFERS:
+                _BUFFERS.popitem(last=False)
+        else:
+            _BUFFERS.move_to_end(sim_id)
+    return buffer
+
+
+def find_log_buffer(sim_id: str) -> Optional[LogRingBuffer]:
+    """조회용: 버퍼가 있으면 반환, 없으면 만들지 않고 None"""
+    with _BUFFERS_LOCK:
+        return _BUFFERS.get(sim_id)
+
+
+def drop_log_buffer(sim_id: str):
+    """시뮬레이션 정리 시 버퍼 제거"""
+    with _BUFFERS_LOCK:
+        _BUFFERS.pop(sim_id, None)
+
+
+def clear_log_buffers():
+    """전체 버퍼 제거 (테스트 용도)"""
+    with _BUFFERS_LOCK:
+        _BUFFERS.clear()
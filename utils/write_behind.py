@@ -0,0 +1,346 @@
+"""
+Firestore 쓰기 지연(write-behind) 큐
+save_event_log / save_market_snapshot / save_news_article가 매번 doc_ref.set()으로 네트워크를 기다리지 않도록,
+문서 쓰기를 메모리 큐에 넣고 백그라운드 스레드가 WriteBatch 한 번의 commit으로 묶어 보낸다.
+
+- 크기(batch_size건) 또는 시간(flush_interval초) 중 먼저 도달한 조건으로 commit
+- 같은 문서 경로에 대한 대기 중 쓰기는 마지막 것만 남김 (set 의미와 동일)
+- 대기 건수가 max_pending에 도달하면 coalesce_key가 같은 쓰기(예: 시뮬레이션별 시장 스냅샷)는 최신 것으로 대체,
+  합칠 수 없는 쓰기는 대기 중인 스냅샷(coalesce_key가 있는 쓰기)을 먼저 버려 자리를 만든다.
+  그래도 자리가 없으면 required=True 쓰기(예: 기사 생성이 다시 읽는 사건 로그)는 한도를 넘겨 넣고,
+  block=True 쓰기는 put_timeout초까지 기다리며, 나머지는 바로 버리고 건수만 센다
+  (호출 측 스레드는 기본적으로 네트워크를 기다리지 않음)
+- 아직 commit되지 않은 문서는 pending()/pending_in()으로 읽을 수 있음 (조회 함수의 read-through용)
+- flush()는 그 시점까지 들어온 쓰기가 모두 commit(또는 실패 처리)될 때까지 대기, 프로세스 종료 시 자동 호출
+"""
+
+import atexit
+import random
+import string
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Firestore 한 번의 batch commit 최대 쓰기 수는 500
+MAX_BATCH_WRITES = 500
+_AUTO_ID_CHARS = string.ascii_letters + string.digits
+
+DocPath = Tuple[str, ...]
+
+
+def auto_id() -> str:
+    """Firestore 자동 문서 ID와 같은 형식(영숫자 20자) — commit 전에 ID를 돌려주기 위해 클라이언트에서 생성"""
+    return "".join(random.SystemRandom().choice(_AUTO_ID_CHARS) for _ in range(20))
+
+
+def document_ref(db: Any, path: DocPath):
+    """('simulations', sim_id, 'events', event_id, ...) → DocumentReference"""
+    if len(path) < 2 or len(path) % 2:
+        raise ValueError(f"문서 경로는 (컬렉션, 문서) 쌍이어야 합니다: {path}")
+    ref = db
+    for i in range(0, len(path), 2):
+        ref = ref.collection(path[i]).document(path[i + 1])
+    return ref
+
+
+@dataclass
+class _Write:
+    path: DocPath
+    payload: Dict[str, Any]
+    coalesce_key: Optional[Hashable] = None
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class WriteBehindQueue:
+    """
+    문서 쓰기를 모아 WriteBatch로 commit하는 데몬 스레드 (스레드 안전).
+
+    Args:
+        db_provider: Firestore 클라이언트를 돌려주는 함수 (commit 시점에 호출)
+        batch_size: 한 번에 commit할 최대 쓰기 수 (최대 500)
+        flush_interval: 가장 오래된 대기 쓰기가 이만큼(초) 기다리면 batch_size 미만이어도 commit
+        max_pending: 메모리에 둘 최대 대기 쓰기 수 (commit 중인 건 제외)
+        put_timeout: 큐가 가득 찼을 때 block=True 쓰기가 자리를 기다리는 최대 시간(초)
+        max_attempts: commit 실패 시 같은 쓰기를 시도할 최대 횟수
+        retry_delay: commit 실패 후 다음 시도까지 대기(초)
+        on_error: commit 실패/쓰기 폐기 시 호출 (메시지 문자열)
+    """
+
+    def __init__(
+        self,
+        db_provider: Callable[[], Any],
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+        max_pending: int = 2000,
+        put_timeout: float = 1.0,
+        max_attempts: int = 3,
+        retry_delay: float = 0.5,
+        on_error: Optional[Callable[[str], None]] = None,
+        name: str = "firestore-write-behind",
+    ):
+        self._db_provider = db_provider
+        self.batch_size = max(1, min(int(batch_size), MAX_BATCH_WRITES))
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, int(max_pending))
+        self.put_timeout = put_timeout
+        self.max_attempts = max(1, int(max_attempts))
+        self.retry_delay = retry_delay
+        self._on_error = on_error or (lambda message: print(f"[write-behind] {message}"))
+        self._name = name
+        self._pending: "OrderedDict[DocPath, _Write]" = OrderedDict()
+        self._coalesce: Dict[Hashable, DocPath] = {}
+        self._inflight: Dict[DocPath, _Write] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._flush_waiters = 0
+        self.enqueued = 0
+        self.committed = 0
+        self.batches = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.overflowed = 0
+        self.failed = 0
+
+    # -----------------------------
+    # 생산자 쪽 (저장 함수)
+    # -----------------------------
+    def set(
+        self,
+        path: DocPath,
+        payload: Dict[str, Any],
+        coalesce_key: Optional[Hashable] = None,
+        block: bool = False,
+        required: bool = False,
+    ) -> bool:
+        """
+        문서 쓰기를 큐에 넣음 (commit을 기다리지 않음). 큐가 가득 차서 버려지면 False.
+        coalesce_key가 있으면 큐가 가득 찼을 때 같은 키의 대기 쓰기를 이 쓰기로 대체한다.
+        가득 찼을 때 합칠 수 없는 쓰기는 대기 중인 스냅샷을 먼저 버리고 들어간다.
+        block=True면 그래도 자리가 없을 때 put_timeout초까지 기다린다 (틱 스레드에서는 쓰지 말 것).
+        required=True면 버리지 않고 max_pending을 넘겨서라도 넣는다 (overflowed로 집계).
+        """
+        path = tuple(path)
+        write = _Write(path, payload, coalesce_key)
+        with self._cond:
+            self._ensure_thread()
+            self.enqueued += 1
+            if path in self._pending:
+                self._replace(path, write)
+                return True
+            if len(self._pending) >= self.max_pending:
+                if coalesce_key is not None and coalesce_key in self._coalesce:
+                    self._replace(self._coalesce[coalesce_key], write)
+                    self.coalesced += 1
+                    return True
+                self._cond.notify_all()
+                if coalesce_key is None:
+                    self._evict_coalescible()
+                if required and len(self._pending) >= self.max_pending:
+                    self.overflowed += 1
+                else:
+                    deadline = time.monotonic() + (self.put_timeout if block else 0)
+                    while len(self._pending) >= self.max_pending and not self._stopping:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._drop(path)
+                            return False
+                        self._cond.wait(remaining)
+            self._pending[path] = write
+            if coalesce_key is not None:
+                self._coalesce[coalesce_key] = path
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+            return True
+
+    def _drop(self, path: DocPath):
+        self.dropped += 1
+        self._on_error(f"대기 쓰기가 {self.max_pending}건을 넘어 버림: {'/'.join(path)}")
+
+    def _evict_coalescible(self) -> bool:
+        """가장 오래된 대기 스냅샷(coalesce_key가 있는 쓰기) 하나를 버려 자리를 만듦 (없으면 False)"""
+        for path, write in self._pending.items():
+            if write.coalesce_key is not None:
+                del self._pending[path]
+                if self._coalesce.get(write.coalesce_key) == path:
+                    del self._coalesce[write.coalesce_key]
+                self._drop(path)
+                return True
+        return False
+
+    def _replace(self, old_path: DocPath, write: _Write):
+        """대기 중인 쓰기를 새 쓰기로 대체 (처음 들어온 시각을 물려받아 commit이 늦춰지지 않게 함)"""
+        old = self._pending.pop(old_path)
+        if old.coalesce_key is not None and self._coalesce.get(old.coalesce_key) == old_path:
+            del self._coalesce[old.coalesce_key]
+        write.enqueued_at = old.enqueued_at
+        self._pending[write.path] = write
+        if write.coalesce_key is not None:
+            self._coalesce[write.coalesce_key] = write.path
+
+    # -----------------------------
+    # read-through
+    # -----------------------------
+    def pending(self, path: DocPath) -> Optional[Dict[str, Any]]:
+        """아직 commit되지 않은 문서 내용 (없으면 None)"""
+        path = tuple(path)
+        with self._cond:
+            write = self._pending.get(path) or self._inflight.get(path)
+            return write.payload if write is not None else None
+
+    def pending_in(self, collection: DocPath) -> List[Dict[str, Any]]:
+        """컬렉션 경로 바로 아래의 미commit 문서들 (들어온 순서)"""
+        collection = tuple(collection)
+        depth = len(collection) + 1
+        with self._cond:
+            writes = list(self._inflight.values()) + list(self._pending.values())
+        return [w.payload for w in writes if len(w.path) == depth and w.path[:-1] == collection]
+
+    # -----------------------------
+    # flush / 종료
+    # -----------------------------
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """지금까지 들어온 쓰기가 모두 처리될 때까지 대기 (timeout 안에 끝나면 True)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._thread is None and (self._pending or self._inflight):
+                self._ensure_thread()
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                while self._pending or self._inflight:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                return True
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self, timeout: Optional[float] = 5.0) -> bool:
+        """남은 쓰기를 flush한 뒤 스레드 종료 (atexit에서 호출)"""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._cond:
+            self._thread = None
+            self._stopping = False
+        return flushed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "pending": len(self._pending),
+                "inflight": len(self._inflight),
+                "enqueued": self.enqueued,
+                "committed": self.committed,
+                "batches": self.batches,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "overflowed": self.overflowed,
+                "failed": self.failed,
+            }
+
+    # -----------------------------
+    # flusher 스레드
+    # -----------------------------
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def _next_batch(self) -> Optional[List[_Write]]:
+        """commit할 묶음이 준비될 때까지 대기 (종료 요청 + 빈 큐면 None)"""
+        with self._cond:
+            while True:
+                if not self._pending:
+                    if self._stopping:
+                        return None
+                    self._cond.wait()
+                    continue
+                oldest = next(iter(self._pending.values())).enqueued_at
+                wait = oldest + self.flush_interval - time.monotonic()
+                if len(self._pending) >= self.batch_size or self._flush_waiters or self._stopping or wait <= 0:
+                    break
+                self._cond.wait(wait)
+            batch = []
+            while self._pending and len(batch) < self.batch_size:
+                path, write = self._pending.popitem(last=False)
+                if write.coalesce_key is not None and self._coalesce.get(write.coalesce_key) == path:
+                    del self._coalesce[write.coalesce_key]
+                self._inflight[path] = write
+                batch.append(write)
+            # 큐에 자리가 났으니 기다리던 생산자를 깨움
+            self._cond.notify_all()
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            error = None
+            try:
+                db = self._db_provider()
+                if db is None:
+                    raise RuntimeError("Firestore 클라이언트가 없습니다")
+                write_batch = db.batch()
+                for write in batch:
+                    write_batch.set(document_ref(db, write.path), write.payload)
+                write_batch.commit()
+            except Exception as e:
+                error = e
+            self._finish(batch, error)
+            if error is not None and self.retry_delay > 0:
+                time.sleep(self.retry_delay)
+
+    def _finish(self, batch: List[_Write], error: Optional[Exception]):
+        with self._cond:
+            for write in batch:
+                self._inflight.pop(write.path, None)
+            if error is None:
+                self.committed += len(batch)
+                self.batches += 1
+            else:
+                retry = []
+                for write in batch:
+                    write.attempts += 1
+                    # 같은 문서에 더 새로운 쓰기가 들어와 있으면 실패한 옛 쓰기는 다시 보내지 않음
+                    if write.path in self._pending:
+                        continue
+                    if write.attempts >= self.max_attempts:
+                        self.failed += 1
+                        continue
+                    retry.append(write)
+                self._on_error(
+                    f"batch commit 실패 ({len(batch)}건, 재시도 {len(retry)}건): {error}"
+                )
+                # 재시도 쓰기는 큐 맨 앞으로 (max_pending을 잠시 넘을 수 있음)
+                for write in reversed(retry):
+                    self._pending[write.path] = write
+                    self._pending.move_to_end(write.path, last=False)
+                    if write.coalesce_key is not None and write.coalesce_key not in self._coalesce:
+                        self._coalesce[write.coalesce_key] = write.path
+            self._cond.notify_all()
+
+
+_queue: Optional[WriteBehindQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_write_queue() -> WriteBehindQueue:
+    """프로세스 공유 Firestore 쓰기 큐 (첫 호출 시 생성, 프로세스 종료 시 남은 쓰기 flush)"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            from utils.firebase import get_firestore
+            _queue = WriteBehindQueue(get_firestore)
+            atexit.register(_queue.close)
+        return _queue